@@ -0,0 +1,183 @@
+"""
+Fixed, representative inputs for the benchmarked hot paths.
+
+Each case is a setup function returning the zero-argument callable that is
+timed; setup (data loading, input construction) is not timed.
+"""
+
+from typing import Callable
+
+import numpy as np
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(setup: Callable[[], Callable[[], object]]):
+    BENCHMARKS[setup.__name__] = setup
+    return setup
+
+
+def _fdr_params():
+    from wyvern.analysis.parameters import PayloadSizingParameters
+    from wyvern.performance.models import QuadraticLDModel
+
+    return PayloadSizingParameters(
+        as_mass_ratio=0,
+        total_fixed_mass=1213.15,
+        aero_model=QuadraticLDModel(
+            c_d0=0.02959, e_inviscid=0.9131, K=0.45, aspect_ratio=5.106458
+        ),
+        cruise_speed=10,
+        turn_speed=10,
+        planform_area=0.56595,
+        propulsive_efficiency=0.521,
+        configuration_bonus=1.3,
+        short_takeoff=True,
+        stability_distance=100,
+    )
+
+
+def _fdr_structure():
+    from wyvern.analysis.structures.abstractions import (
+        RibControlPoints,
+        SparControlPoints,
+        Structure,
+    )
+    from wyvern.utils.geom_utils import mirror_verts
+
+    rib = RibControlPoints(
+        y=np.array([0, 92.5, 185, 850]),
+        c=np.array([780, 600.0, 400, 120]),
+        xle=np.array([0, 120.0, 215, 598]),
+        twist=np.array([0, 0, 0, 5.0]),
+        sections=None,
+    )
+    spar_1 = SparControlPoints(y=np.array([0.0, 850.0]), x=np.array([195.0, 628.0]))
+    spar_2 = SparControlPoints(y=np.array([185.0, 850.0]), x=np.array([515.0, 688.0]))
+    rib_t_inches = np.array([1 / 4] + [1 / 16] * 7)
+    y = mirror_verts(np.array([0, 92.5, 185, 318, 451, 584, 717, 850])) * 1e-3
+
+    return Structure.from_structure(y, rib, rib_t_inches, spar_1, spar_2)
+
+
+def _elliptical_lift(half_span: float = 0.85, total: float = 1.63 * 9.80665):
+    # lift per unit span (N/m) integrating to `total` over the span
+    l_0 = 4 * total / (np.pi * 2 * half_span)
+
+    def lift(y):
+        return l_0 * np.sqrt(np.clip(1 - (np.asarray(y) / half_span) ** 2, 0, None))
+
+    return lift
+
+
+@benchmark
+def sweep_payload_configs():
+    from wyvern.analysis.payload_sweep import sweep_payload_configs
+
+    params = _fdr_params()
+    configs = [(8, i, 4) for i in range(7)]
+    return lambda: sweep_payload_configs(configs, params)
+
+
+@benchmark
+def cd0_buildup():
+    from wyvern.data.airfoils import BOEING_VERTOL, NACA0018
+    from wyvern.sizing.parasitic_drag import cd0_buildup
+    from wyvern.utils.geom_utils import mirror_verts
+
+    y = mirror_verts(np.array([0, 92.5, 185, 850])) * 1e-3
+    c = mirror_verts(np.array([780, 600, 400, 120]), negate=False) * 1e-3
+    sections = [BOEING_VERTOL] * 2 + [NACA0018] * 3 + [BOEING_VERTOL] * 2
+    sweeps = np.array([27, 27, 0, 0, 0, 27, 27])
+    return lambda: cd0_buildup(y, c, sections, sweeps, 10, 0.56595)
+
+
+def _fdr_takeoff():
+    # FDR takeoff analysis inputs
+    from wyvern.data.propellers import PROP_9X6
+    from wyvern.performance.models import VariableCD0Model
+    from wyvern.performance.takeoff import prop_thrust
+
+    return {
+        "aero_model": VariableCD0Model(
+            c_d0_a=0.0396,
+            c_d0_b=-0.1291,
+            e_inviscid=0.9131,
+            K=0.45,
+            aspect_ratio=5.106458,
+        ),
+        "mass": 1.63,
+        "mu": 0.1,
+        "CLgr": -0.07964,
+        "thrust_model": prop_thrust(PROP_9X6),
+    }
+
+
+@benchmark
+def takeoff_distance():
+    from wyvern.performance.takeoff import takeoff_distance
+
+    inputs = _fdr_takeoff()
+    return lambda: takeoff_distance(v_hw=0, v_lo=8.05, **inputs)
+
+
+@benchmark
+def ground_roll_sweep():
+    from wyvern.performance.takeoff import ground_roll_sweep
+
+    inputs = _fdr_takeoff()
+    return lambda: ground_roll_sweep(v_hw=0, v_max=9.0, **inputs)
+
+
+@benchmark
+def spar_height():
+    from wyvern.analysis.structures.rib_calcs import spar_height
+
+    structure = _fdr_structure()
+    rib, spar = structure.rib, structure.spars[0]
+    return lambda: spar_height(rib.y, rib.c, rib.xle, spar.x, rib.twist, rib.sections)
+
+
+@benchmark
+def rib_loading():
+    from wyvern.analysis.structures.rib_calcs import rib_loading
+
+    rib_y = _fdr_structure().rib.y
+    lift = _elliptical_lift()
+    return lambda: rib_loading(lift, rib_y)
+
+
+@benchmark
+def beam_derivatives():
+    from wyvern.analysis.structures.spar_calcs import beam_derivatives
+    from wyvern.utils.constants import BALSA_E
+
+    y = np.linspace(-0.85, 0.85, 401)
+    h = np.interp(np.abs(y), [0, 0.85], [0.1, 0.015])
+    lift = _elliptical_lift()
+    return lambda: beam_derivatives(lift, y, 3.175e-3, h, BALSA_E)
+
+
+@benchmark
+def planform_stats():
+    from wyvern.data import PLANFORM_CONFIGS
+    from wyvern.layout.planform import planform_stats
+
+    config = PLANFORM_CONFIGS["NF-844-D"]
+    return lambda: planform_stats(config)
+
+
+@benchmark
+def import_wyvern():
+    import subprocess
+    import sys
+
+    modules = [
+        "wyvern.layout",
+        "wyvern.analysis.payload_sweep",
+        "wyvern.performance.scoring",
+        "wyvern.sizing",
+    ]
+    code = "; ".join(f"import {m}" for m in modules)
+    # a fresh interpreter each time, so nothing is already imported
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,207 @@
+"""
+Run the benchmarks, record them with machine metadata and compare against a
+stored baseline.
+
+    python -m benchmarks.run                      # all, compared to baseline
+    python -m benchmarks.run cd0_buildup -r 10    # selected cases
+    python -m benchmarks.run --save-baseline      # record a new baseline
+
+Per-call times are the best of `repeat` repeats of a loop sized to take at
+least `min_time`; a benchmark whose best time exceeds the baseline's by more
+than `threshold` is flagged as a regression and the exit status is 1.
+Baselines are only comparable on the machine that recorded them, so a
+mismatch in the machine metadata is reported alongside.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.cases import BENCHMARKS
+
+HERE = Path(__file__).parent
+BASELINE = HERE / "baseline.json"
+RESULTS = HERE / "results.json"
+
+# metadata that must match for timings to be comparable
+MACHINE_KEYS = ("machine", "processor", "cpu_count", "python", "numpy", "scipy")
+
+
+def machine_metadata() -> dict:
+    import numpy as np
+    import pandas as pd
+    import scipy
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=HERE,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": commit,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "pandas": pd.__version__,
+    }
+
+
+def time_benchmark(
+    name: str, repeat: int = 5, min_time: float = 0.2, max_time: float = 20.0
+) -> dict:
+    """
+    Time one benchmark; repeats stop early once `max_time` (s) is spent.
+    """
+    fn = BENCHMARKS[name]()
+
+    # warm up (first-call caches, lazy imports) and size the loop
+    start = time.perf_counter()
+    fn()
+    first = time.perf_counter() - start
+    number = max(1, math.ceil(min_time / max(first, 1e-9)))
+
+    times = []
+    spent = first
+    while len(times) < repeat and (not times or spent < max_time):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        spent += elapsed
+        times.append(elapsed / number)
+
+    return {
+        "best": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "first": first,
+        "repeat": len(times),
+        "number": number,
+    }
+
+
+def run(names: list[str] = None, **kwargs) -> dict:
+    """
+    Time the named benchmarks (all by default).
+    """
+    names = list(BENCHMARKS) if not names else names
+    unknown = set(names) - set(BENCHMARKS)
+    if unknown:
+        raise ValueError(f"Unknown benchmarks {sorted(unknown)}.")
+
+    results = {}
+    with warnings.catch_warnings():
+        # integration accuracy warnings of the analysis code are not ours
+        warnings.simplefilter("ignore")
+        for name in names:
+            results[name] = time_benchmark(name, **kwargs)
+            print(f"{name:<24} {_format_time(results[name]['best'])}", flush=True)
+    return {"metadata": machine_metadata(), "benchmarks": results}
+
+
+def compare(results: dict, baseline: dict, threshold: float = 1.25) -> dict:
+    """
+    Ratio of each benchmark's best time to the baseline's, and its status:
+    "regression" above `threshold`, "improvement" below 1 / `threshold`,
+    otherwise "ok"; benchmarks missing from the baseline are "new".
+    """
+    comparison = {}
+    for name, result in results["benchmarks"].items():
+        reference = baseline["benchmarks"].get(name)
+        if reference is None:
+            comparison[name] = {"ratio": None, "status": "new"}
+            continue
+        ratio = result["best"] / reference["best"]
+        if ratio > threshold:
+            status = "regression"
+        elif ratio < 1 / threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        comparison[name] = {"ratio": ratio, "status": status}
+    return comparison
+
+
+def machine_mismatch(results: dict, baseline: dict) -> dict:
+    """
+    {key: (baseline, current)} of the machine metadata that differs.
+    """
+    current, reference = results["metadata"], baseline["metadata"]
+    return {
+        key: (reference.get(key), current.get(key))
+        for key in MACHINE_KEYS
+        if reference.get(key) != current.get(key)
+    }
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.3f} ns"
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the wyvern benchmarks.")
+    parser.add_argument("names", nargs="*", help=f"any of {', '.join(BENCHMARKS)}")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--max-time", type=float, default=20.0)
+    parser.add_argument("-o", "--output", type=Path, default=RESULTS)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--threshold", type=float, default=1.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(
+        args.names,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        max_time=args.max_time,
+    )
+    args.output.write_text(json.dumps(results, indent=2))
+    print(f"results written to {args.output}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"no baseline at {args.baseline}; run with --save-baseline")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    for key, (old, new) in machine_mismatch(results, baseline).items():
+        print(f"warning: baseline {key} is {old}, this machine {new}")
+
+    comparison = compare(results, baseline, args.threshold)
+    for name, c in comparison.items():
+        ratio = "" if c["ratio"] is None else f"{c['ratio']:6.2f}x"
+        print(f"{name:<24} {ratio:>8} {c['status']}")
+    return int(any(c["status"] == "regression" for c in comparison.values()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Build the FDR figures and tables into ./report, rerunning only the scripts
+whose sources changed since the last build.
+
+    python build_report.py [-j JOBS] [--force] [--dry-run]
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from wyvern.utils.build_graph import BuildGraph, main
+
+HERE = Path(__file__).parent
+WYVERN = HERE.parent.parent / "wyvern"
+SOURCES = WYVERN / "data/sources"
+
+graph = BuildGraph(HERE / "report")
+
+graph.script(
+    HERE / "beta_plots.py",
+    "lateral_static_stab.pdf",
+    sources=[SOURCES / "beta_dists"],
+)
+graph.script(
+    HERE / "cl_lift_plots.py",
+    "Full_lift_dist.pdf",
+    "Empty_lift_dist.pdf",
+    sources=[SOURCES / "lift_dists"],
+)
+graph.script(
+    HERE / "cm_plots.py",
+    "cm_variation.pdf",
+    sources=[SOURCES / "cm_variation"],
+)
+graph.script(
+    HERE / "final_performance.py",
+    "flight_score_vs_payload.pdf",
+    "payload_sensitivity_study.csv",
+    sources=[WYVERN / "analysis", WYVERN / "performance", WYVERN / "sizing", SOURCES],
+)
+graph.script(
+    HERE / "payload_sensitivity_study.py",
+    "empty_weight_sensitivity.pdf",
+    "cd0_sensitivity.pdf",
+    "single_payload_empty_weight_sensitivity.pdf",
+    "single_payload_cd0_sensitivity.pdf",
+    sources=[WYVERN / "analysis", WYVERN / "performance", WYVERN / "sizing", SOURCES],
+)
+graph.script(
+    HERE / "performance_param_plot.py",
+    "power_thrust_performance.pdf",
+    "drag_polar.pdf",
+    sources=[WYVERN / "performance", SOURCES],
+)
+graph.script(
+    HERE / "refined_cd0.py",
+    "cd0_buildup.pdf",
+    "cd0_vs_speed.pdf",
+    sources=[WYVERN / "sizing/parasitic_drag.py", WYVERN / "utils", SOURCES],
+)
+graph.script(
+    HERE / "structural_design.py",
+    "spar_loads.pdf",
+    "rib_failure.pdf",
+    sources=[WYVERN / "analysis", WYVERN / "utils", SOURCES],
+)
+
+
+def flight_score_table(results: Path) -> pd.DataFrame:
+    df = pd.read_csv(results)
+    return df.set_index(pd.Index(df["num_golf_balls"], name="Golf balls"))[
+        ["total_flight_score"]
+    ].rename(columns={"total_flight_score": "Flight score"})
+
+
+graph.table(
+    "flight_score_table.tex",
+    caption="Flight score against payload",
+    label="tab:flight_score",
+    depends=["final_performance"],
+    results=graph.directory / "payload_sensitivity_study.csv",
+)(flight_score_table)
+
+
+if __name__ == "__main__":
+    main(graph)
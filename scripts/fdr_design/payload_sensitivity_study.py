@@ -2,8 +2,9 @@ import numpy as np
 from matplotlib import pyplot as plt
 
 from wyvern.analysis.parameters import PayloadSizingParameters
+from wyvern.analysis.payload_packing import feasible_payload_configs
 from wyvern.analysis.payload_sweep import sensitivity_plot, sweep_payload_configs
-from wyvern.data import ALL_COMPONENTS
+from wyvern.data import ALL_COMPONENTS, PLANFORM_CONFIGS
 from wyvern.performance.models import QuadraticLDModel
 from wyvern.sizing import total_component_mass
 
@@ -29,7 +30,10 @@ params = PayloadSizingParameters(
 )
 
 
-payload_configs = [(8, i, 4) for i in range(0, 7)]
+# only configurations that pack into the centerbody
+payload_configs = feasible_payload_configs(
+    PLANFORM_CONFIGS["NF-844-D"], [(8, i, 4) for i in range(0, 7)]
+)
 
 cad_masses = [600, 700, 765, 800, 900]
 
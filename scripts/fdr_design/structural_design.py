@@ -14,6 +14,7 @@ from pathlib import Path
 import numpy as np
 from matplotlib import pyplot as plt
 
+from wyvern.analysis.span_loads import SpanLoad
 from wyvern.analysis.structures.abstractions import (
     RibControlPoints,
     SparControlPoints,
@@ -25,8 +26,8 @@ from wyvern.analysis.structures.plots import (
     rib_loading_plot,
     spar_plots,
 )
-from wyvern.analysis.structures.rib_calcs import rib_failure, rib_loading
-from wyvern.analysis.structures.spar_calcs import beam_derivatives
+from wyvern.analysis.structures.rib_calcs import rib_failure
+from wyvern.analysis.structures.spar_calcs import beam_derivatives_batch
 from wyvern.utils.constants import G
 from wyvern.utils.geom_utils import mirror_verts
 
@@ -69,18 +70,15 @@ structure = Structure.from_structure(y, rib, rib_t_inches, spar_1, spar_2)
 
 # data
 lift_path = Path(__file__).parent.parent.parent / "wyvern/data/sources/lift_dists"
-lift_data = np.genfromtxt(lift_path / "Full_cruise_L.csv", delimiter=",", skip_header=1)
-# normalize lift data
-T = np.trapz(lift_data[:, 1], lift_data[:, 0])
-lift_data[:, 1] = W0 * lift_data[:, 1] / T
+lift = SpanLoad.from_csv(lift_path / "Full_cruise_L.csv")
 
 
 def ell(y: float):
     # real lift distr
-    return np.interp(y, lift_data[:, 0], lift_data[:, 1]) * n
+    return lift(y, W0 * n)
 
 
-rib_force = rib_loading(ell, y)
+rib_force = lift.rib_loads(y, W0 * n)[0]
 
 # Plotting
 # do_3d_plots(structure)
@@ -94,12 +92,18 @@ h_smooth_2 = np.interp(y_loading, y, structure.spars[1].h)
 
 E = 2.55e9
 
-bd = [
-    beam_derivatives(ell, y_loading, spar_width, h_smooth_1, E),
-    beam_derivatives(ell, y_loading, spar_width, h_smooth_2, E),
-]
+bd = beam_derivatives_batch(
+    lift.evaluate(y_loading, W0 * n),
+    y_loading,
+    spar_width,
+    np.stack([h_smooth_1, h_smooth_2]),
+    E,
+)
+print(f"Max deflection: {bd.deflection.max() * 1000:.2f} mm")
 
-spar_plots(bd[0], bd[1], structure.spars[0], structure.spars[1], y_loading, b)
+spar_plots(
+    bd.case(0, 0), bd.case(0, 1), structure.spars[0], structure.spars[1], y_loading, b
+)
 plt.savefig("spar_loads.pdf", bbox_inches="tight")
 
 rib_f_loads = rib_failure(structure, rib_force, rib_min_t, rib_min_t, spar_width * 2)
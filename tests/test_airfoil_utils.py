@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from wyvern.data.airfoils import _SOURCES, BOEING_VERTOL, NACA0018
+from wyvern.utils.airfoil_utils import (
+    blend_sections,
+    naca_airfoil,
+    resample_airfoil,
+    split_surfaces,
+)
+
+
+def test_resample_airfoil_matches_source_points():
+    x, y_top, y_bot = resample_airfoil(NACA0018, 201)
+
+    assert x[0] == pytest.approx(0.0)
+    assert x[-1] == pytest.approx(1.0)
+    # symmetric section stays symmetric
+    assert y_top == pytest.approx(-y_bot)
+    # max thickness of the NACA 0018 is 18% chord
+    assert np.max(y_top - y_bot) == pytest.approx(0.18, abs=1e-3)
+
+
+def test_blend_sections_lerps_between_sections():
+    y = np.array([-1.0, 0.0, 0.5, 1.0, 2.0])
+    x, y_top, y_bot = blend_sections(y, [0.0, 1.0], [NACA0018, BOEING_VERTOL], 51)
+    _, naca_top, naca_bot = resample_airfoil(NACA0018, 51)
+    _, boeing_top, boeing_bot = resample_airfoil(BOEING_VERTOL, 51)
+
+    assert y_top.shape == (5, 51)
+    assert y_top[0] == pytest.approx(naca_top)
+    assert y_top[1] == pytest.approx(naca_top)
+    assert y_top[2] == pytest.approx(0.5 * (naca_top + boeing_top))
+    assert y_bot[3] == pytest.approx(boeing_bot)
+    assert y_bot[4] == pytest.approx(boeing_bot)
+
+
+def test_blend_sections_step_change():
+    y = np.array([0.1, 0.185, 0.5])
+    _, y_top, _ = blend_sections(
+        y, [0.0, 0.185, 0.185, 0.85], [NACA0018, NACA0018, BOEING_VERTOL, BOEING_VERTOL]
+    )
+    _, naca_top, _ = resample_airfoil(NACA0018)
+    _, boeing_top, _ = resample_airfoil(BOEING_VERTOL)
+
+    assert y_top[0] == pytest.approx(naca_top)
+    assert y_top[1] == pytest.approx(boeing_top)
+    assert y_top[2] == pytest.approx(boeing_top)
+
+
+def test_naca_airfoil_matches_tabulated_section():
+    tabulated = np.loadtxt(_SOURCES / "NACA0018.dat")
+    x_top, y_top, _, _ = split_surfaces(naca_airfoil("0018", 61))
+
+    assert np.interp(tabulated[:, 0], x_top, y_top) == pytest.approx(
+        np.abs(tabulated[:, 1]), abs=5e-4
+    )
+
+
+@pytest.mark.parametrize(
+    "designation, thickness, camber",
+    [("NACA 2412", 0.12, 0.02), ("4415", 0.15, 0.04), ("23012", 0.12, 0.0184)],
+)
+def test_naca_airfoil_thickness_and_camber(designation, thickness, camber):
+    section = naca_airfoil(designation, 201)
+    _, y_top, y_bot = resample_airfoil(section, 201)
+
+    assert section.shape == (401, 2)
+    assert not section.flags.writeable
+    assert naca_airfoil(designation, 201) is section
+    assert np.max(y_top - y_bot) == pytest.approx(thickness, abs=1e-3)
+    assert np.max((y_top + y_bot) / 2) == pytest.approx(camber, abs=5e-4)
+
+
+def test_naca_airfoil_closed_trailing_edge():
+    assert naca_airfoil("0012", closed_te=True)[[0, -1], 1] == pytest.approx(0)
+    assert naca_airfoil("0012")[0, 1] == pytest.approx(0.00126, abs=1e-5)
+    with pytest.raises(ValueError):
+        naca_airfoil("12345")
@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.run import compare, machine_mismatch, time_benchmark
+
+# too slow to run on every test run
+SLOW = {"ground_roll_sweep", "import_wyvern"}
+
+
+@pytest.mark.filterwarnings("ignore::scipy.integrate.IntegrationWarning")
+@pytest.mark.parametrize("name", sorted(set(BENCHMARKS) - SLOW))
+def test_benchmark_cases_run(name):
+    BENCHMARKS[name]()()
+
+
+def test_time_benchmark():
+    result = time_benchmark("planform_stats", repeat=2, min_time=0.01)
+    assert result["repeat"] == 2
+    assert result["number"] >= 1
+    assert 0 < result["best"] <= result["median"]
+
+
+def test_compare_flags_regressions():
+    metadata = {"machine": "x86_64", "python": "3.11.7"}
+    baseline = {
+        "metadata": metadata,
+        "benchmarks": {"a": {"best": 1.0}, "b": {"best": 1.0}, "c": {"best": 1.0}},
+    }
+    results = {
+        "metadata": {**metadata, "python": "3.12.1"},
+        "benchmarks": {
+            "a": {"best": 1.1},
+            "b": {"best": 1.5},
+            "c": {"best": 0.5},
+            "d": {"best": 1.0},
+        },
+    }
+
+    status = {k: v["status"] for k, v in compare(results, baseline, 1.25).items()}
+    assert status == {"a": "ok", "b": "regression", "c": "improvement", "d": "new"}
+    assert machine_mismatch(results, baseline) == {"python": ("3.11.7", "3.12.1")}
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from wyvern.analysis.parameters import PayloadSizingParameters
+from wyvern.data.components import ALL_COMPONENTS
+from wyvern.data.propellers import PROP_8X8, PROP_9X6, PROP_10X5
+from wyvern.performance.models import QuadraticLDModel
+from wyvern.performance.scoring import flight_score
+from wyvern.sizing.aircraft_mass import total_component_mass
+from wyvern.sizing.bom import BillOfMaterials, propeller_options
+
+
+@pytest.fixture
+def bom() -> BillOfMaterials:
+    motors = pd.DataFrame(
+        {
+            "basic_mass": [82, 60],
+            "mga_pct": 2.5,
+            "min_cells": [2, 2],
+            "max_cells": [4, 3],
+            "max_current": [30, 20],
+            "max_power": [400, 220],
+            "max_prop_diameter": [10, 9],
+        },
+        index=["Motor A", "Motor B"],
+    )
+    props = propeller_options(
+        [PROP_8X8, PROP_9X6, PROP_10X5], [17.8, 16, 19], [8, 9, 10], ref_power=220
+    )
+    batteries = pd.DataFrame(
+        {
+            "basic_mass": [102, 150, 200],
+            "mga_pct": 5,
+            "cells": [3, 3, 4],
+            "capacity": [1000, 1500, 1500],
+            "c_rating": [35, 25, 30],
+        },
+        index=["3S 1000", "3S 1500", "4S 1500"],
+    )
+    escs = pd.DataFrame(
+        {
+            "basic_mass": [37, 25],
+            "mga_pct": 2.5,
+            "min_cells": [2, 2],
+            "max_cells": [6, 3],
+            "max_current": [40, 20],
+        },
+        index=["ESC 40A", "ESC 20A"],
+    )
+    options = {"motor": motors, "propeller": props, "battery": batteries, "esc": escs}
+    return BillOfMaterials.from_components(ALL_COMPONENTS, options)
+
+
+def test_bom_combinations(bom: BillOfMaterials):
+    combos = bom.combinations()
+    df = combos.to_frame()
+
+    # brute force over every combination
+    expected = []
+    for m, motor in bom.options["motor"].iterrows():
+        for p, prop in bom.options["propeller"].iterrows():
+            for b, battery in bom.options["battery"].iterrows():
+                for e, esc in bom.options["esc"].iterrows():
+                    ok = (
+                        motor.min_cells <= battery.cells <= motor.max_cells
+                        and esc.min_cells <= battery.cells <= esc.max_cells
+                        and esc.max_current >= motor.max_current
+                        and battery.capacity / 1000 * battery.c_rating
+                        >= motor.max_current
+                        and prop.diameter <= motor.max_prop_diameter
+                    )
+                    if ok:
+                        expected.append((m, p, b, e))
+    assert list(df[["motor", "propeller", "battery", "esc"]].itertuples(False)) == [
+        tuple(x) for x in expected
+    ]
+
+    # the baseline parts reproduce the components.json fixed mass
+    row = df.index[
+        (df.motor == "Motor A")
+        & (df.propeller == "8x8")
+        & (df.battery == "3S 1000")
+        & (df.esc == "ESC 40A")
+    ]
+    assert combos.total_fixed_mass[row[0]] == pytest.approx(
+        total_component_mass(ALL_COMPONENTS)
+    )
+
+
+def test_bom_flight_scores(bom: BillOfMaterials):
+    params = PayloadSizingParameters(
+        total_fixed_mass=0.0,
+        as_mass_ratio=0.45,
+        aero_model=QuadraticLDModel(
+            c_d0=0.03, e_inviscid=0.91, K=0.45, aspect_ratio=5.1
+        ),
+        cruise_speed=10,
+        turn_speed=10,
+        planform_area=0.56,
+        propulsive_efficiency=0.5,
+    )
+    combos = bom.combinations()
+    df = combos.flight_scores((8, 3, 4), params)
+
+    for i in [0, len(df) - 1]:
+        params.total_fixed_mass = combos.total_fixed_mass[i]
+        expected = flight_score((8, 3, 4), params)
+        if df.energy_required[i] <= combos.energy[i]:
+            assert df.flight_score[i] == pytest.approx(expected)
+        else:
+            assert df.flight_score[i] == 0
+    assert np.all(df.flight_score >= 0)
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from wyvern.utils.build_graph import Artifact, BuildGraph, latex_table
+
+
+def write_values(output, values):
+    output.write_text(" ".join(f"{v:g}" for v in values))
+
+
+def write_sum(output, upstream):
+    output.write_text(str(sum(float(v) for v in upstream.read_text().split())))
+
+
+def fail(output):
+    raise ValueError("no data")
+
+
+def mass_table(masses):
+    return pd.DataFrame({"Mass (g)": masses}, index=pd.Index(["A", "B"], name="Part"))
+
+
+def make_graph(directory, values, source):
+    graph = BuildGraph(directory)
+    graph.add(
+        Artifact("values", ["values.txt"], write_values, {"values": values}, [source])
+    )
+    graph.add(
+        Artifact(
+            "total",
+            ["total.txt"],
+            write_sum,
+            {"upstream": directory / "values.txt"},
+            depends=["values"],
+        )
+    )
+    graph.table("masses.tex", caption="Masses", masses=[12.5, 3.25])(mass_table)
+    return graph
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_build_reruns_only_changed_artifacts(tmp_path, jobs):
+    source = tmp_path / "data.csv"
+    source.write_text("1,2")
+    out = tmp_path / "build"
+
+    report = make_graph(out, np.array([1.0, 2.0]), source).build(jobs=jobs)
+    assert sorted(report.built) == ["mass_table", "total", "values"]
+    assert (out / "total.txt").read_text() == "3.0"
+    assert "Part & Mass (g)" in (out / "masses.tex").read_text()
+
+    report = make_graph(out, np.array([1.0, 2.0]), source).build(jobs=jobs)
+    assert report.built == []
+
+    # changed inputs rebuild the artifact and everything downstream of it
+    report = make_graph(out, np.array([1.0, 5.0]), source).build(jobs=jobs)
+    assert sorted(report.built) == ["total", "values"]
+    assert (out / "total.txt").read_text() == "6.0"
+
+    source.write_text("1,3")
+    assert make_graph(out, np.array([1.0, 5.0]), source).stale() == ["values", "total"]
+
+    (out / "masses.tex").unlink()
+    graph = make_graph(out, np.array([1.0, 5.0]), source)
+    assert "mass_table" in graph.stale()
+
+
+def test_failures_block_dependents(tmp_path):
+    graph = BuildGraph(tmp_path)
+    graph.figure("broken.pdf")(fail)
+    graph.add(Artifact("after", ["after.txt"], write_values, depends=["fail"]))
+
+    report = graph.build(jobs=1)
+    assert set(report.failed) == {"fail", "after"}
+    assert graph.manifest() == {}
+
+    with pytest.raises(ValueError):
+        graph.figure("again.pdf")(fail)
+
+
+def test_latex_table():
+    table = latex_table(mass_table([12.5, 3.25]), caption="Masses", label="tab:m")
+    assert r"\caption{Masses}" in table
+    assert r"\label{tab:m}" in table
+    assert r"\begin{tabular}{lr}" in table
+    assert r"A & 12.5 \\" in table
+    assert r"B & 3.25 \\" in table
+
+
+def test_script_artifacts_stay_up_to_date(tmp_path):
+    script = tmp_path / "plot.py"
+    script.write_text('open("plot.txt", "w").write("done")\n')
+    graph = BuildGraph(tmp_path / "build")
+    graph.script(script, "plot.txt")
+
+    assert graph.build(jobs=1).built == ["plot"]
+    assert (tmp_path / "build/plot.txt").read_text() == "done"
+    assert graph.stale() == []
+    report = graph.build(jobs=1)
+    assert report.built == []
+    assert report.skipped == ["plot"]
+
+    script.write_text('open("plot.txt", "w").write("again")\n')
+    assert graph.build(jobs=1).built == ["plot"]
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+from wyvern.data._cache import cached_load
+
+
+def test_cached_load_invalidates_on_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("WYVERN_CACHE_DIR", str(tmp_path / "cache"))
+    source = tmp_path / "data.csv"
+    source.write_text("1,2\n3,4\n")
+    calls = []
+
+    def loader(path, **kwargs):
+        calls.append(path)
+        return np.loadtxt(path, **kwargs)
+
+    first = cached_load(source, loader, delimiter=",")
+    np.testing.assert_array_equal(cached_load(source, loader, delimiter=","), first)
+    assert len(calls) == 1
+
+    # touched but unchanged: the digest still matches
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cached_load(source, loader, delimiter=",")
+    assert len(calls) == 1
+
+    source.write_text("5,6\n7,8\n")
+    np.testing.assert_array_equal(
+        cached_load(source, loader, delimiter=","), [[5, 6], [7, 8]]
+    )
+    assert len(calls) == 2
+
+
+def test_cached_load_disabled(tmp_path, monkeypatch):
+    monkeypatch.setenv("WYVERN_CACHE_DIR", "")
+    source = tmp_path / "data.csv"
+    source.write_text("1,2\n")
+    cached_load(source, np.loadtxt, delimiter=",")
+    assert list(tmp_path.iterdir()) == [source]
+
+
+def test_data_sources_load_lazily():
+    code = (
+        "import sys, wyvern.sizing, wyvern.performance.scoring; "
+        "assert 'openpyxl' not in sys.modules; "
+        "from wyvern.data import RASSAM_CORRELATIONS; "
+        "assert len(RASSAM_CORRELATIONS) == 6"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -4,6 +4,8 @@ import pytest
 from wyvern.utils.geom_utils import (
     area_of_points,
     centroid_of_polyshape,
+    polygon_properties,
+    polygon_properties_ragged,
     sweep_angle_along_chord,
 )
 
@@ -55,3 +57,44 @@ def test_sweep_angle_along_chord_2():
     assert sweep_angle_along_chord(taper_ratio, ar, 0.25, le_sweep, 0) == pytest.approx(
         qc_sweep
     )
+
+
+def test_polygon_properties_rectangle():
+    b, h = 4.0, 2.0
+    rectangle = np.array([[0, 0], [b, 0], [b, h], [0, h]]) + [100.0, -50.0]
+
+    props = polygon_properties(rectangle)
+    assert props.area == pytest.approx(b * h)
+    assert (props.cx, props.cy) == pytest.approx((102.0, -49.0))
+    assert props.Ixx == pytest.approx(b * h**3 / 12)
+    assert props.Iyy == pytest.approx(h * b**3 / 12)
+    assert props.Ixy == pytest.approx(0.0, abs=1e-9)
+
+    # clockwise: only the area changes sign
+    reverse = polygon_properties(rectangle[::-1])
+    assert reverse.area == pytest.approx(-b * h)
+    assert reverse.Ixx == pytest.approx(props.Ixx)
+
+
+def test_polygon_properties_batched_and_ragged():
+    rng = np.random.default_rng(0)
+    # star-shaped polygons, sorted by angle so they are simple
+    polygons = []
+    for n in [3, 5, 8, 13]:
+        theta = np.sort(rng.uniform(0, 2 * np.pi, n))
+        r = rng.uniform(0.5, 2.0, n)
+        polygons.append(np.stack([r * np.cos(theta), r * np.sin(theta)], -1) + 10)
+
+    offsets = np.cumsum([0] + [len(p) for p in polygons])
+    ragged = polygon_properties_ragged(np.concatenate(polygons), offsets)
+
+    for i, polygon in enumerate(polygons):
+        single = polygon_properties(polygon)
+        for batched, expected in zip(ragged, single):
+            assert batched[i] == pytest.approx(expected)
+        assert single.area == pytest.approx(area_of_points(polygon))
+        assert (single.cx, single.cy) == pytest.approx(centroid_of_polyshape(polygon))
+
+    stacked = polygon_properties(np.stack([polygons[1], polygons[1] * 2]))
+    assert stacked.area == pytest.approx(ragged.area[1] * np.array([1, 4]))
+    assert stacked.Ixy == pytest.approx(ragged.Ixy[1] * np.array([1, 16]))
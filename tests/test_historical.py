@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from wyvern.data.historical import (
+    ALL_HISTORICAL,
+    HISTORICAL,
+    RASSAM_CORRELATIONS,
+    HistoricalDataset,
+)
+from wyvern.sizing.as_mtow_ratio import (
+    aerostructural_mass_ratio,
+    aerostructural_mass_ratio_interval,
+)
+from wyvern.sizing.regression import bootstrap, historical_trends, power_law_fit
+
+
+def test_rassam_aircraft_by_name():
+    expected = ALL_HISTORICAL.iloc[[5, 6, 7, 8, 10, 30]]
+    assert list(RASSAM_CORRELATIONS.index) == list(expected.index)
+    np.testing.assert_array_equal(RASSAM_CORRELATIONS["EW (g)"], expected["EW (g)"])
+
+
+def test_historical_filters():
+    balsa_bwb = HISTORICAL.filter(construction="Balsa", config="BWB")
+    mask = (ALL_HISTORICAL["Construction"] == "Balsa") & (
+        ALL_HISTORICAL["Config"] == "BWB"
+    )
+    assert list(balsa_bwb.frame.index) == list(ALL_HISTORICAL.index[mask])
+
+    recent = balsa_bwb.filter(year=(2020, 2024))
+    assert set(recent.frame["Group"]) == {"J-Type Starfighter", "Halal"}
+    assert len(HISTORICAL.filter(config=["FW", "BWB"], year=2013)) == 1
+    with pytest.raises(KeyError):
+        recent.select([(2015, "NARD")])
+
+
+def test_rows_without_year():
+    frame = ALL_HISTORICAL.copy()
+    frame["Year"] = frame["Year"].astype(float)
+    frame.loc[frame.index[0], "Year"] = np.nan
+    dataset = HistoricalDataset(frame)
+
+    year, group = frame["Year"].iloc[1], frame["Group"].iloc[1]
+    assert len(dataset.select([(year, group)])) == 1
+    assert len(dataset.filter(year=(2000, 2030))) == len(frame) - 1
+    with pytest.raises(KeyError):
+        dataset.select([(np.nan, frame["Group"].iloc[0])])
+
+
+def test_power_law_fit_vectorized():
+    x = np.linspace(500, 2000, 12)
+    y = np.stack([3.0 * x**0.8, 0.5 * x**1.2])
+    fit = power_law_fit(x, y)
+    np.testing.assert_allclose(fit.coefficient, [3.0, 0.5])
+    np.testing.assert_allclose(fit.exponent, [0.8, 1.2])
+    np.testing.assert_allclose(fit(x[:, None]).T, y)
+
+
+def test_bootstrap_intervals():
+    interval = aerostructural_mass_ratio_interval(RASSAM_CORRELATIONS, 448.15, seed=0)
+    assert interval.estimate == pytest.approx(
+        aerostructural_mass_ratio(RASSAM_CORRELATIONS, 448.15)
+    )
+    assert interval.lower < interval.estimate < interval.upper
+    assert interval.samples.shape == (10000,)
+
+    rng = np.random.default_rng(1)
+    x = rng.uniform(0, 1, 200)
+    mean = bootstrap(lambda v: v.mean(axis=-1), x, n_resamples=4000, seed=2)
+    # the normal approximation of the interval of the mean
+    half_width = 1.96 * x.std() / np.sqrt(len(x))
+    assert mean.upper - mean.lower == pytest.approx(2 * half_width, rel=0.1)
+
+    trends = historical_trends(HISTORICAL, 448.15, n_resamples=2000, seed=0)
+    assert list(trends.index) == ["empty_weight", "wetted_area_ratio", "as_mass_ratio"]
+    assert np.all(trends.exponent_lower <= trends.exponent)
+    assert np.all(trends.exponent <= trends.exponent_upper)
+
+
+def test_historical_trends_warns_on_dropped_rows():
+    # fixed mass above some empty weights gives negative mass ratios
+    with pytest.warns(UserWarning, match="as_mass_ratio .* non-positive"):
+        trends = historical_trends(HISTORICAL, 750, n_resamples=200, seed=0)
+    dropped = (HISTORICAL.as_mass_ratio(750) <= 0).sum()
+    assert dropped > 0
+    assert trends.n["as_mass_ratio"] == len(HISTORICAL) - dropped
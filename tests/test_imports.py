@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+import pytest
+
+HEADLESS = [
+    "wyvern.layout",
+    "wyvern.analysis.payload_sweep",
+    "wyvern.performance.scoring",
+    "wyvern.sizing",
+]
+
+
+def _import(modules: list[str]) -> subprocess.CompletedProcess:
+    code = (
+        f"import sys\nfor m in {modules!r}: __import__(m)\nprint(*sorted(sys.modules))"
+    )
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+@pytest.mark.parametrize("module", HEADLESS)
+def test_compute_modules_import_headless(module):
+    loaded = set(_import([module]).stdout.split())
+    assert module in loaded
+    for heavy in ["matplotlib", "openpyxl", "scipy.optimize"]:
+        assert heavy not in loaded, f"{module} imports {heavy}"
+
+
+def test_import_time():
+    # self time of our own modules (us), excluding numpy, pandas etc.
+    stderr = _import(HEADLESS).stderr
+    self_us = [
+        int(line.split("|")[0].split(":")[1])
+        for line in stderr.splitlines()
+        if line.split("|")[-1].strip().startswith("wyvern")
+    ]
+    assert self_us
+    assert sum(self_us) < 100_000
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from wyvern.data import PLANFORM_CONFIGS
+from wyvern.layout import planform_span_stations, planform_stats
+from wyvern.layout.loft import loft_planform, write_obj, write_stl
+
+# unit-chord diamond, 10% thick; its area is 0.05
+DIAMOND = np.array([[1.0, 0.0], [0.5, 0.05], [0.0, 0.0], [0.5, -0.05], [1.0, 0.0]])
+
+
+def _rectangle(half_span: float, chord: float) -> pd.DataFrame:
+    names = ["center", "midbody", "wing_root", "wing_tip"]
+    y = np.linspace(0, half_span, 4)
+    return pd.DataFrame(
+        {
+            "Y": y,
+            "XLE": np.zeros(4),
+            "chord": np.full(4, chord),
+            "XTE": np.full(4, chord),
+            "hinge_line": np.full(4, np.nan),
+        },
+        index=names,
+    )
+
+
+def _assert_closed(faces: np.ndarray):
+    # every edge used once in each direction: closed and consistently oriented
+    edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    directed = {tuple(e) for e in edges}
+    assert len(directed) == len(edges)
+    assert all((b, a) in directed for a, b in directed)
+
+
+@pytest.mark.parametrize("twist", [0.0, 10.0, [0.0, 2.0, 4.0, -6.0]])
+def test_loft_rectangular_wing(twist):
+    mesh = loft_planform(
+        _rectangle(1000, 200), [0.0], [DIAMOND], twist=twist, num_points=21
+    )
+
+    _assert_closed(mesh.faces)
+    # twist rotates sections, leaving their areas unchanged; the surface
+    # between differently twisted sections is ruled, so slightly smaller
+    rel = 1e-12 if np.isscalar(twist) else 1e-2
+    assert mesh.volume == pytest.approx(0.05 * 0.2**2 * 2.0, rel=rel)
+    side = 4 * np.hypot(0.5, 0.05) * 0.2 * 2.0
+    assert mesh.wetted_area == pytest.approx(side + 2 * 0.05 * 0.2**2, rel=rel)
+
+    # the chord keeps its length, pitched by the twist about mid-chord
+    ring = mesh.grid[0]
+    te, le = ring[0], ring[np.argmin(ring[:, 0])]
+    assert np.hypot(*(te - le)[[0, 2]]) == pytest.approx(0.2, rel=1e-12)
+    if np.isscalar(twist):
+        theta = np.deg2rad(twist)
+        assert np.ptp(ring[:, 0]) == pytest.approx(0.2 * np.cos(theta), rel=1e-12)
+        assert te[2] == pytest.approx(0.1 * np.sin(theta), rel=1e-12)
+
+
+def test_loft_planform(tmp_path):
+    config = PLANFORM_CONFIGS["NF-844-D"]
+    df = planform_span_stations(config)
+    mesh = loft_planform(df, twist=np.linspace(0, -3, len(df)))
+
+    _assert_closed(mesh.faces)
+    assert mesh.grid[..., 1].max() == pytest.approx(df.Y.max() * 1e-3)
+    assert mesh.volume > 0
+    # both sides of a thin body, a little more than twice the planform area
+    s_ref = planform_stats(config).overall_area.iloc[0]
+    assert 2 < mesh.wetted_area / s_ref < 2.5
+
+    write_stl(mesh, tmp_path / "loft.stl", chunk_size=1000)
+    assert (tmp_path / "loft.stl").stat().st_size == 84 + 50 * len(mesh.faces)
+    write_obj(mesh, tmp_path / "loft.obj", chunk_size=1000)
+    lines = (tmp_path / "loft.obj").read_text().splitlines()
+    assert len(lines) == len(mesh.vertices) + len(mesh.faces)
+
+
+def test_loft_default_sections():
+    df = planform_span_stations(PLANFORM_CONFIGS["NF-844-D"])
+    mesh = loft_planform(df)
+
+    def thickness_ratio(y):
+        ring = mesh.grid[np.argmin(np.abs(mesh.grid[:, 0, 1] - y))]
+        return np.ptp(ring[:, 2]) / np.ptp(ring[:, 0])
+
+    # NACA0018 over the centerbody, BOEING_VERTOL from the wing root out
+    assert thickness_ratio(0.0) == pytest.approx(0.18, abs=2e-3)
+    assert thickness_ratio(df.Y["wing_tip"] * 1e-3) < 0.15
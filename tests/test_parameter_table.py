@@ -0,0 +1,97 @@
+import copy
+import io
+import pickle
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from wyvern.analysis.parameter_table import ParameterTable
+from wyvern.analysis.parameters import PayloadSizingParameters
+from wyvern.analysis.payload_sweep import sweep_payload_configs
+from wyvern.data import PLANFORM_CONFIGS
+from wyvern.layout.batch import PlanformBatch
+from wyvern.performance.models import QuadraticLDModel
+
+BASE = PayloadSizingParameters(
+    total_fixed_mass=448.15,
+    as_mass_ratio=0.45,
+    aero_model=QuadraticLDModel(c_d0=0.03, e_inviscid=0.91, K=0.45, aspect_ratio=5.1),
+    cruise_speed=10,
+    turn_speed=10,
+    planform_area=0.56,
+    propulsive_efficiency=0.52,
+)
+
+
+def test_variants_match_dataclass_replace():
+    masses = np.linspace(550, 950, 5)
+    table = ParameterTable.from_params([BASE]).with_column("total_fixed_mass", masses)
+
+    assert len(table) == 5
+    for row, mass in zip(table, masses):
+        assert row.to_params() == replace(BASE, total_fixed_mass=mass)
+    assert table[-1].total_fixed_mass == 950
+    assert table.column("cruise_speed").dtype.kind == "i"
+
+    # rows read like the parameters
+    scores = sweep_payload_configs([(8, 3, 4)], table[2])["total_flight_score"]
+    expected = sweep_payload_configs([(8, 3, 4)], table[2].to_params())
+    assert scores.iloc[0] == expected["total_flight_score"].iloc[0]
+
+
+def test_product():
+    models = [replace(BASE.aero_model, c_d0=c) for c in [0.025, 0.03, 0.035]]
+    table = ParameterTable.from_params([BASE]).product(
+        aero_model=models, short_takeoff=[False, True]
+    )
+    assert len(table) == 6
+    assert [row.aero_model.c_d0 for row in table] == [
+        0.025,
+        0.025,
+        0.03,
+        0.03,
+        0.035,
+        0.035,
+    ]
+    assert list(table.column("short_takeoff")) == [False, True] * 3
+
+    with pytest.raises(ValueError):
+        table.replace(turn_speed=[1, 2])
+
+
+def test_jsonl_round_trip():
+    table = ParameterTable.from_params([BASE]).product(
+        aero_model=[replace(BASE.aero_model, c_d0=c) for c in [0.02, 0.03]],
+        cruise_speed=[9.0, 10.0, 11.0],
+    )
+    buffer = io.StringIO()
+    table.to_jsonl(buffer)
+    assert buffer.getvalue().count("\n") == 6
+
+    restored = ParameterTable.from_jsonl(
+        PayloadSizingParameters, io.StringIO(buffer.getvalue())
+    )
+    assert restored.to_params() == table.to_params()
+    head = ParameterTable.from_jsonl(
+        PayloadSizingParameters, io.StringIO(buffer.getvalue()), limit=2
+    )
+    assert len(head) == 2
+
+
+def test_planform_batch_from_table():
+    configs = list(PLANFORM_CONFIGS.values())
+    table = ParameterTable.from_params(configs)
+    np.testing.assert_allclose(
+        PlanformBatch.from_table(table).stats()["overall_area"],
+        PlanformBatch.from_configs(configs).stats()["overall_area"],
+    )
+
+
+def test_rows_pickle_and_copy():
+    table = ParameterTable.from_params([BASE]).with_column("cruise_speed", [9, 11])
+    row = pickle.loads(pickle.dumps(table[1]))
+    assert row.to_params() == replace(BASE, cruise_speed=11)
+    assert copy.copy(table[0]).cruise_speed == 9
+    with pytest.raises(AttributeError):
+        table[0]._missing
@@ -0,0 +1,66 @@
+import json
+import subprocess
+import sys
+from dataclasses import asdict, replace
+
+import numpy as np
+
+from wyvern.analysis.parameters import PayloadSizingParameters
+from wyvern.data import PLANFORM_CONFIGS
+from wyvern.layout.batch import PlanformBatch
+from wyvern.performance.models import QuadraticLDModel
+
+PARAMS = PayloadSizingParameters(
+    total_fixed_mass=448.15,
+    as_mass_ratio=0.45,
+    aero_model=QuadraticLDModel(c_d0=0.03, e_inviscid=0.91, K=0.45, aspect_ratio=5.1),
+    cruise_speed=10,
+    turn_speed=10,
+    planform_area=0.56,
+    propulsive_efficiency=0.52,
+)
+
+
+def test_nested_round_trip():
+    restored = PayloadSizingParameters.from_json(PARAMS.to_json())
+    assert restored == PARAMS
+    assert isinstance(restored.aero_model, QuadraticLDModel)
+    assert PARAMS.to_dict == asdict(PARAMS)
+    # compact encoding
+    assert " " not in PARAMS.to_json()
+
+
+def test_numpy_values_serialize():
+    params = replace(PARAMS, total_fixed_mass=np.float64(448.15))
+    assert json.loads(params.to_json())["total_fixed_mass"] == 448.15
+    assert params.stable_hash() == PARAMS.stable_hash()
+
+
+def test_stable_hash():
+    planform = PLANFORM_CONFIGS["NF-844-D"]
+    assert planform.stable_hash() == replace(planform).stable_hash()
+    assert planform.stable_hash() != replace(planform, midbody_y=93).stable_hash()
+    assert PARAMS.stable_hash() != replace(PARAMS, turn_speed=11).stable_hash()
+
+    # same in another process, where str hashes are salted differently
+    code = (
+        "from wyvern.data import PLANFORM_CONFIGS; "
+        "print(PLANFORM_CONFIGS['NF-844-D'].stable_hash())"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == planform.stable_hash()
+
+
+def test_stable_hash_of_equal_ints_and_floats():
+    config = PLANFORM_CONFIGS["NF-844-D"]
+    from_batch = PlanformBatch.from_configs([config]).config(0)
+    assert from_batch == config
+    assert from_batch.stable_hash() == config.stable_hash()
+
+    assert (
+        replace(PARAMS, stability_distance=100).stable_hash()
+        == replace(PARAMS, stability_distance=100.0).stable_hash()
+    )
+    assert replace(PARAMS, short_takeoff=True).stable_hash() != PARAMS.stable_hash()
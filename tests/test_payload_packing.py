@@ -0,0 +1,74 @@
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from wyvern.analysis.payload_packing import (
+    PayloadBay,
+    SpatialHash,
+    feasible_payload_configs,
+    pack_greedy,
+    pack_lattice,
+    payload_fits,
+)
+from wyvern.data import PAYLOADS, PLANFORM_CONFIGS
+from wyvern.layout import planform_span_stations
+
+
+@pytest.fixture
+def bay() -> PayloadBay:
+    df = planform_span_stations(PLANFORM_CONFIGS["NF-844-D"])
+    return PayloadBay.from_span_stations(df, clearance=1.0)
+
+
+def test_spatial_hash_matches_brute_force():
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-50, 50, (2000, 3))
+    index = SpatialHash(points, 7.0)
+    for p in points[:20]:
+        expected = np.flatnonzero(np.linalg.norm(points - p, axis=1) < 12.0)
+        np.testing.assert_array_equal(np.sort(index.near(p, 12.0)), expected)
+
+
+@pytest.mark.parametrize("pack", [pack_lattice, pack_greedy])
+def test_packing_is_valid(bay: PayloadBay, pack):
+    result = pack(bay, (20, 10, 6))
+    assert result.feasible
+
+    radii = PAYLOADS["diameter"].to_numpy()[result.kinds] / 2
+    dist = np.linalg.norm(result.centers[:, None] - result.centers[None], axis=-1)
+    np.fill_diagonal(dist, np.inf)
+    assert np.all(dist >= radii[:, None] + radii[None, :] - 1e-9)
+    for kind, r in enumerate(PAYLOADS["diameter"] / 2):
+        assert np.all(bay.fits(result.centers[result.kinds == kind], r))
+
+
+@pytest.mark.parametrize("kind", range(len(PAYLOADS)))
+def test_fits_never_penetrates(bay: PayloadBay, kind):
+    bay = replace(bay, clearance=0.0)
+    r = PAYLOADS["diameter"].iloc[kind] / 2
+    centers = bay.candidates(r, 5.0)[::60]
+    assert len(centers) > 100
+
+    # no part of an accepted sphere is outside the skin, checked densely
+    rho, phi = np.meshgrid(np.linspace(0, 1, 40), np.linspace(0, 2 * np.pi, 120))
+    dx, dy = np.stack([(rho * np.cos(phi)).ravel(), (rho * np.sin(phi)).ravel()]) * r
+    half = np.sqrt(np.maximum(r**2 - dx**2 - dy**2, 0))
+    top, bot = bay.surfaces(centers[:, :1] + dx, centers[:, 1:2] + dy)
+    assert np.all(centers[:, 2:] + half <= top + 1e-9)
+    assert np.all(centers[:, 2:] - half >= bot - 1e-9)
+
+    # and spheres reaching through by a fraction of a millimetre are rejected
+    lifted = centers.copy()
+    lifted[:, 2] = (top - half).min(axis=1) + 0.1
+    assert not np.any(bay.fits(lifted, r))
+
+
+def test_payload_fits_gates_sweeps():
+    planform = PLANFORM_CONFIGS["NF-844-D"]
+    configs = [(8, n_golf, 4) for n_golf in range(7)] + [(0, 0, 500)]
+
+    assert feasible_payload_configs(planform, configs) == configs[:-1]
+    # tennis balls do not fit the thinner sections of a smaller centerbody
+    thin = replace(planform, centerbody_chord=300, midbody_chord=250)
+    assert not payload_fits(thin, (0, 0, 1))
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from wyvern.data import PLANFORM_CONFIGS
+from wyvern.layout import planform_span_stations, planform_stats
+from wyvern.layout.batch import PlanformBatch
+
+
+@pytest.fixture
+def batch() -> PlanformBatch:
+    return PlanformBatch.from_configs(list(PLANFORM_CONFIGS.values()))
+
+
+def test_planform_batch_span_stations(batch: PlanformBatch):
+    for i, config in enumerate(PLANFORM_CONFIGS.values()):
+        pd.testing.assert_frame_equal(
+            batch.span_stations_frame(i),
+            planform_span_stations(config),
+            check_dtype=False,
+        )
+        assert batch.config(i) == config
+
+
+def test_planform_batch_stats(batch: PlanformBatch):
+    expected = pd.concat([planform_stats(c) for c in PLANFORM_CONFIGS.values()])
+
+    pd.testing.assert_frame_equal(batch.stats_frame(), expected, check_exact=False)
+
+
+def test_planform_batch_broadcasts_sweeps():
+    base = PLANFORM_CONFIGS["NF-844-D"]
+    params = {f: getattr(base, f) for f in base.to_dict if f != "name"}
+    params["wing_taper_ratio"] = np.linspace(0.3, 0.7, 5)
+    batch = PlanformBatch(name="sweep", **params)
+
+    assert len(batch) == 5
+    stats = batch.stats()
+    assert np.all(np.diff(stats["overall_area"]) > 0)
+    for i in [0, 4]:
+        single = planform_stats(batch.config(i))
+        assert stats["overall_aspect_ratio"][i] == pytest.approx(
+            single.overall_aspect_ratio.iloc[0]
+        )
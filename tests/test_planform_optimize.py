@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from wyvern.data import PLANFORM_CONFIGS
+from wyvern.layout import planform_stats
+from wyvern.layout.batch import PLANFORM_FIELDS
+from wyvern.layout.optimize import (
+    PROPERTIES,
+    optimize_planform,
+    planform_properties,
+)
+
+
+@pytest.mark.parametrize("name", list(PLANFORM_CONFIGS))
+def test_planform_properties_and_gradients(name: str):
+    config = PLANFORM_CONFIGS[name]
+    x = np.array([getattr(config, f) for f in PLANFORM_FIELDS], dtype=float)
+    props = planform_properties(x)
+    stats = planform_stats(config).iloc[0]
+
+    for prop in PROPERTIES:
+        value, grad = props[prop]
+        if prop in stats:
+            assert value == pytest.approx(stats[prop])
+
+        steps = np.maximum(np.abs(x), 1.0) * 1e-6
+        fd = [
+            (
+                planform_properties(x + h * e)[prop][0]
+                - planform_properties(x - h * e)[prop][0]
+            )
+            / (2 * h)
+            for h, e in zip(steps, np.eye(len(x)))
+        ]
+        assert grad == pytest.approx(fd, rel=1e-5, abs=1e-9)
+
+
+def test_optimize_planform_hits_targets():
+    config = PLANFORM_CONFIGS["NF-844-D"]
+    result = optimize_planform(
+        config,
+        targets={"overall_area": 0.54, "overall_aspect_ratio": 5.5},
+        constraints={"overall_centroid": (None, 330.0)},
+        free=[
+            "wing_halfspan",
+            "wing_root_chord",
+            "wing_taper_ratio",
+            "wing_root_le_sweep_angle",
+        ],
+    )
+
+    assert result.success
+    stats = planform_stats(result.planform).iloc[0]
+    assert stats.overall_area == pytest.approx(0.54, rel=1e-4)
+    assert stats.overall_aspect_ratio == pytest.approx(5.5, rel=1e-4)
+    assert stats.overall_centroid <= 330.0 + 1e-6
+    # fixed fields are untouched
+    assert result.planform.centerbody_chord == config.centerbody_chord
+    assert 0.05 <= result.planform.wing_taper_ratio <= 1.0
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from scipy.integrate import trapezoid
+
+from wyvern.analysis.span_loads import SpanLoad
+from wyvern.analysis.structures.rib_calcs import rib_loading
+from wyvern.data import PLANFORM_CONFIGS
+from wyvern.layout import planform_span_stations
+from wyvern.utils.geom_utils import mirror_verts
+
+
+@pytest.fixture
+def stations():
+    return planform_span_stations(PLANFORM_CONFIGS["NF-844-D"])
+
+
+def test_elliptic_span_load():
+    span, weight = 1.7, 16.0
+    load = SpanLoad.elliptic(span)
+
+    assert load(0.0, weight) == pytest.approx(4 * weight / (np.pi * span), rel=1e-3)
+    assert load(span / 2, weight) == pytest.approx(0.0)
+
+
+def test_planform_span_loads(stations):
+    half_span = stations.Y.max() * 1e-3
+    y = np.linspace(-half_span, half_span, 401)
+    total_lift = np.array([16.0, 16.0 * 3.59])
+
+    for load in [SpanLoad.trapezoidal(stations), SpanLoad.schrenk(stations)]:
+        ell = load.evaluate(y, total_lift)
+        assert ell.shape == (2, len(y))
+        assert trapezoid(ell, y) == pytest.approx(total_lift, rel=1e-3)
+        assert ell[:, ::-1] == pytest.approx(ell)
+
+    # Schrenk lies between the trapezoidal and elliptic loads
+    schrenk = SpanLoad.schrenk(stations)(y)
+    trapezoidal = SpanLoad.trapezoidal(stations)(y)
+    elliptic = SpanLoad.elliptic(2 * half_span)(y)
+    assert np.all(schrenk <= np.maximum(trapezoidal, elliptic) + 1e-9)
+    assert np.all(schrenk >= np.minimum(trapezoidal, elliptic) - 1e-9)
+
+
+# quad meets the kinks of the planform
+@pytest.mark.filterwarnings("ignore::scipy.integrate.IntegrationWarning")
+def test_span_load_rib_loads(stations):
+    load = SpanLoad.schrenk(stations)
+    rib_y = mirror_verts(np.linspace(0, stations.Y.max(), 8)) * 1e-3
+
+    rib_force = load.rib_loads(rib_y, [16.0, 32.0])
+
+    assert rib_force.sum(axis=-1) == pytest.approx([16.0, 32.0])
+    assert rib_force[0] == pytest.approx(
+        rib_loading(lambda y: load(y, 16.0), rib_y), rel=1e-5
+    )
+
+
+def test_span_load_extrapolation_is_consistent():
+    # nonzero at the ends of the data, ribs reaching past them
+    load = SpanLoad([-0.5, 0.0, 0.5], [1.0, 2.0, 1.0])
+    rib_y = np.array([-0.8, -0.4, 0.0, 0.4, 0.8])
+
+    assert load([-1.0, 1.0]) == pytest.approx(load([-0.5, 0.5]))
+    assert load.rib_loads(rib_y, 10.0)[0] == pytest.approx(
+        rib_loading(lambda y: load(y, 10.0), rib_y)
+    )
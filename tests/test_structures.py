@@ -0,0 +1,247 @@
+import numpy as np
+import pytest
+
+from wyvern.analysis.structures.abstractions import (
+    RibControlPoints,
+    SparControlPoints,
+    Structure,
+)
+from wyvern.analysis.structures.aeroelastic import static_aeroelastic
+from wyvern.analysis.structures.fem import (
+    WingBoxFE,
+    assemble,
+    beam_element_stiffness,
+)
+from wyvern.analysis.structures.modal import (
+    beam_element_mass,
+    modal_analysis,
+    modal_analysis_batch,
+)
+from wyvern.analysis.structures.rib_calcs import (
+    get_section_coords,
+    rib_loading,
+    rib_loading_tabulated,
+    spar_heights,
+)
+from wyvern.analysis.structures.sizing import (
+    BALSA_STOCK_INCHES,
+    StructuralSizingProblem,
+)
+from wyvern.analysis.structures.spar_calcs import (
+    beam_derivatives,
+    beam_derivatives_batch,
+)
+from wyvern.utils.geom_utils import mirror_verts
+
+
+@pytest.fixture
+def structure() -> Structure:
+    # FDR structure
+    rib = RibControlPoints(
+        y=np.array([0, 92.5, 185, 850]),
+        c=np.array([780, 600.0, 400, 120]),
+        xle=np.array([0, 120.0, 215, 598]),
+        twist=np.array([0, 0, 0, 5.0]),
+        sections=None,
+    )
+    spar_1 = SparControlPoints(y=np.array([0.0, 850.0]), x=np.array([195.0, 628.0]))
+    spar_2 = SparControlPoints(y=np.array([185.0, 850.0]), x=np.array([515.0, 688.0]))
+    rib_t_inches = np.array([1 / 4] + [1 / 16] * 7)
+    y = mirror_verts(np.array([0, 92.5, 185, 318, 451, 584, 717, 850])) * 1e-3
+
+    return Structure.from_structure(y, rib, rib_t_inches, spar_1, spar_2)
+
+
+def test_spar_heights_matches_per_rib_sections(structure: Structure):
+    rib = structure.rib
+    spar_xs = np.stack([spar.x for spar in structure.spars])
+
+    tops, bots = spar_heights(rib.c, rib.xle, spar_xs, rib.twist, rib.sections)
+
+    assert tops.shape == bots.shape == (2, len(rib))
+    # sections are resampled onto a common grid, so allow 0.1 mm
+    for i in range(len(rib)):
+        airfoil = get_section_coords(rib.sections[i], rib.c[i], rib.twist[i])
+        for j in range(2):
+            x = spar_xs[j, i] - rib.xle[i]
+            assert tops[j, i] == pytest.approx(
+                np.interp(x, airfoil.x_top, airfoil.y_top), abs=1e-4
+            )
+            assert bots[j, i] == pytest.approx(
+                np.interp(x, airfoil.x_bot, airfoil.y_bot), abs=1e-4
+            )
+
+
+def test_rib_loading_tabulated_matches_quadrature(structure: Structure):
+    y_data = np.linspace(-0.8, 0.8, 41)
+    lift_data = 20 * np.sqrt(1 - (y_data / 0.85) ** 2)
+    load_factors = np.array([1.0, 2.0, 3.59])
+
+    rib_force = rib_loading_tabulated(
+        y_data, load_factors[:, None] * lift_data, structure.rib.y
+    )
+
+    assert rib_force.shape == (3, len(structure.rib))
+    for n, force in zip(load_factors, rib_force):
+        expected = rib_loading(
+            lambda y: np.interp(y, y_data, lift_data) * n, structure.rib.y
+        )
+        assert force == pytest.approx(expected, rel=1e-6)
+
+
+def test_beam_derivatives_uniform_cantilever():
+    # uniform load on each half span: tip deflection q L^4 / (8 E I)
+    q, L, E, b, h = 10.0, 0.85, 2.55e9, 3e-3, 20e-3
+    y = np.linspace(-L, L, 2001)
+
+    bd = beam_derivatives(lambda y: q * np.ones_like(y), y, b, h * np.ones_like(y), E)
+
+    I = b * h**3 / 12
+    assert bd.deflection[-1] == pytest.approx(q * L**4 / (8 * E * I), rel=2e-3)
+    assert bd.bending_moment[1000] == pytest.approx(q * L**2 / 2, rel=2e-3)
+
+
+def test_beam_derivatives_batch_matches_single_calls():
+    y = np.linspace(-0.85, 0.85, 201)
+    ell = np.array([1.0, 3.59])[:, None] * 20 * np.sqrt(1 - (y / 0.86) ** 2)
+    h = np.stack(
+        [np.interp(np.abs(y), [0, 0.85], [0.07, 0.01]), 0.5 * np.ones_like(y) * 0.02]
+    )
+
+    bd = beam_derivatives_batch(ell, y, 3e-3, h, 2.55e9)
+
+    assert bd.shear_force.shape == (2, 201)
+    assert bd.deflection.shape == (2, 2, 201)
+    for i in range(2):
+        for j in range(2):
+            single = beam_derivatives(
+                lambda y_: np.interp(y_, y, ell[i]), y, 3e-3, h[j], 2.55e9
+            )
+            for batched, expected in zip(bd.case(i, j), single):
+                assert batched == pytest.approx(expected)
+
+    envelope = bd.critical_envelope()
+    assert np.all(envelope.deflection_case[:, -1] == 1)
+    assert envelope.bending_stress == pytest.approx(np.abs(bd.bending_stress[1]))
+
+
+def _sizing_problem() -> StructuralSizingProblem:
+    rib = RibControlPoints(
+        y=np.array([0, 92.5, 185, 850]),
+        c=np.array([780, 600.0, 400, 120]),
+        xle=np.array([0, 120.0, 215, 598]),
+        twist=np.array([0, 0, 0, 5.0]),
+        sections=None,
+    )
+    lift_y = np.linspace(-0.85, 0.85, 101)
+    lift = np.array([1.0, 3.59])[:, None] * 12 * np.sqrt(1 - (lift_y / 0.851) ** 2)
+    return StructuralSizingProblem(
+        np.array([0, 92.5, 185, 318, 451, 584, 717, 850]),
+        rib,
+        np.array([0.0, 850.0]),
+        np.array([185.0, 850.0]),
+        lift_y,
+        lift,
+    )
+
+
+def test_structural_sizing_picks_stock_and_improves_layout():
+    problem = _sizing_problem()
+
+    hand = problem.size([195.0, 628.0], [515.0, 688.0])
+    best = problem.optimize(
+        [np.linspace(150, 250, 3), np.linspace(600, 650, 3)],
+        [np.linspace(450, 550, 3), np.linspace(660, 700, 3)],
+    )
+
+    assert np.isfinite(hand.mass)
+    assert np.all(np.isin(hand.rib_t_inches, BALSA_STOCK_INCHES))
+    assert best.mass <= hand.mass
+
+
+def test_structural_sizing_rejects_all_infeasible_layouts():
+    problem = _sizing_problem()
+    # the second spar ahead of the first everywhere
+    spar_1 = [np.linspace(450, 550, 2), np.linspace(660, 700, 2)]
+    spar_2 = [np.linspace(150, 250, 2), np.linspace(600, 650, 2)]
+    assert np.isinf(problem.size([450.0, 660.0], [150.0, 600.0]).mass)
+
+    with pytest.raises(ValueError, match="No feasible spar layout"):
+        problem.optimize(spar_1, spar_2)
+
+
+def test_wing_box_fe_statics(structure: Structure):
+    y = structure.rib.y
+    rib_force = np.array([1.0, 3.59])[:, None] * np.interp(np.abs(y), [0, 0.85], [3, 1])
+
+    result = WingBoxFE(structure, 3.175e-3).solve(rib_force)
+    root = np.argmin(np.abs(result.y))
+    right = y > 0
+
+    # spars share the outboard load and its moment about the root
+    assert result.shear_force[:, :, root, 0].sum(axis=-1) == pytest.approx(
+        rib_force[:, right].sum(axis=-1)
+    )
+    assert result.bending_moment[:, :, root, 0].sum(axis=-1) == pytest.approx(
+        (rib_force[:, right] * y[right]).sum(axis=-1)
+    )
+    # linear in the load
+    assert result.deflection[1] == pytest.approx(3.59 * result.deflection[0])
+    assert np.all(result.deflection[:, :, -1] > 0)
+
+
+def test_beam_element_mass_uniform_cantilever():
+    n, L, EI, m = 20, 1.0, 2.0, 0.5
+    le = np.full(n, L / n)
+    dofs = 2 * np.arange(n)[:, None] + np.arange(4)
+    K = assemble([(beam_element_stiffness(EI, le), dofs)], 2 * (n + 1))
+    M = assemble([(beam_element_mass(m, le), dofs)], 2 * (n + 1))
+
+    free = np.arange(2, 2 * (n + 1))
+    K, M = K[free][:, free].toarray(), M[free][:, free].toarray()
+    omega = np.sqrt(np.sort(np.linalg.eigvals(np.linalg.solve(M, K)).real)[:2])
+
+    assert omega == pytest.approx(
+        np.array([1.8751, 4.6941]) ** 2 * np.sqrt(EI / (m * L**4)), rel=1e-4
+    )
+
+
+def test_modal_analysis(structure: Structure):
+    result = modal_analysis(structure, n_modes=4)
+
+    assert np.all(np.diff(result.frequencies) > 0)
+    assert result.mode_types[0] == "bending"
+    assert "torsion" in result.mode_types
+    assert result.mode_shapes.shape == (4, 2, len(result.y), 3)
+
+    frequencies, mode_types = modal_analysis_batch(
+        [structure, structure], [3.175e-3, 2 * 3.175e-3], n_modes=4
+    )
+    assert frequencies[0] == pytest.approx(result.frequencies)
+    assert list(mode_types[0]) == result.mode_types
+    # wider spars are stiffer and heavier in proportion; the ribs are not
+    assert frequencies[1, 0] > frequencies[0, 0]
+
+
+def test_static_aeroelastic(structure: Structure):
+    fe = WingBoxFE(structure, 3.175e-3)
+    y = structure.rib.y
+    rib_force = np.array([1.0, 3.59])[:, None] * np.interp(np.abs(y), [0, 0.85], [3, 1])
+    q = 0.5 * 1.225 * 15**2
+
+    coupled = static_aeroelastic(fe, rib_force, q)
+    picard = static_aeroelastic(fe, rib_force, q, m=0)
+
+    assert coupled.converged
+    assert coupled.iterations < picard.iterations
+    assert coupled.twist == pytest.approx(picard.twist, abs=1e-6)
+    # trimmed to the same total lift
+    assert coupled.rib_force.sum(axis=-1) == pytest.approx(rib_force.sum(axis=-1))
+
+    # consistent: the twist is that of the structure under the coupled loads
+    w = coupled.result.deflection[:, :, fe.rib_nodes]
+    d = fe.spar_x[1] - fe.spar_x[0]
+    assert (w[:, 0] - w[:, 1]) / d == pytest.approx(coupled.twist, abs=1e-6)
+
+    rigid = static_aeroelastic(fe, rib_force, 0.0)
+    assert rigid.rib_force == pytest.approx(rib_force)
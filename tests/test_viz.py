@@ -0,0 +1,44 @@
+from dataclasses import replace
+
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use("Agg")
+
+from matplotlib import pyplot as plt  # noqa: E402
+from matplotlib.backend_bases import TimerBase  # noqa: E402
+
+from wyvern.data import PLANFORM_CONFIGS  # noqa: E402
+from wyvern.layout.batch import PlanformBatch  # noqa: E402
+from wyvern.layout.viz import _build_planform_tuner, _outline_points  # noqa: E402
+
+
+@pytest.fixture
+def immediate_timers(monkeypatch):
+    # Agg has no event loop; fire the coalescing timer as soon as it starts
+    monkeypatch.setattr(TimerBase, "_timer_start", lambda self: self._on_timer())
+
+
+def test_planform_tuner_redraws_on_slider_change(immediate_timers):
+    config = replace(PLANFORM_CONFIGS["NF-844-D"])
+    with plt.rc_context():
+        fig, sliders, attrs = _build_planform_tuner(config)
+    try:
+        fig.canvas.draw()
+        planform_line = fig.axes[0].lines[0]
+        tip_before = np.max(planform_line.get_xdata())
+
+        slider = sliders[attrs.index("wing_halfspan")]
+        slider.set_val(slider.val + 50)
+        # the config follows the (snapped) slider values
+        assert config.wing_halfspan == slider.val
+        assert np.max(planform_line.get_xdata()) == pytest.approx(tip_before + 50)
+
+        outline, _ = _outline_points(
+            PlanformBatch.from_configs([config]).span_stations()
+        )
+        np.testing.assert_allclose(planform_line.get_xdata(), outline[:, 0])
+        np.testing.assert_allclose(planform_line.get_ydata(), outline[:, 1])
+    finally:
+        plt.close(fig)
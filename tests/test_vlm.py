@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from wyvern.analysis.vlm import VortexLattice
+from wyvern.data import PLANFORM_CONFIGS
+from wyvern.layout import planform_span_stations
+
+
+@pytest.fixture
+def rectangular_wing() -> pd.DataFrame:
+    # AR 10, elevons on the outer 1/3 of the chord
+    return pd.DataFrame(
+        {
+            "Y": [0, 100, 200, 300, 400, 1000.0],
+            "XLE": [0.0] * 6,
+            "chord": [200.0] * 6,
+            "XTE": [200.0] * 6,
+            "hinge_line": [np.nan, np.nan, np.nan, 150, 150, np.nan],
+        },
+        index=[
+            "center",
+            "midbody",
+            "wing_root",
+            "ctrl_surface_start",
+            "ctrl_surface_end",
+            "wing_tip",
+        ],
+    )
+
+
+def test_vlm_rectangular_wing(rectangular_wing: pd.DataFrame):
+    vlm = VortexLattice(rectangular_wing, n_chord=4)
+    result = vlm.solve([0.0, 5.0])
+
+    aspect_ratio = vlm.b_ref**2 / vlm.s_ref
+    assert aspect_ratio == pytest.approx(10)
+    assert result.CL[0] == pytest.approx(0, abs=1e-12)
+
+    # lifting line: 2 pi AR / (AR + 2)
+    CL_alpha = result.CL[1] / np.deg2rad(5)
+    assert CL_alpha == pytest.approx(2 * np.pi * 10 / 12, rel=0.1)
+    e = result.CL[1] ** 2 / (np.pi * aspect_ratio * result.CDi[1])
+    assert 0.9 < e < 1.0
+
+    # thin airfoil theory: the neutral point is at the quarter chord
+    assert vlm.neutral_point() == pytest.approx(0.05, abs=0.005)
+
+
+def test_vlm_many_cases_match_single_solves():
+    vlm = VortexLattice(planform_span_stations(PLANFORM_CONFIGS["NF-844-D"]))
+
+    alpha = np.array([0.0, 4.0, 4.0, 4.0])
+    elevator = np.array([0.0, 0.0, -5.0, 0.0])
+    aileron = np.array([0.0, 0.0, 0.0, 5.0])
+    batch = vlm.solve(alpha, elevator=elevator, aileron=aileron)
+
+    for i in range(len(alpha)):
+        single = vlm.solve(alpha[i], elevator=elevator[i], aileron=aileron[i])
+        assert batch.CL[i] == pytest.approx(single.CL[0])
+        assert batch.Cm[i] == pytest.approx(single.Cm[0])
+        assert batch.cl_c[i] == pytest.approx(single.cl_c[0])
+
+    # trailing edge up: less lift, nose up
+    assert batch.CL[2] < batch.CL[1]
+    assert batch.Cm[2] > batch.Cm[1]
+    # ailerons roll without changing the lift, to first order
+    assert batch.Cl[1] == pytest.approx(0, abs=1e-12)
+    assert batch.Cl[3] < 0
+    assert batch.CL[3] == pytest.approx(batch.CL[1], rel=1e-3)
@@ -0,0 +1,228 @@
+"""
+Many parameter sets of one type, stored as columns.
+
+A `ParameterTable` holds one aligned array per field of a parameters
+dataclass, so variants are built with array operations instead of one
+dataclass object per variant. Rows are lightweight views that read the
+columns on attribute access.
+"""
+
+import json
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Generic, Iterable, Iterator, TypeVar
+
+import numpy as np
+import numpy.typing as npt
+
+from wyvern.analysis.parameters import (
+    SerializableParameters,
+    _field_names,
+    _from_builtin,
+    _nested_types,
+    _to_builtin,
+)
+
+P = TypeVar("P", bound=SerializableParameters)
+
+
+def _as_column(values: Any, n: int = None) -> np.ndarray:
+    """
+    Values as a 1d column; scalars are repeated `n` times. Numbers and
+    booleans get numeric arrays, anything else (e.g. nested models) an
+    object array.
+    """
+    if isinstance(values, np.ndarray) and values.ndim == 1:
+        return values
+    if isinstance(values, (list, tuple)):
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+    else:
+        column = np.empty(1 if n is None else n, dtype=object)
+        column[:] = [values] * len(column)
+    if all(isinstance(v, (bool, int, float, np.number, np.bool_)) for v in column):
+        return np.array(column.tolist())
+    return column
+
+
+def _item(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class ParameterRow(Generic[P]):
+    """
+    View of one row of a `ParameterTable`; reads like the parameters
+    dataclass without building one.
+    """
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table: "ParameterTable[P]", index: int):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        # private and special names are never fields; this also keeps
+        # pickle and copy from recursing before the slots are set
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            column = self._table.columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return _item(column[self._index])
+
+    def __reduce__(self):
+        return ParameterRow, (self._table, self._index)
+
+    def __repr__(self) -> str:
+        return f"ParameterRow({self._table.cls.__name__}, {self._index})"
+
+    def to_params(self) -> P:
+        """
+        The row as a parameters dataclass.
+        """
+        return self._table.cls(
+            **{name: getattr(self, name) for name in self._table.fields}
+        )
+
+
+class ParameterTable(Generic[P]):
+    """
+    Parameter sets of type `cls`, one aligned array per field.
+
+    cls: parameters dataclass
+    columns: {field: values} for every field of `cls`
+    """
+
+    def __init__(self, cls: type[P], columns: dict[str, Any]):
+        self.cls = cls
+        self.fields = _field_names(cls)
+        missing = set(self.fields) - set(columns)
+        if missing:
+            raise ValueError(f"Missing columns {missing} for {cls.__name__}.")
+        unknown = set(columns) - set(self.fields)
+        if unknown:
+            raise ValueError(f"{cls.__name__} has no fields {unknown}.")
+
+        arrays = {name: _as_column(columns[name]) for name in self.fields}
+        n = max(len(a) for a in arrays.values())
+        for name, a in arrays.items():
+            if len(a) == 1 and n > 1:
+                arrays[name] = np.repeat(a, n)
+            elif len(a) != n:
+                raise ValueError(f"Column {name} has {len(a)} rows, expected {n}.")
+        self.columns = arrays
+
+    @classmethod
+    def from_params(cls, params: Iterable[P]) -> "ParameterTable[P]":
+        """
+        Table of the given parameter sets, all of one type.
+        """
+        params = list(params)
+        param_cls = type(params[0])
+        return cls(
+            param_cls,
+            {f: [getattr(p, f) for p in params] for f in _field_names(param_cls)},
+        )
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values())))
+
+    def __getitem__(self, index: int) -> ParameterRow[P]:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return ParameterRow(self, index % len(self))
+
+    def __iter__(self) -> Iterator[ParameterRow[P]]:
+        return (ParameterRow(self, i) for i in range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"ParameterTable({self.cls.__name__}, {len(self)} rows)"
+
+    def column(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def to_params(self) -> list[P]:
+        """
+        Every row as a parameters dataclass.
+        """
+        return [row.to_params() for row in self]
+
+    def with_column(self, name: str, values: Any) -> "ParameterTable[P]":
+        """
+        Copy with one field replaced; `values` is a scalar or a column. A
+        single-row table broadcasts to the length of `values`.
+        """
+        return self.replace(**{name: values})
+
+    def replace(self, **changes: Any) -> "ParameterTable[P]":
+        """
+        Copy with the given fields replaced, like `dataclasses.replace` for
+        every row at once.
+        """
+        columns = dict(self.columns)
+        columns.update({name: _as_column(v, len(self)) for name, v in changes.items()})
+        return ParameterTable(self.cls, columns)
+
+    def product(self, **sweeps: Iterable) -> "ParameterTable[P]":
+        """
+        Every row combined with every combination of the swept values, the
+        last sweep varying fastest.
+        """
+        values = [_as_column(list(v)) for v in sweeps.values()]
+        grids = np.meshgrid(
+            np.arange(len(self)), *(np.arange(len(v)) for v in values), indexing="ij"
+        )
+        rows, *picks = (g.ravel() for g in grids)
+
+        columns = {name: column[rows] for name, column in self.columns.items()}
+        for name, column, pick in zip(sweeps, values, picks):
+            columns[name] = column[pick]
+        return ParameterTable(self.cls, columns)
+
+    def take(self, indices: npt.ArrayLike) -> "ParameterTable[P]":
+        """
+        Rows at `indices` (or a boolean mask), as a new table.
+        """
+        return ParameterTable(
+            self.cls, {name: c[indices] for name, c in self.columns.items()}
+        )
+
+    def to_jsonl(self, f: str | Path | IO[str]) -> None:
+        """
+        Write one compact JSON object per row, row by row.
+        """
+        if isinstance(f, (str, Path)):
+            with open(f, "w") as fh:
+                return self.to_jsonl(fh)
+
+        columns = [self.columns[name] for name in self.fields]
+        for values in zip(*columns):
+            row = {n: _to_builtin(_item(v)) for n, v in zip(self.fields, values)}
+            f.write(json.dumps(row, separators=(",", ":")))
+            f.write("\n")
+
+    @classmethod
+    def from_jsonl(
+        cls, param_cls: type[P], f: str | Path | IO[str], limit: int = None
+    ) -> "ParameterTable[P]":
+        """
+        Read rows written by `to_jsonl`, line by line, into columns; nested
+        models are rebuilt from their type hints. At most `limit` rows.
+        """
+        if isinstance(f, (str, Path)):
+            with open(f) as fh:
+                return cls.from_jsonl(param_cls, fh, limit)
+
+        fields = _field_names(param_cls)
+        nested = _nested_types(param_cls)
+        columns = {name: [] for name in fields}
+        for line in islice((line for line in f if line.strip()), limit):
+            row = json.loads(line)
+            for name in fields:
+                value = row[name]
+                if name in nested and isinstance(value, dict):
+                    value = _from_builtin(nested[name], value)
+                columns[name].append(value)
+        return cls(param_cls, columns)
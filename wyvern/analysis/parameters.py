@@ -1,30 +1,107 @@
+import hashlib
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from typing import Any, get_type_hints
+
+import numpy as np
 
 from wyvern.performance.models import QuadraticLDModel
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls) if f.init)
+
+
+@lru_cache(maxsize=None)
+def _nested_types(cls: type) -> dict[str, type]:
+    # fields holding dataclasses, which from_dict rebuilds from dicts
+    hints = get_type_hints(cls)
+    return {
+        name: hints[name]
+        for name in _field_names(cls)
+        if isinstance(hints.get(name), type) and is_dataclass(hints[name])
+    }
+
+
+_SCALARS = frozenset({float, int, str, bool, type(None)})
+
+
+def _to_builtin(value: Any) -> Any:
+    """
+    JSON-compatible form of a field value; only dataclasses, sequences and
+    numpy values are converted, everything else is returned as is.
+    """
+    cls = type(value)
+    if cls in _SCALARS:
+        return value
+    if hasattr(cls, "__dataclass_fields__"):
+        return {name: _to_builtin(getattr(value, name)) for name in _field_names(cls)}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(v) for v in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+def _canonical(value: Any) -> Any:
+    # numbers that compare equal hash equal: 185 == 185.0
+    if type(value) is int:
+        return float(value)
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_canonical(v) for v in value]
+    return value
+
+
+def _from_builtin(cls: type, d: dict) -> Any:
+    nested = _nested_types(cls)
+    kwargs = {
+        k: (_from_builtin(nested[k], v) if k in nested and isinstance(v, dict) else v)
+        for k, v in d.items()
+    }
+    return cls(**kwargs)
+
+
 @dataclass
 class SerializableParameters:
     """
     Base class for serializable parameters
+
+    Nested dataclass fields (e.g. `QuadraticLDModel`) serialize to dicts and
+    are rebuilt from their type hints.
     """
 
     @property
-    def to_dict(self):
-        return asdict(self)
+    def to_dict(self) -> dict[str, Any]:
+        return _to_builtin(self)
 
     @classmethod
     def from_dict(cls, d):
-        return cls(**d)
+        return _from_builtin(cls, d)
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict)
+        return json.dumps(self.to_dict, separators=(",", ":"))
 
     @classmethod
     def from_json(cls, s: str):
         return cls.from_dict(json.loads(s))
 
+    def stable_hash(self) -> str:
+        """
+        Content hash, equal for equal parameters across processes and
+        sessions (unlike `hash`); e.g. a cache key. Integers hash as the
+        equal floats.
+        """
+        canonical = json.dumps(
+            [type(self).__qualname__, _canonical(self.to_dict)],
+            separators=(",", ":"),
+            sort_keys=True,
+        )
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
 
 @dataclass
 class PayloadSizingParameters(SerializableParameters):
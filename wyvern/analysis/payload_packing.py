@@ -0,0 +1,481 @@
+"""
+Payload bay packing.
+
+Checks that a payload configuration (number of each of the `PAYLOADS`)
+physically fits inside the centerbody by placing the balls as spheres in
+the cavity between the upper and lower surfaces of the centerbody sections.
+The heuristics only ever place non-overlapping spheres that `PayloadBay.fits`
+accepts, so a configuration they pack fits; one they cannot pack may still
+fit.
+
+Lengths in mm; x aft from the nose, y to starboard, z up.
+"""
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from itertools import product
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from wyvern.analysis.parameters import PlanformParameters
+from wyvern.data.airfoils import NACA0018
+from wyvern.data.payloads import PAYLOADS
+from wyvern.layout.batch import PLANFORM_FIELDS
+from wyvern.layout.planform import planform_span_stations
+from wyvern.utils.airfoil_utils import resample_airfoil
+
+
+@dataclass
+class PayloadBay:
+    """
+    Centerbody cavity, the sections between the center and wing root
+    stations.
+
+    y, xle, chord: center, midbody and wing root stations (mm)
+    x_c, z_top, z_bot: unit-chord section surfaces
+    clearance: minimum gap between the balls and the skin (mm)
+
+    Chord and leading edge vary linearly between the stations and the
+    surfaces linearly between the section points, so the skin is made of
+    flat facets, one per station interval, surface and section interval.
+    """
+
+    y: npt.NDArray[np.floating]
+    xle: npt.NDArray[np.floating]
+    chord: npt.NDArray[np.floating]
+    x_c: npt.NDArray[np.floating]
+    z_top: npt.NDArray[np.floating]
+    z_bot: npt.NDArray[np.floating]
+    clearance: float = 0.0
+
+    @classmethod
+    def from_span_stations(
+        cls,
+        df: pd.DataFrame,
+        section: npt.NDArray[np.floating] = NACA0018,
+        clearance: float = 0.0,
+    ) -> "PayloadBay":
+        """
+        df: span stations (mm), from `planform_span_stations`
+        section: unit-chord section coordinates of the centerbody
+        """
+        stations = df.loc[["center", "midbody", "wing_root"]]
+        x_c, z_top, z_bot = resample_airfoil(section)
+        return cls(
+            stations.Y.to_numpy(dtype=float),
+            stations.XLE.to_numpy(dtype=float),
+            stations.chord.to_numpy(dtype=float),
+            x_c,
+            z_top,
+            z_bot,
+            clearance,
+        )
+
+    @property
+    def bounds(self) -> npt.NDArray[np.floating]:
+        """
+        Bounding box of the cavity, [[x, y, z] min, [x, y, z] max].
+        """
+        c = self.chord.max()
+        return np.array(
+            [
+                [self.xle.min(), -self.y[-1], self.z_bot.min() * c],
+                [(self.xle + self.chord).max(), self.y[-1], self.z_top.max() * c],
+            ]
+        )
+
+    def surfaces(
+        self, x: npt.ArrayLike, y: npt.ArrayLike
+    ) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
+        """
+        Upper and lower skin heights at (x, y); outside the cavity the upper
+        skin is -inf and the lower +inf, so nothing fits there.
+        """
+        x, y = np.broadcast_arrays(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        )
+        y_abs = np.abs(y)
+        chord = np.interp(y_abs, self.y, self.chord)
+        x_c = (x - np.interp(y_abs, self.y, self.xle)) / chord
+
+        inside = (x_c >= 0) & (x_c <= 1) & (y_abs <= self.y[-1])
+        top = np.where(inside, np.interp(x_c, self.x_c, self.z_top) * chord, -np.inf)
+        bot = np.where(inside, np.interp(x_c, self.x_c, self.z_bot) * chord, np.inf)
+        return top, bot
+
+    @cached_property
+    def _facets(self) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
+        """
+        Outward unit normals n and offsets d of the skin facets, inside
+        where n . p <= d; shapes (n_intervals, 2, n_facets, 3) and
+        (n_intervals, 2, n_facets) over the station intervals, starboard and
+        port, and the upper surface facets, lower surface facets, leading
+        edge and trailing edge.
+        """
+        # chord and leading edge c0 + c1 |y|, l0 + l1 |y| on each interval
+        c1 = np.diff(self.chord) / np.diff(self.y)
+        l1 = np.diff(self.xle) / np.diff(self.y)
+        c0 = self.chord[:-1] - c1 * self.y[:-1]
+        l0 = self.xle[:-1] - l1 * self.y[:-1]
+
+        def surface(z):
+            # z = a + b x/c on each section interval, so on each facet
+            # z = b x + (a c1 - b l1) |y| + a c0 - b l0
+            b = np.diff(z) / np.diff(self.x_c)
+            a = z[:-1] - b * self.x_c[:-1]
+            return (
+                np.broadcast_to(b, (len(c1), len(b))),
+                a * c1[:, None] - b * l1[:, None],
+                a * c0[:, None] - b * l0[:, None],
+            )
+
+        bt, yt, dt = surface(self.z_top)
+        bb, yb, db = surface(self.z_bot)
+        ones = np.ones_like(bt)
+        normals = np.concatenate(
+            [
+                np.stack([-bt, -yt, ones], axis=-1),
+                np.stack([bb, yb, -ones], axis=-1),
+                np.stack([-np.ones_like(l1), l1, 0 * l1], axis=-1)[:, None],
+                np.stack([np.ones_like(l1), -l1 - c1, 0 * l1], axis=-1)[:, None],
+            ],
+            axis=1,
+        )
+        offsets = np.concatenate([dt, -db, -l0[:, None], (l0 + c0)[:, None]], axis=1)
+
+        # port facets mirror the starboard ones
+        normals = np.stack([normals, normals * [1, -1, 1]], axis=1)
+        offsets = np.stack([offsets, offsets], axis=1)
+        norm = np.linalg.norm(normals, axis=-1)
+        return normals / norm[..., None], offsets / norm
+
+    def fits(
+        self, centers: npt.NDArray[np.floating], radius: float
+    ) -> npt.NDArray[np.bool_]:
+        """
+        Whether spheres at `centers` (n, 3) lie inside the cavity.
+
+        Each sphere is checked against the planes of the facets under its
+        footprint's bounding box, which is exact where the cavity is convex
+        and conservative elsewhere, so a sphere that fits never reaches
+        through the skin.
+        """
+        r = radius + self.clearance
+        normals, offsets = self._facets
+        n_sections = len(self.x_c) - 1
+        x, y = centers[:, 0], centers[:, 1]
+        ok = np.abs(y) + r <= self.y[-1]
+
+        for i, side in product(range(len(self.y) - 1), range(2)):
+            sign = 1 - 2 * side
+            lo, hi = sorted([sign * self.y[i], sign * self.y[i + 1]])
+            y_lo, y_hi = np.maximum(y - r, lo), np.minimum(y + r, hi)
+            touching = np.flatnonzero(ok & (y_lo <= y_hi))
+            if len(touching) == 0:
+                continue
+
+            # x/c is monotonic in x and in y along the interval, so its range
+            # over the box is reached at the corners
+            ends = np.abs(np.stack([y_lo[touching], y_hi[touching]]))
+            chord = np.interp(ends, self.y, self.chord)
+            xle = np.interp(ends, self.y, self.xle)
+            u_lo = ((x[touching] - r - xle) / chord).min(axis=0)
+            u_hi = ((x[touching] + r - xle) / chord).max(axis=0)
+            first = np.clip(np.searchsorted(self.x_c[1:], u_lo), 0, n_sections - 1)
+            last = np.clip(
+                np.searchsorted(self.x_c[:-1], u_hi, side="right") - 1,
+                first,
+                n_sections - 1,
+            )
+
+            # facets of the section intervals first..last on both surfaces,
+            # then the leading and trailing edges
+            span = first[:, None] + np.arange((last - first).max() + 1)
+            used = span <= last[:, None]
+            span = np.minimum(span, last[:, None])
+            edges = np.broadcast_to(
+                [2 * n_sections, 2 * n_sections + 1], (len(span), 2)
+            )
+            facets = np.concatenate([span, span + n_sections, edges], axis=1)
+            used = np.concatenate([used, used, np.ones_like(edges, dtype=bool)], axis=1)
+
+            n, d = normals[i, side][facets], offsets[i, side][facets]
+            gap = d - np.einsum("nfk,nk->nf", n, centers[touching])
+            ok[touching] = np.all(~used | (gap >= r), axis=1)
+
+        return ok
+
+    def candidates(self, radius: float, resolution: float) -> npt.NDArray:
+        """
+        Centers on a regular grid of spacing `resolution` where a sphere of
+        `radius` fits, shape (n, 3).
+        """
+        lo, hi = self.bounds
+        axes = [
+            np.arange(lo[i] + radius, hi[i] - radius + 1e-9, resolution)
+            for i in range(3)
+        ]
+        grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+
+        # cheap necessary check at the center before sampling the footprint
+        top, bot = self.surfaces(grid[:, 0], grid[:, 1])
+        r = radius + self.clearance
+        grid = grid[(grid[:, 2] + r <= top) & (grid[:, 2] - r >= bot)]
+        return grid[self.fits(grid, radius)]
+
+
+class SpatialHash:
+    """
+    Points bucketed into cubic cells, for fast neighbour queries.
+    """
+
+    def __init__(self, points: npt.NDArray[np.floating], cell: float):
+        self.points = points
+        self.cell = cell
+        keys = np.floor(points / cell).astype(np.int64)
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        order = np.argsort(inverse.ravel(), kind="stable")
+        splits = np.cumsum(np.bincount(inverse.ravel(), minlength=len(unique)))[:-1]
+        self.cells = {
+            tuple(key): idx for key, idx in zip(unique, np.split(order, splits))
+        }
+
+    def near(self, point: npt.NDArray[np.floating], radius: float) -> npt.NDArray:
+        """
+        Indices of the points closer than `radius` to `point`.
+        """
+        reach = int(np.ceil(radius / self.cell))
+        key = np.floor(point / self.cell).astype(np.int64)
+        found = [
+            self.cells[k]
+            for k in product(*(range(c - reach, c + reach + 1) for c in key))
+            if k in self.cells
+        ]
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        idx = np.concatenate(found)
+        dist = np.linalg.norm(self.points[idx] - point, axis=1)
+        return idx[dist < radius]
+
+
+@dataclass
+class PackingResult:
+    """
+    payload_config: number of each payload requested, in `PAYLOADS` order
+    centers: centers of the placed balls (mm), shape (n, 3)
+    kinds: index into `PAYLOADS` of each placed ball, shape (n,)
+    method: heuristic that placed them
+    """
+
+    payload_config: tuple[int, ...]
+    centers: npt.NDArray[np.floating]
+    kinds: npt.NDArray[np.integer]
+    method: str
+
+    @property
+    def placed(self) -> tuple[int, ...]:
+        counts = np.bincount(self.kinds, minlength=len(self.payload_config))
+        return tuple(int(c) for c in counts)
+
+    @property
+    def feasible(self) -> bool:
+        return self.placed == tuple(self.payload_config)
+
+
+def _not_overlapping(candidates, radius, centers, radii) -> npt.NDArray[np.bool_]:
+    if len(centers) == 0:
+        return np.ones(len(candidates), dtype=bool)
+    dist = np.linalg.norm(candidates[:, None, :] - centers[None, :, :], axis=-1)
+    return np.all(dist >= radius + radii[None, :], axis=1)
+
+
+def _bottom_first(sites: npt.NDArray[np.floating]) -> npt.NDArray:
+    # fill from the floor up, fore to aft, centerline out
+    return sites[np.lexsort((np.abs(sites[:, 1]), sites[:, 0], sites[:, 2]))]
+
+
+def _fore_first(sites: npt.NDArray[np.floating]) -> npt.NDArray:
+    return sites[np.lexsort((sites[:, 2], np.abs(sites[:, 1]), sites[:, 0]))]
+
+
+def _hcp_lattice(bounds, spacing: float, phase: npt.NDArray) -> npt.NDArray:
+    """
+    Hexagonal close-packed sites of the given spacing covering `bounds`.
+    """
+    lo, hi = bounds
+    dy = spacing * np.sqrt(3) / 2
+    dz = spacing * np.sqrt(2 / 3)
+    i, j, k = np.meshgrid(
+        np.arange(int((hi[0] - lo[0]) / spacing) + 2),
+        np.arange(int((hi[1] - lo[1]) / dy) + 2),
+        np.arange(int((hi[2] - lo[2]) / dz) + 2),
+        indexing="ij",
+    )
+    x = spacing * (i + (j % 2) / 2 + (k % 2) / 2)
+    y = dy * (j + (k % 2) / 3)
+    z = dz * k
+    sites = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+    return sites + lo + phase * spacing
+
+
+def _pack(
+    bay: PayloadBay,
+    payload_config: Sequence[int],
+    diameters: npt.NDArray[np.floating],
+    sites_for,
+    method: str,
+) -> PackingResult:
+    """
+    Place the payloads largest first at the sites from `sites_for(kind, r)`,
+    in their order, skipping any that overlap a placed ball.
+    """
+    centers = np.empty((0, 3))
+    radii = np.empty(0)
+    kinds = np.empty(0, dtype=np.int64)
+
+    for kind in np.argsort(-diameters, kind="stable"):
+        n, r = int(payload_config[kind]), diameters[kind] / 2
+        if n == 0:
+            continue
+        sites = sites_for(kind, r)
+        sites = sites[_not_overlapping(sites, r, centers, radii)]
+        if len(sites) == 0:
+            continue
+
+        alive = np.ones(len(sites), dtype=bool)
+        index = SpatialHash(sites, 2 * r)
+        chosen = []
+        for _ in range(n):
+            free = np.flatnonzero(alive)
+            if len(free) == 0:
+                break
+            chosen.append(free[0])
+            alive[index.near(sites[free[0]], 2 * r)] = False
+
+        centers = np.concatenate([centers, sites[chosen]])
+        radii = np.concatenate([radii, np.full(len(chosen), r)])
+        kinds = np.concatenate([kinds, np.full(len(chosen), kind)])
+
+    return PackingResult(tuple(int(n) for n in payload_config), centers, kinds, method)
+
+
+def pack_greedy(
+    bay: PayloadBay,
+    payload_config: Sequence[int],
+    resolution: float = 5.0,
+    order=_bottom_first,
+) -> PackingResult:
+    """
+    Greedy packing: each ball goes at the first free grid site in `order`.
+    """
+    diameters = PAYLOADS["diameter"].to_numpy(dtype=float)
+    return _pack(
+        bay,
+        payload_config,
+        diameters,
+        lambda kind, r: order(bay.candidates(r, resolution)),
+        "greedy",
+    )
+
+
+def pack_lattice(
+    bay: PayloadBay, payload_config: Sequence[int], n_phases: int = 3
+) -> PackingResult:
+    """
+    Lattice packing: each payload on a hexagonal close-packed lattice of its
+    diameter, shifted to whichever of `n_phases`^3 offsets fits most balls.
+    """
+    diameters = PAYLOADS["diameter"].to_numpy(dtype=float)
+    phases = np.array(list(product(np.arange(n_phases) / n_phases, repeat=3)))
+
+    def sites_for(kind, r):
+        best = np.empty((0, 3))
+        for phase in phases:
+            sites = _hcp_lattice(bay.bounds, 2 * r, phase)
+            sites = sites[bay.fits(sites, r)]
+            if len(sites) > len(best):
+                best = sites
+        return _bottom_first(best)
+
+    return _pack(bay, payload_config, diameters, sites_for, "lattice")
+
+
+def pack_payload(
+    bay: PayloadBay, payload_config: Sequence[int], resolution: float = 5.0
+) -> PackingResult:
+    """
+    Try the lattice packing, then greedy fills in two orders; returns the
+    first feasible packing, or else the one that placed the most balls.
+    """
+    attempts = [
+        lambda: pack_lattice(bay, payload_config),
+        lambda: pack_greedy(bay, payload_config, resolution, _bottom_first),
+        lambda: pack_greedy(bay, payload_config, resolution, _fore_first),
+    ]
+    best = None
+    for attempt in attempts:
+        result = attempt()
+        if result.feasible:
+            return result
+        if best is None or sum(result.placed) > sum(best.placed):
+            best = result
+    return best
+
+
+def _planform_key(planform: PlanformParameters) -> tuple:
+    return (planform.name,) + tuple(getattr(planform, f) for f in PLANFORM_FIELDS)
+
+
+@lru_cache(maxsize=32)
+def _payload_bay(key: tuple, clearance: float) -> PayloadBay:
+    planform = PlanformParameters(**dict(zip(("name",) + PLANFORM_FIELDS, key)))
+    return PayloadBay.from_span_stations(
+        planform_span_stations(planform), clearance=clearance
+    )
+
+
+@lru_cache(maxsize=4096)
+def _fits(
+    key: tuple, payload_config: tuple[int, ...], clearance: float, resolution: float
+) -> bool:
+    bay = _payload_bay(key, clearance)
+    return pack_payload(bay, payload_config, resolution).feasible
+
+
+def payload_fits(
+    planform: PlanformParameters,
+    payload_config: Sequence[int],
+    clearance: float = 0.0,
+    resolution: float = 5.0,
+) -> bool:
+    """
+    Whether the payload configuration packs into the centerbody of the
+    planform (NACA0018 sections). Results are cached per planform and
+    configuration.
+    """
+    return _fits(
+        _planform_key(planform),
+        tuple(int(n) for n in payload_config),
+        float(clearance),
+        float(resolution),
+    )
+
+
+def feasible_payload_configs(
+    planform: PlanformParameters,
+    payload_configs: Sequence[Sequence[int]],
+    clearance: float = 0.0,
+    resolution: float = 5.0,
+) -> list[tuple[int, ...]]:
+    """
+    The payload configurations that fit the planform, e.g. to gate the
+    configurations of `sweep_payload_configs`.
+    """
+    return [
+        tuple(config)
+        for config in payload_configs
+        if payload_fits(planform, config, clearance, resolution)
+    ]
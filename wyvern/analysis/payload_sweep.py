@@ -2,8 +2,6 @@ from copy import copy
 from typing import Sequence
 
 import pandas as pd
-from matplotlib import pyplot as plt
-from matplotlib import rcParams
 
 from wyvern.analysis.parameters import PayloadSizingParameters
 from wyvern.performance.aerodynamics import cl_required, ld_at_speed, load_factor
@@ -195,6 +193,10 @@ def sensitivity_plot(
 
     saving or showing the figure is the responsibility of the caller.
     """
+    # plotting only; keeps matplotlib out of headless sweeps
+    from matplotlib import pyplot as plt
+    from matplotlib import rcParams
+
     rcParams["text.usetex"] = True
     # use computer modern serif font for all text
     rcParams["font.family"] = "serif"
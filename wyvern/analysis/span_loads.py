@@ -0,0 +1,124 @@
+"""
+Spanwise lift distributions.
+
+Every `SpanLoad` is stored normalized to unit total lift, so a load case is
+just a scale factor (weight x load factor) and many cases evaluate together.
+Spanwise positions are in m over the full span, lift per unit span in N/m.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from scipy.integrate import trapezoid
+
+from wyvern.analysis.structures.rib_calcs import rib_loading_tabulated
+
+
+@lru_cache(maxsize=32)
+def _read_lift_csv(path: Path) -> tuple[np.ndarray, np.ndarray]:
+    data = np.genfromtxt(path, delimiter=",", skip_header=1)
+    y, ell = data[:, 0].copy(), data[:, 1].copy()
+    y.flags.writeable = False
+    ell.flags.writeable = False
+    return y, ell
+
+
+class SpanLoad:
+    """
+    Lift distribution over the full span, piecewise linear between `y` and
+    held at the end values outside them, for both the lift per unit span
+    and the rib loads.
+
+    y: spanwise stations (m), increasing
+    shape: lift per unit span at `y`, any scale; normalized to unit lift
+    """
+
+    def __init__(self, y: npt.ArrayLike, shape: npt.ArrayLike):
+        self.y = np.asarray(y, dtype=float)
+        shape = np.asarray(shape, dtype=float)
+        self.unit = shape / trapezoid(shape, self.y)
+
+    def __call__(
+        self, y: npt.ArrayLike, total_lift: float = 1.0
+    ) -> npt.NDArray[np.floating]:
+        """
+        Lift per unit span at `y` for a total lift; usable as the lift
+        distribution of `rib_loading`.
+        """
+        return total_lift * np.interp(y, self.y, self.unit)
+
+    def evaluate(
+        self, y: npt.ArrayLike, total_lift: npt.ArrayLike
+    ) -> npt.NDArray[np.floating]:
+        """
+        Lift per unit span for every load case, shape (n_cases, n_y).
+        total_lift: total lift of each case (N), e.g. weight x load factor
+        """
+        return np.atleast_1d(total_lift)[:, None] * self(y)[None, :]
+
+    def rib_loads(
+        self, rib_y: npt.ArrayLike, total_lift: npt.ArrayLike
+    ) -> npt.NDArray[np.floating]:
+        """
+        Lift carried by each rib for every load case, shape (n_cases, n_ribs).
+        """
+        lift = np.atleast_1d(total_lift)[:, None] * self.unit[None, :]
+        return rib_loading_tabulated(self.y, lift, np.asarray(rib_y))
+
+    @classmethod
+    def elliptic(cls, span: float, n: int = 201) -> "SpanLoad":
+        """
+        Elliptic lift distribution, on cosine-spaced stations.
+        """
+        theta = np.linspace(np.pi, 0, n)
+        y = span / 2 * np.cos(theta)
+        return cls(y, np.sin(theta))
+
+    @classmethod
+    def trapezoidal(cls, df: pd.DataFrame) -> "SpanLoad":
+        """
+        Lift proportional to the local chord of the planform.
+        df: span stations (mm), from `planform_span_stations`
+        """
+        y, chord = _chord_distribution(df)
+        return cls(y, chord)
+
+    @classmethod
+    def schrenk(cls, df: pd.DataFrame, n: int = 201) -> "SpanLoad":
+        """
+        Schrenk's approximation: the mean of the trapezoidal and an elliptic
+        distribution of the same span and total lift.
+        df: span stations (mm), from `planform_span_stations`
+        """
+        y_c, chord = _chord_distribution(df)
+        elliptic = cls.elliptic(2 * y_c[-1], n)
+
+        y = np.union1d(y_c, elliptic.y)
+        trapezoidal = np.interp(y, y_c, chord / trapezoid(chord, y_c))
+        return cls(y, (trapezoidal + elliptic(y)) / 2)
+
+    @classmethod
+    def from_csv(cls, path: str | Path) -> "SpanLoad":
+        """
+        Tabulated lift distribution (XFLR5 export: y, lift per unit span).
+        Files are read once per session.
+        """
+        return cls(*_read_lift_csv(Path(path)))
+
+
+def _chord_distribution(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Full-span stations and chords (m) of the planform, without the repeated
+    control surface stations.
+    """
+    y_half = df.Y.to_numpy() * 1e-3
+    chord_half = df.chord.to_numpy() * 1e-3
+    y_half, idx = np.unique(y_half, return_index=True)
+    chord_half = chord_half[idx]
+
+    y = np.concatenate([-y_half[:0:-1], y_half])
+    chord = np.concatenate([chord_half[:0:-1], chord_half])
+    return y, chord
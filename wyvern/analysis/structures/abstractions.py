@@ -3,7 +3,7 @@ from dataclasses import dataclass
 import numpy as np
 import numpy.typing as npt
 
-from wyvern.analysis.structures.rib_calcs import spar_height
+from wyvern.analysis.structures.rib_calcs import spar_heights
 from wyvern.data.airfoils import BOEING_VERTOL, NACA0018
 from wyvern.utils.geom_utils import mirror_verts
 
@@ -126,11 +126,9 @@ class Structure:
         spar_1_x = np.interp(y, spar_1.y, spar_1.x)
         spar_2_x = np.interp(y, spar_2.y, spar_2.x)
 
-        spar_1_ztop, spar_1_zbot = spar_height(
-            y, rib_c, rib_xle, spar_1_x, twist, rib_sections
-        )
-        spar_2_ztop, spar_2_zbot = spar_height(
-            y, rib_c, rib_xle, spar_2_x, twist, rib_sections
+        # intersect both spars with every rib at once
+        (spar_1_ztop, spar_2_ztop), (spar_1_zbot, spar_2_zbot) = spar_heights(
+            rib_c, rib_xle, np.stack([spar_1_x, spar_2_x]), twist, rib_sections
         )
 
         return cls(
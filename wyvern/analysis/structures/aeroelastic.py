@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from typing import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from wyvern.analysis.structures.fem import FEResult, W, WingBoxFE
+from wyvern.analysis.structures.rib_calcs import _rib_strip_bounds
+
+
+@dataclass
+class AeroelasticResult:
+    """
+    Converged static aeroelastic state.
+
+    rib_force: lift on each rib including the elastic twist (N),
+        shape (n_cases, n_ribs)
+    twist: elastic twist of each rib, nose up (rad), shape (n_cases, n_ribs)
+    result: structural solution under `rib_force`
+    iterations: number of structural solves
+    converged: whether the twist residual dropped below the tolerance
+    residuals: maximum twist residual of each iteration (rad)
+    """
+
+    rib_force: npt.NDArray[np.floating]
+    twist: npt.NDArray[np.floating]
+    result: FEResult
+    iterations: int
+    converged: bool
+    residuals: list[float] = field(repr=False)
+
+
+def anderson_fixed_point(
+    g: Callable[[npt.NDArray[np.floating]], npt.NDArray[np.floating]],
+    x0: npt.NDArray[np.floating],
+    m: int = 5,
+    tol: float = 1e-8,
+    max_iter: int = 50,
+) -> tuple[npt.NDArray[np.floating], int, bool, list[float]]:
+    """
+    Solve x = g(x) by Anderson-accelerated fixed-point iteration.
+
+    The next iterate is the combination of the last `m` + 1 evaluations of `g`
+    that minimizes the linearized residual; with m = 0 this is plain
+    (Picard) iteration.
+
+    Returns the solution, the number of evaluations of `g`, whether the
+    maximum residual |g(x) - x| dropped below `tol`, and the residual history.
+    """
+    x = np.asarray(x0, dtype=float)
+    g_hist, f_hist, residuals = [], [], []
+
+    for k in range(max_iter):
+        gx = g(x)
+        f = (gx - x).ravel()
+        residuals.append(float(np.max(np.abs(f), initial=0.0)))
+        if residuals[-1] < tol:
+            return gx, k + 1, True, residuals
+
+        g_hist.append(gx.ravel())
+        f_hist.append(f)
+        if len(f_hist) > m + 1:
+            g_hist.pop(0)
+            f_hist.pop(0)
+
+        if len(f_hist) > 1:
+            dF = np.diff(f_hist, axis=0)
+            dG = np.diff(g_hist, axis=0)
+            gamma = np.linalg.lstsq(dF.T, f, rcond=None)[0]
+            x = (gx.ravel() - gamma @ dG).reshape(gx.shape)
+        else:
+            x = gx
+
+    return x, max_iter, False, residuals
+
+
+def static_aeroelastic(
+    fe: WingBoxFE,
+    rib_force: npt.NDArray[np.floating],
+    q: float | npt.NDArray[np.floating],
+    lift_slope: float = 2 * np.pi,
+    load_xc: float = 0.25,
+    trim: bool = True,
+    m: int = 5,
+    tol: float = 1e-8,
+    max_iter: int = 30,
+) -> AeroelasticResult:
+    """
+    Couple the rib loads and the wing box deflection.
+
+    Lift acts at `load_xc` of each rib; the resulting rib pitch, from the
+    deflections of the two spars, changes the local incidence and so the
+    lift by strip theory, q c a0 dalpha per unit span. With `trim`, the
+    angle of attack is adjusted so every load case keeps its total lift.
+
+    The structure is factorized once in `fe`; every iteration is a single
+    back substitution for all load cases.
+
+    rib_force: rigid-wing rib loads (N), shape (n_cases, n_ribs) on `fe.rib_y`
+    q: dynamic pressure (Pa), scalar or per load case
+    lift_slope: section lift curve slope (1/rad)
+    """
+    rib_force = np.atleast_2d(rib_force).astype(float)
+    q = np.broadcast_to(np.asarray(q, dtype=float), rib_force.shape[:1])[:, None]
+
+    bound_l, bound_r = _rib_strip_bounds(fe.rib_y)
+    # lift per unit twist of each rib strip
+    dL_dalpha = q * lift_slope * fe.rib_c * (bound_r - bound_l)
+
+    front = fe.dof(fe.rib_nodes, 0, W)
+    rear = fe.dof(fe.rib_nodes, 1, W)
+    d = fe.spar_x[1] - fe.spar_x[0]
+
+    # lift-weighted mean twist, removed when trimming
+    total = np.sum(dL_dalpha, axis=-1, keepdims=True)
+    weights = np.divide(
+        dL_dalpha, total, out=np.zeros_like(dL_dalpha), where=total != 0
+    )
+
+    def loads(twist):
+        dalpha = twist
+        if trim:
+            dalpha = twist - np.sum(weights * twist, axis=-1, keepdims=True)
+        return rib_force + dL_dalpha * dalpha
+
+    def elastic_twist(twist):
+        u = fe.solve_displacements(fe.load_vector(loads(twist), load_xc))
+        return (u[:, front] - u[:, rear]) / d
+
+    twist, iterations, converged, residuals = anderson_fixed_point(
+        elastic_twist, np.zeros_like(rib_force), m=m, tol=tol, max_iter=max_iter
+    )
+    final_force = loads(twist)
+
+    return AeroelasticResult(
+        final_force,
+        twist,
+        fe.solve(final_force, load_xc),
+        iterations,
+        converged,
+        residuals,
+    )
@@ -0,0 +1,335 @@
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+from scipy.sparse import coo_matrix, csc_matrix
+from scipy.sparse.linalg import splu
+
+from wyvern.analysis.structures.abstractions import Structure
+from wyvern.utils.constants import BALSA_E, BALSA_G
+
+# degrees of freedom per spar node: deflection w, bending slope theta = dw/dy,
+# twist phi about +y (nose up)
+DOF_PER_SPAR = 3
+W, THETA, PHI = 0, 1, 2
+
+
+@dataclass
+class FEResult:
+    """
+    Finite-element solution of the wing box.
+
+    y: node spanwise positions (m), shape (n_nodes,)
+    deflection, slope, twist: nodal values, shape (n_cases, n_spars, n_nodes)
+    bending_moment, shear_force: internal forces at both ends of every
+        element, shape (n_cases, n_spars, n_elements, 2); beam sign
+        convention along +y
+    bending_stress, shear_stress: stresses (Pa) from the same
+    rib_shear: force carried between the spars by each rib (N),
+        shape (n_cases, n_ribs)
+    """
+
+    y: npt.NDArray[np.floating]
+    deflection: npt.NDArray[np.floating]
+    slope: npt.NDArray[np.floating]
+    twist: npt.NDArray[np.floating]
+    bending_moment: npt.NDArray[np.floating]
+    shear_force: npt.NDArray[np.floating]
+    bending_stress: npt.NDArray[np.floating]
+    shear_stress: npt.NDArray[np.floating]
+    rib_shear: npt.NDArray[np.floating]
+
+
+def beam_element_stiffness(
+    EI: npt.NDArray[np.floating],
+    L: npt.NDArray[np.floating],
+    phi: npt.NDArray[np.floating] = 0,
+) -> npt.NDArray[np.floating]:
+    """
+    Stiffness matrices of 2-node beam elements, DOFs (w_a, theta_a, w_b, theta_b).
+
+    phi = 12 EI / (k G A L^2) gives the Timoshenko element; phi = 0 is
+    Euler-Bernoulli. Inputs broadcast; output shape (..., 4, 4).
+    """
+    EI, L, phi = np.broadcast_arrays(
+        np.asarray(EI, dtype=float), np.asarray(L, dtype=float), phi
+    )
+    one = np.ones_like(L)
+    k = np.stack(
+        [
+            np.stack([12 * one, 6 * L, -12 * one, 6 * L], axis=-1),
+            np.stack([6 * L, (4 + phi) * L**2, -6 * L, (2 - phi) * L**2], axis=-1),
+            np.stack([-12 * one, -6 * L, 12 * one, -6 * L], axis=-1),
+            np.stack([6 * L, (2 - phi) * L**2, -6 * L, (4 + phi) * L**2], axis=-1),
+        ],
+        axis=-2,
+    )
+    return k * (EI / ((1 + phi) * L**3))[..., None, None]
+
+
+def torsion_constant(b: npt.NDArray[np.floating], h: npt.NDArray[np.floating]):
+    """
+    St. Venant torsion constant of a solid rectangle.
+    """
+    short, long = np.minimum(b, h), np.maximum(b, h)
+    return long * short**3 / 3 * (1 - 0.63 * short / long)
+
+
+def assemble(
+    elements: list[tuple[npt.NDArray[np.floating], npt.NDArray[np.integer]]],
+    n_dof: int,
+) -> csc_matrix:
+    """
+    Assemble element matrices into a sparse global matrix.
+
+    elements: (matrices, dofs) pairs; matrices of shape (..., n, n) and the
+        global DOF indices of each matrix, shape (..., n)
+    """
+    rows, cols, vals = [], [], []
+    for k, dofs in elements:
+        n = dofs.shape[-1]
+        rows.append(np.broadcast_to(dofs[..., :, None], dofs.shape + (n,)).ravel())
+        cols.append(np.broadcast_to(dofs[..., None, :], dofs.shape + (n,)).ravel())
+        vals.append(k.ravel())
+
+    return coo_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(n_dof, n_dof),
+    ).tocsc()
+
+
+class WingBoxFE:
+    """
+    Finite-element model of the rib-coupled two-spar wing box.
+
+    Each spar is a beam along y with bending and St. Venant torsion. Each
+    rib is a beam along x joining the two spars at its station, so load is
+    shared between the spars and the box resists twist through the ribs.
+    The whole span is modelled; the stiffness matrix is assembled sparse,
+    factorized once, and reused for every load case.
+
+    structure: rib and spar layout (see `Structure.from_structure`)
+    spar_width: spar width (m)
+    supports: spanwise station (m) -> "clamped" (all DOFs fixed) or "pinned"
+        (deflection fixed); applied to both spars. The default is the same
+        cantilever as `beam_derivatives`.
+    timoshenko: include shear deformation in the spars
+    n_sub: elements per rib bay
+    half_span: only model the ribs at y >= 0
+    """
+
+    def __init__(
+        self,
+        structure: Structure,
+        spar_width: float,
+        E: float = BALSA_E,
+        G: float = BALSA_G,
+        supports: dict[float, str] = None,
+        timoshenko: bool = False,
+        shear_correction: float = 5 / 6,
+        n_sub: int = 4,
+        half_span: bool = False,
+    ):
+        self.structure = structure
+        self.spar_width = spar_width
+        self.E = E
+        self.G = G
+        self.supports = {0.0: "clamped"} if supports is None else supports
+        self.timoshenko = timoshenko
+        self.shear_correction = shear_correction
+        self.n_sub = n_sub
+
+        ribs = structure.rib.y >= 0 if half_span else np.ones(len(structure.rib), bool)
+        rib_y = self.rib_y = structure.rib.y[ribs]
+        self.rib_c = structure.rib.c[ribs]
+        self.rib_t = structure.rib.t[ribs]
+        self.rib_xle = structure.rib.xle[ribs]
+        self.spar_x = np.stack([spar.x[ribs] for spar in structure.spars])
+        self.spar_h = np.stack([spar.h[ribs] for spar in structure.spars])
+        self.n_spars = len(structure.spars)
+        self.n_ribs = len(rib_y)
+
+        # nodes; every n_sub-th node is a rib
+        bays = [
+            np.linspace(rib_y[i], rib_y[i + 1], n_sub + 1)[:-1]
+            for i in range(self.n_ribs - 1)
+        ]
+        self.y = np.concatenate(bays + [rib_y[-1:]])
+        self.rib_nodes = np.arange(self.n_ribs) * n_sub
+        self.n_nodes = len(self.y)
+        self.n_dof = self.n_nodes * self.n_spars * DOF_PER_SPAR
+
+        # spar properties at the element midpoints
+        y_mid = (self.y[1:] + self.y[:-1]) / 2
+        self.element_length = np.diff(self.y)
+        self.element_h = np.stack([np.interp(y_mid, rib_y, h) for h in self.spar_h])
+
+        self._assemble()
+        self._factorize()
+
+    def dof(self, node, spar, local):
+        """
+        Global index of a degree of freedom.
+        """
+        return (np.asarray(node) * self.n_spars + spar) * DOF_PER_SPAR + local
+
+    def _spar_element_matrices(self):
+        b, h, L = self.spar_width, self.element_h, self.element_length
+        I = b * h**3 / 12
+
+        if self.timoshenko:
+            phi = 12 * self.E * I / (self.shear_correction * self.G * b * h * L**2)
+        else:
+            phi = 0.0
+
+        k_bend = beam_element_stiffness(self.E * I, L, phi)
+        GJ_L = self.G * torsion_constant(b, h) / L
+        return k_bend, GJ_L
+
+    def _rib_element_matrices(self):
+        d = self.spar_x[1] - self.spar_x[0]
+        h = np.min(self.spar_h, axis=0)
+        EI = self.E * self.rib_t * h**3 / 12
+
+        # beam along x; its slope dw/dx is -phi of the spars
+        T = np.diag([1.0, -1.0, 1.0, -1.0])
+        return T @ beam_element_stiffness(EI, d) @ T
+
+    def element_dofs(self):
+        """
+        Global DOFs of the spar bending, spar torsion and rib elements.
+        """
+        nodes = np.arange(self.n_nodes - 1)
+        bend = np.stack(
+            [
+                np.stack(
+                    [
+                        self.dof(nodes, s, W),
+                        self.dof(nodes, s, THETA),
+                        self.dof(nodes + 1, s, W),
+                        self.dof(nodes + 1, s, THETA),
+                    ],
+                    axis=-1,
+                )
+                for s in range(self.n_spars)
+            ]
+        )
+        torsion = np.stack(
+            [
+                np.stack([self.dof(nodes, s, PHI), self.dof(nodes + 1, s, PHI)], -1)
+                for s in range(self.n_spars)
+            ]
+        )
+        rib = np.stack(
+            [
+                self.dof(self.rib_nodes, 0, W),
+                self.dof(self.rib_nodes, 0, PHI),
+                self.dof(self.rib_nodes, 1, W),
+                self.dof(self.rib_nodes, 1, PHI),
+            ],
+            axis=-1,
+        )
+        return bend, torsion, rib
+
+    def _assemble(self):
+        k_bend, GJ_L = self._spar_element_matrices()
+        k_tors = GJ_L[..., None, None] * np.array([[1.0, -1.0], [-1.0, 1.0]])
+        k_rib = self._rib_element_matrices()
+        self._k_bend, self._k_rib = k_bend, k_rib
+
+        dofs_bend, dofs_tors, dofs_rib = self.element_dofs()
+        self._dofs_bend, self._dofs_rib = dofs_bend, dofs_rib
+
+        self.K = assemble(
+            [(k_bend, dofs_bend), (k_tors, dofs_tors), (k_rib, dofs_rib)], self.n_dof
+        )
+
+        # boundary conditions
+        fixed = []
+        for y_s, kind in self.supports.items():
+            node = np.argmin(np.abs(self.y - y_s))
+            local = [W, THETA, PHI] if kind == "clamped" else [W]
+            if kind not in ("clamped", "pinned"):
+                raise ValueError(f"Unknown support type {kind}.")
+            fixed += [
+                self.dof(node, s, dof) for s in range(self.n_spars) for dof in local
+            ]
+
+        self.free = np.setdiff1d(np.arange(self.n_dof), fixed)
+
+    def _factorize(self):
+        K_ff = self.K[self.free][:, self.free]
+        self._lu = splu(K_ff.tocsc())
+
+    def load_vector(
+        self, rib_force: npt.NDArray[np.floating], load_xc: float = 0.25
+    ) -> npt.NDArray[np.floating]:
+        """
+        Global load vectors from rib forces.
+
+        Each rib force acts at `load_xc` of the rib chord and is split between
+        the spars so that it is statically equivalent.
+        rib_force: shape (n_cases, n_ribs), or (n_ribs,)
+        Returns shape (n_cases, n_dof).
+        """
+        rib_force = np.atleast_2d(rib_force)
+        x_load = self.rib_xle + load_xc * self.rib_c
+        share_2 = (x_load - self.spar_x[0]) / (self.spar_x[1] - self.spar_x[0])
+
+        F = np.zeros((rib_force.shape[0], self.n_dof))
+        F[:, self.dof(self.rib_nodes, 0, W)] = rib_force * (1 - share_2)
+        F[:, self.dof(self.rib_nodes, 1, W)] = rib_force * share_2
+        return F
+
+    def solve_displacements(self, F: npt.NDArray[np.floating]) -> npt.NDArray:
+        """
+        Solve K u = F for every load case against the stored factorization.
+        F: shape (n_cases, n_dof). Returns u of the same shape.
+        """
+        F = np.atleast_2d(F)
+        u = np.zeros_like(F, dtype=float)
+        u[:, self.free] = self._lu.solve(np.ascontiguousarray(F[:, self.free].T)).T
+        return u
+
+    def solve(
+        self, rib_force: npt.NDArray[np.floating], load_xc: float = 0.25
+    ) -> FEResult:
+        """
+        Solve every load case and recover nodal displacements and element
+        stresses.
+        rib_force: shape (n_cases, n_ribs)
+        """
+        u = self.solve_displacements(self.load_vector(rib_force, load_xc))
+        return self.recover(u)
+
+    def recover(self, u: npt.NDArray[np.floating]) -> FEResult:
+        """
+        Element forces and stresses from global displacements (n_cases, n_dof).
+        """
+        nodal = u.reshape(u.shape[0], self.n_nodes, self.n_spars, DOF_PER_SPAR)
+        nodal = nodal.transpose(0, 2, 1, 3)
+
+        # element end forces [V_a, M_a, V_b, M_b], as applied to the element
+        f = np.einsum("seij,csej->csei", self._k_bend, u[:, self._dofs_bend])
+        # internal shear and moment at both ends (beam convention along +y)
+        shear_force = np.stack([-f[..., 0], f[..., 2]], axis=-1)
+        bending_moment = np.stack([-f[..., 1], f[..., 3]], axis=-1)
+
+        b, h = self.spar_width, self.element_h[None, :, :, None]
+        I = b * h**3 / 12
+        bending_stress = bending_moment * h / (2 * I)
+        shear_stress = shear_force * (b * h**2 / 8) / (I * b)
+
+        f_rib = np.einsum("rij,crj->cri", self._k_rib, u[:, self._dofs_rib])
+
+        return FEResult(
+            self.y,
+            nodal[..., W],
+            nodal[..., THETA],
+            nodal[..., PHI],
+            bending_moment,
+            shear_force,
+            bending_stress,
+            shear_stress,
+            f_rib[..., 0],
+        )
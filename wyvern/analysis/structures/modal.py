@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+from scipy.integrate import trapezoid
+from scipy.sparse.linalg import eigsh
+
+from wyvern.analysis.structures.abstractions import Structure
+from wyvern.analysis.structures.fem import W, WingBoxFE, assemble
+from wyvern.analysis.structures.rib_calcs import stack_sections
+from wyvern.utils.constants import BALSA_DENSITY, BALSA_E, BALSA_G
+
+
+@dataclass
+class ModalResult:
+    """
+    Natural modes of the wing box, lowest frequency first.
+
+    frequencies: natural frequencies (Hz), shape (n_modes,)
+    mode_types: "bending" or "torsion" for each mode
+    mode_shapes: nodal (w, theta, phi) of each mode, normalized to unit
+        maximum deflection, shape (n_modes, n_spars, n_nodes, 3)
+    y: node spanwise positions (m)
+    """
+
+    frequencies: npt.NDArray[np.floating]
+    mode_types: list[str]
+    mode_shapes: npt.NDArray[np.floating]
+    y: npt.NDArray[np.floating]
+
+
+def beam_element_mass(
+    m: npt.NDArray[np.floating], L: npt.NDArray[np.floating]
+) -> npt.NDArray[np.floating]:
+    """
+    Consistent mass matrices of 2-node beam elements,
+    DOFs (w_a, theta_a, w_b, theta_b).
+    m: mass per unit length
+    """
+    m, L = np.broadcast_arrays(np.asarray(m, dtype=float), np.asarray(L, dtype=float))
+    one = np.ones_like(L)
+    M = np.stack(
+        [
+            np.stack([156 * one, 22 * L, 54 * one, -13 * L], axis=-1),
+            np.stack([22 * L, 4 * L**2, 13 * L, -3 * L**2], axis=-1),
+            np.stack([54 * one, 13 * L, 156 * one, -22 * L], axis=-1),
+            np.stack([-13 * L, -3 * L**2, -22 * L, 4 * L**2], axis=-1),
+        ],
+        axis=-2,
+    )
+    return M * (m * L / 420)[..., None, None]
+
+
+def _rib_mass_matrices(fe: WingBoxFE, density: float) -> npt.NDArray[np.floating]:
+    """
+    Rigid-rib mass matrices in the (w_1, w_2) deflections of the spars.
+    """
+    ribs = fe.structure.rib.y >= fe.rib_y[0]
+    sections = [s for s, keep in zip(fe.structure.rib.sections, ribs) if keep]
+    x, y_top, y_bot = stack_sections(sections)
+
+    # mass distribution along the chord of each rib
+    x_rib = fe.rib_xle[:, None] + x[None, :] * fe.rib_c[:, None]
+    dm = density * fe.rib_t[:, None] * (y_top - y_bot) * fe.rib_c[:, None] ** 2
+
+    # position relative to the spars; the rib deflects as w_1 + (w_2 - w_1) xi
+    d = fe.spar_x[1] - fe.spar_x[0]
+    xi = (x_rib - fe.spar_x[0][:, None]) / d[:, None]
+    m_0 = trapezoid(dm, x, axis=-1)
+    m_1 = trapezoid(dm * xi, x, axis=-1)
+    m_2 = trapezoid(dm * xi**2, x, axis=-1)
+
+    return np.stack(
+        [
+            np.stack([m_0 - 2 * m_1 + m_2, m_1 - m_2], axis=-1),
+            np.stack([m_1 - m_2, m_2], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+def mass_matrix(fe: WingBoxFE, density: float = BALSA_DENSITY):
+    """
+    Sparse mass matrix of the wing box, on the same DOFs as `fe.K`.
+    """
+    b, h, L = fe.spar_width, fe.element_h, fe.element_length
+
+    m_bend = beam_element_mass(density * b * h, L)
+    # polar inertia of the rectangular spars
+    I_p = density * b * h * (b**2 + h**2) / 12
+    m_tors = (I_p * L / 6)[..., None, None] * np.array([[2.0, 1.0], [1.0, 2.0]])
+    m_rib = _rib_mass_matrices(fe, density)
+
+    dofs_bend, dofs_tors, dofs_rib = fe.element_dofs()
+
+    return assemble(
+        [(m_bend, dofs_bend), (m_tors, dofs_tors), (m_rib, dofs_rib[:, [0, 2]])],
+        fe.n_dof,
+    )
+
+
+def _mode_type(fe: WingBoxFE, shape: npt.NDArray[np.floating]) -> str:
+    # heave vs. pitch of the ribs, pitch as the motion at the spars
+    w = shape[:, fe.rib_nodes, W]
+    heave = (w[0] + w[1]) / 2
+    pitch = (w[1] - w[0]) / 2
+    return "bending" if np.linalg.norm(heave) >= np.linalg.norm(pitch) else "torsion"
+
+
+def modal_analysis(
+    structure: Structure,
+    spar_width: float = None,
+    n_modes: int = 4,
+    E: float = BALSA_E,
+    G: float = BALSA_G,
+    density: float = BALSA_DENSITY,
+) -> ModalResult:
+    """
+    First few natural modes of a half wing, cantilevered at the root.
+
+    Stiffness is from `WingBoxFE`; mass from the spars, and the ribs as rigid
+    plates of their section shape and thickness. The spar width defaults to
+    that of `SparPoints`, i.e. the stiffness of `SparPoints.I`. Eigenpairs
+    come from a sparse shift-invert solve about zero, so only the lowest
+    modes are computed.
+    """
+    if spar_width is None:
+        spar_width = structure.spars[0].t
+
+    fe = WingBoxFE(structure, spar_width, E=E, G=G, half_span=True)
+    M = mass_matrix(fe, density)
+
+    free = fe.free
+    K_ff = fe.K[free][:, free]
+    M_ff = M[free][:, free]
+    eigvals, eigvecs = eigsh(K_ff, k=n_modes, M=M_ff, sigma=0, which="LM")
+
+    order = np.argsort(eigvals)
+    eigvals, eigvecs = eigvals[order], eigvecs[:, order]
+
+    shapes = np.zeros((n_modes, fe.n_dof))
+    shapes[:, free] = eigvecs.T
+    shapes = shapes.reshape(n_modes, fe.n_nodes, fe.n_spars, 3).transpose(0, 2, 1, 3)
+    scale = np.max(np.abs(shapes[..., W]), axis=(1, 2))
+    shapes /= scale[:, None, None, None]
+
+    return ModalResult(
+        np.sqrt(np.abs(eigvals)) / (2 * np.pi),
+        [_mode_type(fe, shape) for shape in shapes],
+        shapes,
+        fe.y,
+    )
+
+
+def modal_analysis_batch(
+    structures: Sequence[Structure],
+    spar_width: float | Sequence[float] = None,
+    n_modes: int = 4,
+    **kwargs,
+) -> tuple[npt.NDArray[np.floating], npt.NDArray]:
+    """
+    Natural frequencies of many design variants.
+
+    Returns frequencies (Hz) and mode types, both of shape
+    (n_variants, n_modes).
+    """
+    widths = np.broadcast_to(np.array(spar_width, dtype=object), (len(structures),))
+
+    results = [
+        modal_analysis(structure, width, n_modes, **kwargs)
+        for structure, width in zip(structures, widths)
+    ]
+
+    return (
+        np.stack([r.frequencies for r in results]),
+        np.array([r.mode_types for r in results]),
+    )
@@ -5,6 +5,9 @@ import numpy as np
 import numpy.typing as npt
 from scipy.integrate import quad
 
+from wyvern.utils.airfoil_utils import resample_airfoil
+from wyvern.utils.geom_utils import PolygonProperties, polygon_properties
+
 
 @dataclass
 class AirfoilPoints:
@@ -23,6 +26,20 @@ class RibFLoads:
     buckling_2: npt.NDArray[np.floating]  # N; loads must be LESS than this
 
 
+def _rib_strip_bounds(
+    rib_y: npt.NDArray[np.floating],
+) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
+    """
+    Tributary strip of each rib: halfway to its neighbours, ending at the
+    outermost ribs.
+    """
+    midpoints = (rib_y[:-1] + rib_y[1:]) / 2
+    bound_l = np.concatenate([rib_y[:1], midpoints])
+    bound_r = np.concatenate([midpoints, rib_y[-1:]])
+
+    return bound_l, bound_r
+
+
 def rib_loading(lift_distribution: Callable[[float], float], rib_y: npt.NDArray):
     """
     Calculate the lift loading on each rib.
@@ -31,20 +48,79 @@ def rib_loading(lift_distribution: Callable[[float], float], rib_y: npt.NDArray)
 
     rib_force = np.zeros(num_ribs)
 
+    bound_l, bound_r = _rib_strip_bounds(rib_y)
+
     for i in range(num_ribs):
-        if i == 0:
-            bound_l = rib_y[i]
-        else:
-            bound_l = (rib_y[i - 1] + rib_y[i]) / 2
+        rib_force[i] = quad(lift_distribution, bound_l[i], bound_r[i], epsrel=1e-6)[0]
 
-        if i == num_ribs - 1:
-            bound_r = rib_y[i]
-        else:
-            bound_r = (rib_y[i] + rib_y[i + 1]) / 2
+    return rib_force
 
-        rib_force[i] = quad(lift_distribution, bound_l, bound_r, epsrel=1e-6)[0]
 
-    return rib_force
+def cumulative_lift(
+    y_data: npt.NDArray[np.floating],
+    lift_data: npt.NDArray[np.floating],
+    y: npt.NDArray[np.floating],
+) -> npt.NDArray[np.floating]:
+    """
+    Integral of a tabulated lift distribution from y_data[0] to each of y.
+
+    The distribution is taken as `np.interp(y, y_data, lift_data)` (piecewise
+    linear, held constant outside the data), for which this is exact.
+    y_data: spanwise stations of the data, ascending, shape (n_data,)
+    lift_data: lift per unit span, shape (..., n_data); leading dimensions
+        are independent load cases
+    y: stations to evaluate the integral at, shape (n,)
+
+    Returns the integral at each of y, shape (..., n).
+    """
+    y_data = np.asarray(y_data, dtype=float)
+    lift_data = np.asarray(lift_data, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # integral at the data stations (trapezoidal is exact for linear segments)
+    dy = np.diff(y_data)
+    F = np.concatenate(
+        [
+            np.zeros(lift_data.shape[:-1] + (1,)),
+            np.cumsum(dy * (lift_data[..., 1:] + lift_data[..., :-1]) / 2, axis=-1),
+        ],
+        axis=-1,
+    )
+
+    # partial segment up to each evaluation station
+    y_c = np.clip(y, y_data[0], y_data[-1])
+    idx = np.clip(np.searchsorted(y_data, y_c, side="right") - 1, 0, len(y_data) - 2)
+    t = (y_c - y_data[idx]) / dy[idx]
+    l_0 = lift_data[..., idx]
+    l_c = l_0 + t * (lift_data[..., idx + 1] - l_0)
+    integral = F[..., idx] + (y_c - y_data[idx]) * (l_0 + l_c) / 2
+
+    # constant extrapolation outside of the data
+    integral += np.minimum(y - y_data[0], 0) * lift_data[..., :1]
+    integral += np.maximum(y - y_data[-1], 0) * lift_data[..., -1:]
+
+    return integral
+
+
+def rib_loading_tabulated(
+    y_data: npt.NDArray[np.floating],
+    lift_data: npt.NDArray[np.floating],
+    rib_y: npt.NDArray[np.floating],
+) -> npt.NDArray[np.floating]:
+    """
+    Calculate the lift loading on each rib from a tabulated lift distribution.
+
+    Same tributary strips as `rib_loading`, but every strip comes from a single
+    cumulative integral of the data. Leading dimensions of `lift_data` are
+    independent load cases (e.g. load factors, Full/Empty, stall/cruise), so
+    lift_data of shape (n_cases, n_data) gives rib forces of shape
+    (n_cases, n_ribs).
+    """
+    bound_l, bound_r = _rib_strip_bounds(np.asarray(rib_y, dtype=float))
+    integral = cumulative_lift(y_data, lift_data, np.concatenate([bound_l, bound_r]))
+
+    num_ribs = len(rib_y)
+    return integral[..., num_ribs:] - integral[..., :num_ribs]
 
 
 def rib_failure(
@@ -120,32 +196,164 @@ def get_section_coords(
     return AirfoilPoints(x_top, y_top, x_bot, y_bot)
 
 
-def spar_height(
-    rib_y: npt.NDArray[np.floating],
+def section_coords_batch(
+    x: npt.NDArray[np.floating],
+    y_top: npt.NDArray[np.floating],
+    y_bot: npt.NDArray[np.floating],
+    scale_fac: npt.NDArray[np.floating],
+    twist: npt.NDArray[np.floating],
+    twist_xc: float = 0.5,
+) -> AirfoilPoints:
+    """
+    Scale and twist many sections at once.
+
+    Batched equivalent of `get_section_coords` for sections on a common
+    x-grid (see `wyvern.utils.airfoil_utils.resample_airfoil`).
+    x: common unit-chord x-grid, shape (n_pts,)
+    y_top, y_bot: unit-chord surfaces, shape (n_ribs, n_pts)
+    scale_fac: chord of each rib, shape (n_ribs,)
+    twist: twist of each rib (degrees), shape (n_ribs,)
+
+    Every array in the returned AirfoilPoints has shape (n_ribs, n_pts).
+    """
+    c = np.asarray(scale_fac, dtype=float)[:, None]
+    cos_t = np.cos(np.asarray(twist, dtype=float) * np.pi / 180)[:, None]
+    sin_t = np.sin(np.asarray(twist, dtype=float) * np.pi / 180)[:, None]
+
+    x_rel = (x[None, :] - twist_xc) * c
+
+    def _twist(y_surf):
+        # same transform as get_section_coords, applied to every rib
+        y_new = y_surf * c * cos_t + x_rel * sin_t
+        x_new = x_rel * cos_t - y_new * sin_t + twist_xc * c
+        return x_new, y_new
+
+    x_top, y_top = _twist(y_top)
+    x_bot, y_bot = _twist(y_bot)
+
+    return AirfoilPoints(x_top, y_top, x_bot, y_bot)
+
+
+def _interp_rows(
+    xq: npt.NDArray[np.floating],
+    xp: npt.NDArray[np.floating],
+    fp: npt.NDArray[np.floating],
+) -> npt.NDArray[np.floating]:
+    """
+    Row-wise `np.interp`.
+    xq: query points, shape (..., n_rows)
+    xp, fp: data points of each row, shape (n_rows, n_pts)
+    """
+    n_rows, n_pts = xp.shape
+    rows = np.arange(n_rows)
+
+    # segment containing each query point, clamped to the ends like np.interp
+    idx = np.sum(xp <= xq[..., None], axis=-1) - 1
+    idx = np.clip(idx, 0, n_pts - 2)
+
+    x0 = xp[rows, idx]
+    x1 = xp[rows, idx + 1]
+    t = np.clip((xq - x0) / (x1 - x0), 0, 1)
+
+    return fp[rows, idx] + t * (fp[rows, idx + 1] - fp[rows, idx])
+
+
+def stack_sections(
+    sections: list[npt.NDArray[np.floating]], num_points: int = 201
+) -> tuple[
+    npt.NDArray[np.floating], npt.NDArray[np.floating], npt.NDArray[np.floating]
+]:
+    """
+    Resample per-rib sections onto a common grid and stack them.
+    Each distinct section array is only resampled once.
+
+    Returns x (n_pts,), y_top (n_ribs, n_pts), y_bot (n_ribs, n_pts)
+    """
+    resampled = {}
+    for section in sections:
+        if id(section) not in resampled:
+            resampled[id(section)] = resample_airfoil(section, num_points)
+
+    x = next(iter(resampled.values()))[0]
+    y_top = np.stack([resampled[id(section)][1] for section in sections])
+    y_bot = np.stack([resampled[id(section)][2] for section in sections])
+
+    return x, y_top, y_bot
+
+
+def section_properties(
+    x: npt.NDArray[np.floating],
+    y_top: npt.NDArray[np.floating],
+    y_bot: npt.NDArray[np.floating],
+    chord: npt.NDArray[np.floating] | float = 1.0,
+) -> PolygonProperties:
+    """
+    Area, centroid and second moments of area of stacked sections, e.g. from
+    `stack_sections`, scaled to their chords; all in one pass.
+    x: (n_pts,); y_top, y_bot: (n_ribs, n_pts); chord: (n_ribs,) or scalar
+    """
+    y_top, y_bot = np.atleast_2d(y_top), np.atleast_2d(y_bot)
+    x = np.broadcast_to(x, y_top.shape)
+
+    # closed outline: top surface LE to TE, then bottom surface back to the LE
+    outline = np.stack(
+        [
+            np.concatenate([x, x[:, ::-1]], axis=-1),
+            np.concatenate([y_top, y_bot[:, ::-1]], axis=-1),
+        ],
+        axis=-1,
+    )
+    props = polygon_properties(outline)
+
+    c = np.asarray(chord, dtype=float)
+    return PolygonProperties(
+        props.area * c**2,
+        props.cx * c,
+        props.cy * c,
+        props.Ixx * c**4,
+        props.Iyy * c**4,
+        props.Ixy * c**4,
+    )
+
+
+def spar_heights(
     rib_c: npt.NDArray[np.floating],
     rib_xle: npt.NDArray[np.floating],
-    spar_x: npt.NDArray[np.floating],
+    spar_xs: npt.NDArray[np.floating],
     twist: npt.NDArray[np.floating],
-    sections: list[str],
+    sections: list[npt.NDArray[np.floating]],
+    num_points: int = 201,
 ) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
     """
-    Calculate the height of the spar at each rib.
+    Calculate the top and bottom of every spar at every rib in one pass.
+    spar_xs: spar x-coordinates, shape (n_spars, n_ribs)
+
+    Returns (spar_tops, spar_bots), each of shape (n_spars, n_ribs).
     """
-    num_ribs = len(rib_y)
+    x, y_top, y_bot = stack_sections(sections, num_points)
+    airfoils = section_coords_batch(x, y_top, y_bot, rib_c, twist)
 
-    spar_tops = np.zeros(num_ribs)
-    spar_bots = np.zeros(num_ribs)
+    spar_points = np.atleast_2d(spar_xs) - rib_xle[None, :]
 
-    spar_points = spar_x - rib_xle
+    spar_tops = _interp_rows(spar_points, airfoils.x_top, airfoils.y_top)
+    spar_bots = _interp_rows(spar_points, airfoils.x_bot, airfoils.y_bot)
 
-    for i in range(num_ribs):
-        # read points from section file
-        scale_fac = rib_c[i]
+    return (spar_tops, spar_bots)
 
-        airfoil = get_section_coords(sections[i], scale_fac, twist[i])
 
-        # interpolate to find y-coordinates of spar intersection
-        spar_tops[i] = np.interp(spar_points[i], airfoil.x_top, airfoil.y_top)
-        spar_bots[i] = np.interp(spar_points[i], airfoil.x_bot, airfoil.y_bot)
+def spar_height(
+    rib_y: npt.NDArray[np.floating],
+    rib_c: npt.NDArray[np.floating],
+    rib_xle: npt.NDArray[np.floating],
+    spar_x: npt.NDArray[np.floating],
+    twist: npt.NDArray[np.floating],
+    sections: list[str],
+) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
+    """
+    Calculate the height of the spar at each rib.
+    """
+    spar_tops, spar_bots = spar_heights(
+        rib_c, rib_xle, spar_x[None, :], twist, sections
+    )
 
-    return (spar_tops, spar_bots)
+    return (spar_tops[0], spar_bots[0])
@@ -0,0 +1,279 @@
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import product
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+from scipy.integrate import trapezoid
+
+from wyvern.analysis.structures.abstractions import (
+    RibControlPoints,
+    SparControlPoints,
+    Structure,
+)
+from wyvern.analysis.structures.rib_calcs import (
+    rib_loading_tabulated,
+    section_properties,
+    stack_sections,
+)
+from wyvern.analysis.structures.spar_calcs import beam_derivatives_batch
+from wyvern.utils.constants import (
+    BALSA_CRUSHING_STRENGTH,
+    BALSA_DENSITY,
+    BALSA_E,
+    BALSA_RUPTURE_STRENGTH,
+    BALSA_SHEAR_STRENGTH,
+)
+from wyvern.utils.geom_utils import mirror_verts
+
+# common balsa sheet thicknesses
+BALSA_STOCK_INCHES = np.array([1 / 32, 1 / 16, 3 / 32, 1 / 8, 3 / 16, 1 / 4, 3 / 8])
+
+
+@dataclass
+class StructuralLimits:
+    """
+    Failure criteria for structural sizing.
+
+    safety_factor: applied to every load
+    max_deflection: tip deflection limit (m)
+    min_rib_h: minimum rib height, for rib shear (m)
+    min_rib_continuous_c: minimum contiguous rib length, for buckling (m)
+    min_spar_gap: minimum chordwise distance between the spars (m)
+    """
+
+    safety_factor: float = 2.0
+    max_deflection: float = 0.085
+    min_rib_h: float = 7e-3
+    min_rib_continuous_c: float = 100e-3
+    min_spar_gap: float = 50e-3
+    E: float = BALSA_E
+    density: float = BALSA_DENSITY
+    rupture_strength: float = BALSA_RUPTURE_STRENGTH
+    shear_strength: float = BALSA_SHEAR_STRENGTH
+    crushing_strength: float = BALSA_CRUSHING_STRENGTH
+
+
+@dataclass
+class SizingResult:
+    """
+    Sized structure.
+
+    spar_1_x, spar_2_x: spar x at the spar control points (mm)
+    rib_t_inches: rib thicknesses, root to tip (inches)
+    spar_width: spar width (m)
+    mass: structural mass of ribs and spars (kg)
+    """
+
+    spar_1_x: npt.NDArray[np.floating]
+    spar_2_x: npt.NDArray[np.floating]
+    rib_t_inches: npt.NDArray[np.floating]
+    spar_width: float
+    mass: float
+    structure: Structure = field(repr=False)
+
+
+@dataclass
+class _Geometry:
+    # cached per spar layout; everything else is closed form in t and b
+    structure: Structure
+    rib_area: npt.NDArray[np.floating]  # (n_ribs,) m^2, full span
+    rib_force: npt.NDArray[np.floating]  # (n_ribs,) N; factored, worst case
+    rib_t_required: npt.NDArray[np.floating]  # (n_ribs,) m; shear and buckling
+    spar_h_integral: float  # m^2; sum over spars of int h dy
+    b_required: float  # m; spar width for the bending/deflection limits
+
+
+class StructuralSizingProblem:
+    """
+    Minimum-mass sizing of rib thicknesses, spar width and spar positions.
+
+    Ribs must not crush, shear or buckle (see `rib_failure`) and both spars
+    must stay within their rupture and shear strengths and the deflection
+    limit, for every load case. Rib thicknesses and spar width are picked
+    from `stock` sheet sizes.
+
+    Every failure stress scales as 1/t (ribs) or 1/b (spars), and rib
+    buckling as t^3, so for a given spar layout the lightest feasible stock
+    is found in closed form. Spar layouts are cached, so only the spar
+    intersections and beam integrals are recomputed when the layout changes.
+
+    rib_y: half-span rib stations (mm), root first
+    rib: rib control points
+    spar_1_y, spar_2_y: spanwise positions of the spar control points (mm)
+    lift_y: spanwise stations of the lift data (m), full span
+    lift: lift per unit span, shape (n_cases, n_lift); all load cases
+        (load factors, Full/Empty, ...) are checked together
+    """
+
+    def __init__(
+        self,
+        rib_y: npt.NDArray[np.floating],
+        rib: RibControlPoints,
+        spar_1_y: npt.NDArray[np.floating],
+        spar_2_y: npt.NDArray[np.floating],
+        lift_y: npt.NDArray[np.floating],
+        lift: npt.NDArray[np.floating],
+        limits: StructuralLimits = None,
+        stock: npt.NDArray[np.floating] = BALSA_STOCK_INCHES,
+        num_beam_points: int = 200,
+    ):
+        self.rib_y = np.asarray(rib_y, dtype=float)
+        self.y = mirror_verts(self.rib_y) * 1e-3
+        self.rib = rib
+        self.spar_1_y = np.asarray(spar_1_y, dtype=float)
+        self.spar_2_y = np.asarray(spar_2_y, dtype=float)
+        self.limits = StructuralLimits() if limits is None else limits
+        self.stock = np.sort(np.asarray(stock, dtype=float))
+
+        self.lift_y = np.asarray(lift_y, dtype=float)
+        self.lift = np.atleast_2d(lift)
+        self.rib_force = rib_loading_tabulated(self.lift_y, self.lift, self.y)
+
+        # beam integration grid
+        self.y_beam = np.linspace(self.y[0], self.y[-1], num_beam_points)
+        self.ell_beam = np.stack(
+            [np.interp(self.y_beam, lift_y, ell) for ell in self.lift]
+        )
+
+        self._geometry = lru_cache(maxsize=4096)(self._build_geometry)
+
+    def _build_structure(self, spar_1_x: tuple, spar_2_x: tuple) -> Structure:
+        return Structure.from_structure(
+            self.y,
+            self.rib,
+            np.ones_like(self.rib_y),
+            SparControlPoints(y=self.spar_1_y.copy(), x=np.array(spar_1_x)),
+            SparControlPoints(y=self.spar_2_y.copy(), x=np.array(spar_2_x)),
+        )
+
+    def _build_geometry(self, spar_1_x: tuple, spar_2_x: tuple) -> _Geometry:
+        lim = self.limits
+        structure = self._build_structure(spar_1_x, spar_2_x)
+        spar_h = np.stack([spar.h for spar in structure.spars])
+
+        # rib section areas
+        x, y_top, y_bot = stack_sections(structure.rib.sections)
+        rib_area = np.abs(section_properties(x, y_top, y_bot, structure.rib.c).area)
+
+        # ribs; required thickness for shear and buckling, worst load case
+        # (crushing depends on the spar width, see `size`)
+        force = lim.safety_factor * np.max(np.abs(self.rib_force), axis=0)
+        h_max = np.max(spar_h, axis=0)
+        t_shear = force / (lim.shear_strength * lim.min_rib_h)
+        t_buckle = np.cbrt(
+            force * 12 * h_max**2 / (np.pi**2 * lim.E * lim.min_rib_continuous_c)
+        )
+        t_required = np.maximum(t_shear, t_buckle)
+
+        # spars; stresses and deflection all scale with 1/b
+        h_beam = np.stack([np.interp(self.y_beam, self.y, h) for h in spar_h])
+        if np.any(h_beam <= 0):
+            b_required = np.inf
+        else:
+            bd = beam_derivatives_batch(self.ell_beam, self.y_beam, 1.0, h_beam, lim.E)
+            envelope = bd.critical_envelope()
+            b_required = lim.safety_factor * max(
+                envelope.bending_stress.max() / lim.rupture_strength,
+                envelope.shear_stress.max() / lim.shear_strength,
+            )
+            b_required = max(b_required, envelope.deflection.max() / lim.max_deflection)
+
+        spar_h_integral = np.sum(trapezoid(spar_h, self.y, axis=-1))
+
+        return _Geometry(
+            structure, rib_area, force, t_required, spar_h_integral, b_required
+        )
+
+    def _smallest_stock(self, required: npt.NDArray[np.floating]) -> npt.NDArray:
+        """
+        Smallest stock thickness (inches) at least as thick as `required` (m);
+        NaN if none is thick enough.
+        """
+        stock_m = self.stock * 25.4e-3
+        idx = np.searchsorted(stock_m, np.asarray(required) * (1 - 1e-12))
+        return np.where(
+            idx < len(stock_m), self.stock[np.minimum(idx, len(self.stock) - 1)], np.nan
+        )
+
+    def size(
+        self, spar_1_x: Sequence[float], spar_2_x: Sequence[float]
+    ) -> SizingResult:
+        """
+        Lightest stock rib thicknesses and spar width for a spar layout.
+        Mass is infinite if no stock size is feasible.
+        """
+        key = (tuple(float(x) for x in spar_1_x), tuple(float(x) for x in spar_2_x))
+        geom = self._geometry(*key)
+
+        spar_width = float(self._smallest_stock(geom.b_required)) * 25.4e-3
+
+        n_spars = len(geom.structure.spars)
+        t_crush = geom.rib_force / (
+            self.limits.crushing_strength * n_spars * spar_width
+        )
+        t_required = np.maximum(geom.rib_t_required, t_crush)
+        # symmetric ribs; take the worse side, root first
+        n_half = len(self.rib_y)
+        t_required = np.maximum(t_required[n_half - 1 :], t_required[:n_half][::-1])
+        rib_t_inches = self._smallest_stock(t_required)
+
+        mass = self.mass(geom, rib_t_inches, spar_width)
+        if np.isnan(mass) or not self._layout_feasible(geom):
+            mass = np.inf
+
+        return SizingResult(
+            np.array(key[0]),
+            np.array(key[1]),
+            rib_t_inches,
+            spar_width,
+            mass,
+            geom.structure,
+        )
+
+    def _layout_feasible(self, geom: _Geometry) -> bool:
+        spars = geom.structure.spars
+        gap = spars[1].x - spars[0].x
+        return bool(
+            np.all(gap >= self.limits.min_spar_gap)
+            and np.all(spars[0].h > 0)
+            and np.all(spars[1].h > 0)
+        )
+
+    def mass(
+        self,
+        geom: _Geometry,
+        rib_t_inches: npt.NDArray[np.floating],
+        spar_width: float,
+    ) -> float:
+        """
+        Structural mass (kg) of the ribs and spars.
+        """
+        rib_t = mirror_verts(rib_t_inches, negate=False) * 25.4e-3
+        volume = np.sum(rib_t * geom.rib_area) + spar_width * geom.spar_h_integral
+        return float(self.limits.density * volume)
+
+    def optimize(
+        self,
+        spar_1_candidates: Sequence[npt.NDArray[np.floating]],
+        spar_2_candidates: Sequence[npt.NDArray[np.floating]],
+    ) -> SizingResult:
+        """
+        Search spar layouts for the minimum-mass structure.
+
+        spar_1_candidates, spar_2_candidates: candidate x positions (mm) for
+        each spar control point.
+
+        Raises ValueError if no candidate layout is feasible.
+        """
+        best = None
+        for spar_1_x in product(*spar_1_candidates):
+            for spar_2_x in product(*spar_2_candidates):
+                result = self.size(spar_1_x, spar_2_x)
+                if best is None or result.mass < best.mass:
+                    best = result
+
+        if best is None or not np.isfinite(best.mass):
+            raise ValueError("No feasible spar layout among the candidates.")
+        return best
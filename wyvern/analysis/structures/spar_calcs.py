@@ -1,7 +1,7 @@
 from typing import Callable, NamedTuple
 
 import numpy as np
-from scipy.integrate import cumtrapz
+from scipy.integrate import cumulative_trapezoid
 
 
 class BeamDerivatives(NamedTuple):
@@ -17,25 +17,94 @@ class BeamDerivatives(NamedTuple):
     shear_stress: np.ndarray  # VQ/It
 
 
-def beam_derivatives(
-    lift_distr: Callable[[float], float],
+class CriticalEnvelope(NamedTuple):
+    """
+    Worst case over all load cases, per spar and spanwise station.
+    Values are magnitudes; *_case holds the index of the critical load case.
+    Arrays have shape (n_spars, n_y).
+    """
+
+    bending_stress: np.ndarray
+    bending_stress_case: np.ndarray
+    shear_stress: np.ndarray
+    shear_stress_case: np.ndarray
+    deflection: np.ndarray
+    deflection_case: np.ndarray
+
+
+class BeamDerivativesBatch(NamedTuple):
+    """
+    Beam derivatives for every combination of load case and spar.
+
+    shear_force, bending_moment: (n_cases, n_y); these don't depend on the spar
+    slope, deflection, stresses: (n_cases, n_spars, n_y)
+    """
+
+    shear_force: np.ndarray
+    bending_moment: np.ndarray
+    slope: np.ndarray
+    deflection: np.ndarray
+    bending_stress: np.ndarray  # My/I
+    shear_stress: np.ndarray  # VQ/It
+
+    def case(self, load_case: int, spar: int) -> BeamDerivatives:
+        """
+        Beam derivatives of a single load case and spar.
+        """
+        return BeamDerivatives(
+            self.shear_force[load_case],
+            self.bending_moment[load_case],
+            self.slope[load_case, spar],
+            self.deflection[load_case, spar],
+            self.bending_stress[load_case, spar],
+            self.shear_stress[load_case, spar],
+        )
+
+    def critical_envelope(self) -> CriticalEnvelope:
+        """
+        Envelope of the critical load case for each spar and station.
+        """
+        envelope = []
+        for values in (self.bending_stress, self.shear_stress, self.deflection):
+            magnitude = np.abs(values)
+            critical_case = np.argmax(magnitude, axis=0)
+            envelope += [np.max(magnitude, axis=0), critical_case]
+
+        return CriticalEnvelope(*envelope)
+
+
+def beam_derivatives_batch(
+    ell: np.ndarray,
     y: np.ndarray,
-    b: float,
+    b: float | np.ndarray,
     h: np.ndarray,
     E: float,
-) -> BeamDerivatives:
+) -> BeamDerivativesBatch:
     """
-    Calculate cantilevered beam SFD, BMD, Slope, Deflection
+    Calculate cantilevered beam SFD, BMD, Slope, Deflection for many load
+    cases and spars at once.
+
+    ell: lift distributions evaluated at y, shape (n_cases, n_y)
+    y: spanwise stations, shape (n_y,)
+    b: spar width, scalar or one per spar (n_spars,)
+    h: spar heights at y, shape (n_spars, n_y)
+    E: Young's modulus
     """
-    ell = lift_distr(y)
+    ell = np.atleast_2d(ell)
+    h = np.atleast_2d(h)
+    b = np.asarray(b, dtype=float)
+    if b.ndim == 1:
+        b = b[:, None]
+
+    sign = np.sign(y)
 
     # SFD
-    shear_force = cumtrapz(-ell * np.sign(y), y, initial=0)
-    shear_force = shear_force - shear_force[-1]
+    shear_force = cumulative_trapezoid(-ell * sign, y, axis=-1, initial=0)
+    shear_force = shear_force - shear_force[:, -1:]
 
     # BMD
-    bending_moment = cumtrapz(-shear_force * np.sign(y), y, initial=0)
-    bending_moment = bending_moment - bending_moment[-1]
+    bending_moment = cumulative_trapezoid(-shear_force * sign, y, axis=-1, initial=0)
+    bending_moment = bending_moment - bending_moment[:, -1:]
 
     # find zero point
     idx_0 = np.argmin(np.abs(y))
@@ -43,19 +112,34 @@ def beam_derivatives(
     # Slope
     I = (b * h**3) / 12
     Q = b * h**2 / 8
-    slope = cumtrapz(bending_moment / (E * I), y, initial=0)
-    slope = slope - slope[idx_0]
+    slope = cumulative_trapezoid(
+        bending_moment[:, None, :] / (E * I), y, axis=-1, initial=0
+    )
+    slope = slope - slope[..., idx_0 : idx_0 + 1]
 
     # Deflection
-    deflection = cumtrapz(slope, y, initial=0)
-    deflection = deflection - deflection[idx_0]
-
-    print(max(deflection))
+    deflection = cumulative_trapezoid(slope, y, axis=-1, initial=0)
+    deflection = deflection - deflection[..., idx_0 : idx_0 + 1]
 
     # Stresses
-    bending_stress = bending_moment * h / (2 * I)
-    shear_stress = shear_force * Q / (I * b)
+    bending_stress = bending_moment[:, None, :] * h / (2 * I)
+    shear_stress = shear_force[:, None, :] * Q / (I * b)
 
-    return BeamDerivatives(
+    return BeamDerivativesBatch(
         shear_force, bending_moment, slope, deflection, bending_stress, shear_stress
     )
+
+
+def beam_derivatives(
+    lift_distr: Callable[[float], float],
+    y: np.ndarray,
+    b: float,
+    h: np.ndarray,
+    E: float,
+) -> BeamDerivatives:
+    """
+    Calculate cantilevered beam SFD, BMD, Slope, Deflection
+    """
+    ell = lift_distr(y)
+
+    return beam_derivatives_batch(ell[None, :], y, b, h[None, :], E).case(0, 0)
@@ -0,0 +1,324 @@
+"""
+Vortex-lattice analysis of the planform.
+
+Flat (camberless, untwisted) lifting surface of horseshoe vortices, meshed
+from the span stations of `planform_span_stations`. The elevons are the
+panels aft of the hinge line between the control surface stations; their
+deflection enters through the boundary condition, the geometry stays flat.
+
+Lengths are in m, angles in degrees. Coefficients use the planform area,
+the span and the mean aerodynamic chord of the whole aircraft.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from scipy.linalg import lu_factor, lu_solve
+
+from wyvern.layout.planform import mean_aerodynamic_chords
+from wyvern.utils.geom_utils import refine_stations
+
+# cutoff below which a vortex line induces no velocity (m)
+_CORE = 1e-6
+
+
+@dataclass
+class VortexLatticeMesh:
+    """
+    Panels, ordered strip by strip from the left tip, LE to TE in each strip.
+
+    a, b: left and right ends of the bound vortices (quarter panel chord),
+        shape (n_panels, 3)
+    control_points: 3/4 panel chord, mid strip, shape (n_panels, 3)
+    area: panel areas, shape (n_panels,)
+    y_edges: spanwise strip edges, shape (n_strips + 1,)
+    chord: strip chords at mid strip, shape (n_strips,)
+    elevon: whether each panel is on an elevon, shape (n_panels,)
+    n_chord: panels per strip
+    """
+
+    a: npt.NDArray[np.floating]
+    b: npt.NDArray[np.floating]
+    control_points: npt.NDArray[np.floating]
+    area: npt.NDArray[np.floating]
+    y_edges: npt.NDArray[np.floating]
+    chord: npt.NDArray[np.floating]
+    elevon: npt.NDArray[np.bool_]
+    n_chord: int
+
+    @property
+    def n_strips(self) -> int:
+        return len(self.chord)
+
+
+@dataclass
+class VLMResult:
+    """
+    Vortex-lattice solution for each case, shape (n_cases,) unless noted.
+
+    CL, CDi, Cm: lift, induced drag (Trefftz plane) and pitching moment
+        coefficients; Cm about `x_ref`
+    Cl: rolling moment coefficient, positive right wing down
+    y: mid strip spanwise positions (m), shape (n_strips,)
+    cl_c: spanwise loading, section lift coefficient times chord (m),
+        shape (n_cases, n_strips)
+    cl: section lift coefficient, shape (n_cases, n_strips)
+    gamma: panel circulations per unit freestream speed (m),
+        shape (n_cases, n_panels)
+    """
+
+    CL: npt.NDArray[np.floating]
+    CDi: npt.NDArray[np.floating]
+    Cm: npt.NDArray[np.floating]
+    Cl: npt.NDArray[np.floating]
+    y: npt.NDArray[np.floating]
+    cl_c: npt.NDArray[np.floating]
+    cl: npt.NDArray[np.floating]
+    gamma: npt.NDArray[np.floating]
+
+
+def vortex_lattice_mesh(
+    df: pd.DataFrame, n_span: int = 40, n_chord: int = 8
+) -> VortexLatticeMesh:
+    """
+    Mesh both halves of the planform.
+
+    df: span stations (mm), from `planform_span_stations`
+    n_span: number of strips per half span
+    n_chord: number of chordwise panels; the panel edges include the hinge
+        line, with the elevon chord getting a proportional share
+    """
+    y_st = df.Y.to_numpy() * 1e-3
+    xle_st = df.XLE.to_numpy() * 1e-3
+    c_st = df.chord.to_numpy() * 1e-3
+
+    # hinge line as a fraction of the local chord; constant along the elevon
+    cs = df.loc["ctrl_surface_start"]
+    hinge_xc = (cs.hinge_line - cs.XLE) / cs.chord
+    n_elevon = int(np.clip(np.round(n_chord * (1 - hinge_xc)), 1, n_chord - 1))
+    frac = np.concatenate(
+        [
+            np.linspace(0, hinge_xc, n_chord - n_elevon + 1)[:-1],
+            np.linspace(hinge_xc, 1, n_elevon + 1),
+        ]
+    )
+
+    y_half = refine_stations(y_st, n_span)
+    y_edges = np.concatenate([-y_half[:0:-1], y_half])
+    xle = np.interp(np.abs(y_edges), y_st, xle_st)
+    c = np.interp(np.abs(y_edges), y_st, c_st)
+
+    # chordwise node positions at the strip edges, (n_edges, n_chord + 1)
+    x = xle[:, None] + frac[None, :] * c[:, None]
+    dx = np.diff(x, axis=-1)
+    x_quarter = x[:, :-1] + dx / 4
+    x_three_quarter = x[:, :-1] + 3 * dx / 4
+
+    n_strips = len(y_edges) - 1
+    y_l = np.repeat(y_edges[:-1], n_chord)
+    y_r = np.repeat(y_edges[1:], n_chord)
+    zeros = np.zeros(n_strips * n_chord)
+
+    a = np.stack([x_quarter[:-1].ravel(), y_l, zeros], axis=-1)
+    b = np.stack([x_quarter[1:].ravel(), y_r, zeros], axis=-1)
+    control_points = np.stack(
+        [
+            ((x_three_quarter[:-1] + x_three_quarter[1:]) / 2).ravel(),
+            (y_l + y_r) / 2,
+            zeros,
+        ],
+        axis=-1,
+    )
+    area = ((dx[:-1] + dx[1:]) / 2).ravel() * (y_r - y_l)
+
+    y_mid = (y_edges[:-1] + y_edges[1:]) / 2
+    y_cs = df.loc[["ctrl_surface_start", "ctrl_surface_end"], "Y"].to_numpy() * 1e-3
+    on_elevon_span = (np.abs(y_mid) > y_cs[0]) & (np.abs(y_mid) < y_cs[1])
+    elevon = on_elevon_span[:, None] & (np.arange(n_chord) >= n_chord - n_elevon)
+
+    return VortexLatticeMesh(
+        a,
+        b,
+        control_points,
+        area,
+        y_edges,
+        (c[:-1] + c[1:]) / 2,
+        elevon.ravel(),
+        n_chord,
+    )
+
+
+def _semi_infinite_velocity(p, q, d):
+    """
+    Velocity at points p from unit vortex lines starting at q and running to
+    infinity along the unit vector d.
+    """
+    r = p - q
+    cross = np.cross(d, r)
+    cross_sq = np.sum(cross**2, axis=-1)
+    r_norm = np.linalg.norm(r, axis=-1)
+    scale = np.divide(
+        1 + np.sum(d * r, axis=-1) / np.maximum(r_norm, _CORE),
+        4 * np.pi * cross_sq,
+        out=np.zeros_like(cross_sq),
+        where=cross_sq > _CORE**2,
+    )
+    return cross * scale[..., None]
+
+
+def _segment_velocity(p, a, b):
+    """
+    Velocity at points p from unit vortex segments from a to b.
+    """
+    r0, r1, r2 = b - a, p - a, p - b
+    cross = np.cross(r1, r2)
+    cross_sq = np.sum(cross**2, axis=-1)
+    r1_norm = np.linalg.norm(r1, axis=-1)
+    r2_norm = np.linalg.norm(r2, axis=-1)
+    dot = np.sum(r0 * r1, axis=-1) / np.maximum(r1_norm, _CORE) - np.sum(
+        r0 * r2, axis=-1
+    ) / np.maximum(r2_norm, _CORE)
+    cutoff = (_CORE * np.sum(r0**2, axis=-1)) ** 2
+    scale = np.divide(
+        dot, 4 * np.pi * cross_sq, out=np.zeros_like(cross_sq), where=cross_sq > cutoff
+    )
+    return cross * scale[..., None]
+
+
+def horseshoe_velocity(
+    points: npt.NDArray[np.floating],
+    a: npt.NDArray[np.floating],
+    b: npt.NDArray[np.floating],
+) -> npt.NDArray[np.floating]:
+    """
+    Velocity induced at each point by each unit-strength horseshoe vortex,
+    trailing to +x. Shape (n_points, n_vortices, 3).
+    """
+    p = points[:, None, :]
+    a, b = a[None, :, :], b[None, :, :]
+    x_hat = np.array([1.0, 0.0, 0.0])
+
+    return (
+        _segment_velocity(p, a, b)
+        + _semi_infinite_velocity(p, b, x_hat)
+        - _semi_infinite_velocity(p, a, x_hat)
+    )
+
+
+class VortexLattice:
+    """
+    Vortex-lattice model of a planform.
+
+    The influence matrix is assembled and LU-factorized once; every call to
+    `solve` is a back substitution for all of its cases together.
+
+    df: span stations (mm), from `planform_span_stations`
+    x_ref: moment reference point (m)
+    """
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        n_span: int = 40,
+        n_chord: int = 8,
+        x_ref: float = 0.0,
+    ):
+        self.mesh = mesh = vortex_lattice_mesh(df, n_span, n_chord)
+        self.x_ref = x_ref
+        self.s_ref = mesh.area.sum()
+        self.b_ref = mesh.y_edges[-1] - mesh.y_edges[0]
+        self.c_ref = mean_aerodynamic_chords(df)[0] * 1e-3
+
+        # normal wash at the control points; the mesh is flat, so only w
+        v = horseshoe_velocity(mesh.control_points, mesh.a, mesh.b)
+        self._lu = lu_factor(v[..., 2])
+
+        # Trefftz plane: downwash at mid strip from the trailing vortices
+        y_mid = (mesh.y_edges[:-1] + mesh.y_edges[1:]) / 2
+        self._trefftz = 1 / (2 * np.pi * (y_mid[:, None] - mesh.y_edges[None, :]))
+
+    def solve(
+        self,
+        alpha: float | npt.NDArray[np.floating],
+        beta: float | npt.NDArray[np.floating] = 0.0,
+        elevator: float | npt.NDArray[np.floating] = 0.0,
+        aileron: float | npt.NDArray[np.floating] = 0.0,
+    ) -> VLMResult:
+        """
+        Solve every combination of the broadcast inputs (deg).
+
+        elevator: symmetric elevon deflection, trailing edge down positive
+        aileron: antisymmetric elevon deflection, right trailing edge down
+            positive
+        """
+        alpha, beta, elevator, aileron = (
+            np.deg2rad(np.atleast_1d(v).astype(float))
+            for v in np.broadcast_arrays(alpha, beta, elevator, aileron)
+        )
+        mesh = self.mesh
+
+        freestream = np.stack(
+            [
+                np.cos(alpha) * np.cos(beta),
+                -np.sin(beta),
+                np.sin(alpha) * np.cos(beta),
+            ],
+            axis=-1,
+        )
+
+        # panel normals, (n_cases, n_panels, 3); elevons rotate about the
+        # hinge line, approximated as spanwise
+        side = np.sign(mesh.control_points[:, 1])
+        delta = mesh.elevon * (elevator[:, None] + side * aileron[:, None])
+        normals = np.stack(
+            [np.sin(delta), np.zeros_like(delta), np.cos(delta)], axis=-1
+        )
+
+        rhs = -np.einsum("ck,cpk->pc", freestream, normals)
+        gamma = lu_solve(self._lu, rhs).T
+
+        # Kutta-Joukowski on the bound vortices, freestream only
+        force = gamma[..., None] * np.cross(freestream[:, None, :], mesh.b - mesh.a)
+        lift_dir = np.stack(
+            [-np.sin(alpha), np.zeros_like(alpha), np.cos(alpha)], axis=-1
+        )
+        lift = np.einsum("cpk,ck->cp", force, lift_dir)
+
+        q_s = self.s_ref / 2
+        x_bound = (mesh.a[:, 0] + mesh.b[:, 0]) / 2
+        y_bound = (mesh.a[:, 1] + mesh.b[:, 1]) / 2
+        CL = lift.sum(axis=-1) / q_s
+        Cm = -np.sum(force[..., 2] * (x_bound - self.x_ref), axis=-1) / (
+            q_s * self.c_ref
+        )
+        Cl = -np.sum(force[..., 2] * y_bound, axis=-1) / (q_s * self.b_ref)
+
+        # strip loading; each strip sheds its total circulation at the edges
+        gamma_strip = gamma.reshape(len(alpha), mesh.n_strips, mesh.n_chord).sum(-1)
+        shed = -np.diff(gamma_strip, axis=-1, prepend=0.0, append=0.0)
+        w = shed @ self._trefftz.T
+        dy = np.diff(mesh.y_edges)
+        CDi = -np.sum(gamma_strip * w * dy, axis=-1) / (2 * q_s)
+
+        cl_c = 2 * gamma_strip
+
+        return VLMResult(
+            CL,
+            CDi,
+            Cm,
+            Cl,
+            (mesh.y_edges[:-1] + mesh.y_edges[1:]) / 2,
+            cl_c,
+            cl_c / mesh.chord,
+            gamma,
+        )
+
+    def neutral_point(self) -> float:
+        """
+        Stick-fixed neutral point (m), where Cm does not change with CL.
+        """
+        result = self.solve([0.0, 1.0])
+        dCm_dCL = np.diff(result.Cm)[0] / np.diff(result.CL)[0]
+        return self.x_ref - dCm_dCL * self.c_ref
@@ -1,18 +1,57 @@
-from .components import ALL_COMPONENTS, AVIONICS_COMPONENTS, PROPULSION_COMPONENTS
-from .course import (
-    NUMBER_OF_STRAIGHTS,
-    NUMBER_OF_TURNS,
-    STRAIGHT_SEGMENT_LENGTH,
-    TURN_RADIUS,
-)
-from .historical import (
-    ALL_HISTORICAL,
-    BALSA_HISTORICAL,
-    BWB_HISTORICAL,
-    RASSAM_CORRELATIONS,
-)
-from .payloads import PAYLOADS
-from .planform_configs import PLANFORM_CONFIGS
+"""
+Data sources, loaded on first access (PEP 562) so that importing the
+package does not parse any of them.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .components import ALL_COMPONENTS, AVIONICS_COMPONENTS, PROPULSION_COMPONENTS
+    from .course import (
+        NUMBER_OF_STRAIGHTS,
+        NUMBER_OF_TURNS,
+        STRAIGHT_SEGMENT_LENGTH,
+        TURN_RADIUS,
+    )
+    from .historical import (
+        ALL_HISTORICAL,
+        BALSA_HISTORICAL,
+        BWB_HISTORICAL,
+        RASSAM_CORRELATIONS,
+    )
+    from .payloads import PAYLOADS
+    from .planform_configs import PLANFORM_CONFIGS
+
+# attribute -> submodule defining it
+_SOURCES = {
+    "ALL_COMPONENTS": "components",
+    "AVIONICS_COMPONENTS": "components",
+    "PROPULSION_COMPONENTS": "components",
+    "NUMBER_OF_STRAIGHTS": "course",
+    "NUMBER_OF_TURNS": "course",
+    "STRAIGHT_SEGMENT_LENGTH": "course",
+    "TURN_RADIUS": "course",
+    "ALL_HISTORICAL": "historical",
+    "BALSA_HISTORICAL": "historical",
+    "BWB_HISTORICAL": "historical",
+    "RASSAM_CORRELATIONS": "historical",
+    "PAYLOADS": "payloads",
+    "PLANFORM_CONFIGS": "planform_configs",
+}
+
+
+def __getattr__(name: str):
+    if name not in _SOURCES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_SOURCES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "ALL_COMPONENTS",
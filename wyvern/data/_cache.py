@@ -0,0 +1,130 @@
+"""
+Parsed-data cache for the data sources.
+
+Parsed sources are pickled to a cache directory (`WYVERN_CACHE_DIR`, by
+default ~/.cache/wyvern; set it empty to disable) and reused while the
+source file is unchanged. A cache entry is valid when the source's mtime and
+size match; if only the mtime changed (e.g. after a fresh checkout) the
+content digest is compared before parsing again.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+# bump to invalidate every cache entry
+CACHE_VERSION = 1
+
+
+def cache_dir() -> Path | None:
+    path = os.environ.get("WYVERN_CACHE_DIR")
+    if path is None:
+        return Path.home() / ".cache" / "wyvern"
+    return Path(path) if path else None
+
+
+def _digest(path: Path) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _entry_path(directory: Path, source: Path, loader: Callable, kwargs) -> Path:
+    # pickles are only reused by the same library versions
+    key = repr(
+        (
+            CACHE_VERSION,
+            str(source.resolve()),
+            f"{loader.__module__}.{loader.__qualname__}",
+            sorted(kwargs.items()),
+            sys.version_info[:2],
+            np.__version__,
+            pd.__version__,
+        )
+    )
+    name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return directory / f"{source.stem}-{name}.pkl"
+
+
+def cached_load(source: str | Path, loader: Callable[..., Any], **kwargs) -> Any:
+    """
+    `loader(source, **kwargs)`, reusing the cached result while `source` is
+    unchanged.
+    """
+    source = Path(source)
+    directory = cache_dir()
+    if directory is None:
+        return loader(source, **kwargs)
+
+    stat = source.stat()
+    entry_path = _entry_path(directory, source, loader, kwargs)
+    entry = None
+    try:
+        with open(entry_path, "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        pass
+
+    if entry is not None:
+        if (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return entry["value"]
+        digest = _digest(source)
+        if entry["digest"] == digest:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            _store(entry_path, entry)
+            return entry["value"]
+    else:
+        digest = _digest(source)
+
+    value = loader(source, **kwargs)
+    _store(
+        entry_path,
+        {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "digest": digest,
+            "value": value,
+        },
+    )
+    return value
+
+
+def _store(entry_path: Path, entry: dict) -> None:
+    # write then rename, so concurrent workers never read a partial entry;
+    # an unwritable cache only costs the parse next time
+    tmp = entry_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, entry_path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def lazy_attributes(
+    namespace: dict[str, Any], loaders: dict[str, Callable[[], Any]]
+) -> Callable[[str], Any]:
+    """
+    Module `__getattr__` (PEP 562) computing each of `loaders` on first
+    access and storing it in the module `namespace`.
+    """
+    module = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        if name in namespace:
+            return namespace[name]
+        if name not in loaders:
+            raise AttributeError(f"module {module!r} has no attribute {name!r}")
+        namespace[name] = loaders[name]()
+        return namespace[name]
+
+    return __getattr__
@@ -2,5 +2,17 @@ from pathlib import Path
 
 import numpy as np
 
-BOEING_VERTOL = np.loadtxt(Path(__file__).parent / "sources/BOEING.dat")
-NACA0018 = np.loadtxt(Path(__file__).parent / "sources/NACA0018.dat")
+from wyvern.data._cache import cached_load, lazy_attributes
+from wyvern.utils.airfoil_utils import naca_airfoil
+
+_SOURCES = Path(__file__).parent / "sources"
+
+# parsed on first access, not on import
+__getattr__ = lazy_attributes(
+    globals(),
+    {
+        "BOEING_VERTOL": lambda: cached_load(_SOURCES / "BOEING.dat", np.loadtxt),
+        # generated; sources/NACA0018.dat is the coarser tabulated section
+        "NACA0018": lambda: naca_airfoil("0018", 61),
+    },
+)
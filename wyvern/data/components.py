@@ -2,11 +2,23 @@ from pathlib import Path
 
 import pandas as pd
 
-# run this automatically on import (messy, but it works)
-# Turn into dataframe (do indices correctly)
-ALL_COMPONENTS = pd.read_json(
-    Path(__file__).parent / "sources/components.json", orient="index"
-)
+from wyvern.data._cache import cached_load, lazy_attributes
+
+_SOURCE = Path(__file__).parent / "sources/components.json"
+
 
-AVIONICS_COMPONENTS = ALL_COMPONENTS[ALL_COMPONENTS["category"] == "Avionics"]
-PROPULSION_COMPONENTS = ALL_COMPONENTS[ALL_COMPONENTS["category"] == "Propulsion"]
+def _category(category: str) -> pd.DataFrame:
+    all_components = __getattr__("ALL_COMPONENTS")
+    return all_components[all_components["category"] == category]
+
+
+# parsed on first access, not on import
+__getattr__ = lazy_attributes(
+    globals(),
+    {
+        # Turn into dataframe (do indices correctly)
+        "ALL_COMPONENTS": lambda: cached_load(_SOURCE, pd.read_json, orient="index"),
+        "AVIONICS_COMPONENTS": lambda: _category("Avionics"),
+        "PROPULSION_COMPONENTS": lambda: _category("Propulsion"),
+    },
+)
@@ -1,17 +1,179 @@
+from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
+from typing import Iterable
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
-# run this automatically on import (messy, but it works)
-ALL_HISTORICAL = pd.read_excel(
-    Path(__file__).parent / "sources/AER406_hist_2024_modified.xlsx"
+from wyvern.data._cache import cached_load, lazy_attributes
+
+_SOURCE = Path(__file__).parent / "sources/AER406_hist_2024_modified.xlsx"
+
+# (year, group) of the aircraft used for the Rassam correlations
+RASSAM_AIRCRAFT = (
+    (2015, "NARD"),
+    (2016, "Falcon 10"),
+    (2016, "Millenium Falcon"),
+    (2022, "J-Type Starfighter"),
+    (2023, "Halal"),
+    (2012, "6"),
 )
 
-# Balsa Planes
-BALSA_HISTORICAL = ALL_HISTORICAL[ALL_HISTORICAL["Construction"] == "Balsa"]
 
-# BWB & Balsa Planes
-BWB_HISTORICAL = BALSA_HISTORICAL[(BALSA_HISTORICAL["Config"] == "BWB")]
+@dataclass(frozen=True)
+class HistoricalDataset:
+    """
+    Historical aircraft, one row per (year, group).
+
+    Filters look rows up in per-column indexes built once for the full
+    dataset and shared by every subset; the frame keeps the source's row
+    labels.
+    """
+
+    frame: pd.DataFrame
+
+    def __post_init__(self):
+        # group names are a mix of numbers and names in the source
+        if not pd.api.types.is_string_dtype(self.frame["Group"]):
+            frame = self.frame.assign(Group=self.frame["Group"].astype(str))
+            object.__setattr__(self, "frame", frame)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @cached_property
+    def _positions(self) -> dict[str, dict]:
+        """
+        Column -> value -> row labels, and (year, group) -> row label.
+        """
+        index = {
+            column: self.frame.groupby(column, sort=False).groups
+            for column in ("Construction", "Config", "Year")
+        }
+        index["key"] = {
+            (int(year), str(group)): label
+            for label, year, group in zip(
+                self.frame.index, self.frame["Year"], self.frame["Group"]
+            )
+            # rows without a year cannot be looked up by (year, group)
+            if not pd.isna(year)
+        }
+        return index
+
+    def _subset(self, labels: Iterable) -> "HistoricalDataset":
+        subset = HistoricalDataset(self.frame.loc[list(labels)])
+        # subsets share the lookups of the full dataset
+        subset.__dict__["_positions"] = self._positions
+        return subset
+
+    def filter(
+        self,
+        construction: str | Iterable[str] = None,
+        config: str | Iterable[str] = None,
+        year: int | tuple[int, int] = None,
+    ) -> "HistoricalDataset":
+        """
+        Rows matching every given criterion; strings match exactly, a
+        collection of strings matches any of them, and a year tuple is an
+        inclusive range.
+        """
+        labels = pd.Index(self.frame.index)
+
+        def matching(column, values):
+            groups = self._positions[column]
+            values = [values] if isinstance(values, (str, int)) else values
+            found = [groups[v] for v in values if v in groups]
+            return pd.Index(np.concatenate(found) if found else [])
+
+        if construction is not None:
+            labels = labels.intersection(matching("Construction", construction))
+        if config is not None:
+            labels = labels.intersection(matching("Config", config))
+        if year is not None:
+            if isinstance(year, tuple):
+                years = [y for y in self._positions["Year"] if year[0] <= y <= year[1]]
+            else:
+                years = [year]
+            labels = labels.intersection(matching("Year", years))
+
+        # keep the dataset order
+        return self._subset(self.frame.index[self.frame.index.isin(labels)])
+
+    def select(self, aircraft: Iterable[tuple[int, str]]) -> "HistoricalDataset":
+        """
+        Rows of the given (year, group) aircraft, in that order.
+        """
+        key = self._positions["key"]
+        labels = []
+        for y, g in aircraft:
+            label = None if pd.isna(y) else key.get((int(y), str(g)))
+            if label is None or label not in self.frame.index:
+                raise KeyError(f"No historical aircraft {(y, g)}.")
+            labels.append(label)
+        return self._subset(labels)
 
-# Rassam Correlation
-RASSAM_CORRELATIONS = ALL_HISTORICAL.iloc[[5, 6, 7, 8, 10, 30]]
+    def column(self, name: str) -> npt.NDArray[np.floating]:
+        return self.frame[name].to_numpy(dtype=float)
+
+    @property
+    def max_weight(self) -> npt.NDArray[np.floating]:
+        """
+        Maximum takeoff mass (g).
+        """
+        return self.column("Max Wt (g)")
+
+    @property
+    def empty_weight(self) -> npt.NDArray[np.floating]:
+        """
+        Empty mass (g).
+        """
+        return self.column("EW (g)")
+
+    @property
+    def span(self) -> npt.NDArray[np.floating]:
+        """
+        Span (m).
+        """
+        return self.column("Span, m")
+
+    @property
+    def wetted_area_ratio(self) -> npt.NDArray[np.floating]:
+        """
+        Total wetted area over wing area.
+        """
+        return self.column("Total Wetted Area, m") / self.column("Wing Area m^2")
+
+    def as_mass_ratio(self, total_fixed_mass: float) -> npt.NDArray[np.floating]:
+        """
+        Aerostructural mass ratio of each aircraft, for the given fixed mass
+        (g); see `aerostructural_mass_ratio`.
+        """
+        return (self.empty_weight - total_fixed_mass) / self.max_weight
+
+
+def _balsa() -> pd.DataFrame:
+    return __getattr__("HISTORICAL").filter(construction="Balsa").frame
+
+
+def _bwb() -> pd.DataFrame:
+    return __getattr__("HISTORICAL").filter(construction="Balsa", config="BWB").frame
+
+
+# parsed on first access, not on import
+__getattr__ = lazy_attributes(
+    globals(),
+    {
+        "ALL_HISTORICAL": lambda: cached_load(_SOURCE, pd.read_excel),
+        "HISTORICAL": lambda: HistoricalDataset(__getattr__("ALL_HISTORICAL")),
+        # Balsa Planes
+        "BALSA_HISTORICAL": _balsa,
+        # BWB & Balsa Planes
+        "BWB_HISTORICAL": _bwb,
+        # Rassam Correlation
+        "RASSAM_CORRELATIONS": lambda: (
+            __getattr__("HISTORICAL").select(RASSAM_AIRCRAFT).frame
+        ),
+    },
+)
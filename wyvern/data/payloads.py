@@ -3,8 +3,19 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 
-PAYLOADS = pd.read_json(Path(__file__).parent / "sources/payloads.json", orient="index")
+from wyvern.data._cache import cached_load, lazy_attributes
 
-# Compute additional metrics
-PAYLOADS["ppm"] = PAYLOADS["points"] / PAYLOADS["mass"]
-PAYLOADS["volume"] = 4 / 3 * np.pi * (PAYLOADS["diameter"] / 2) ** 3  # mm^3
+_SOURCE = Path(__file__).parent / "sources/payloads.json"
+
+
+def _payloads() -> pd.DataFrame:
+    payloads = cached_load(_SOURCE, pd.read_json, orient="index")
+
+    # Compute additional metrics
+    payloads["ppm"] = payloads["points"] / payloads["mass"]
+    payloads["volume"] = 4 / 3 * np.pi * (payloads["diameter"] / 2) ** 3  # mm^3
+    return payloads
+
+
+# parsed on first access, not on import
+__getattr__ = lazy_attributes(globals(), {"PAYLOADS": _payloads})
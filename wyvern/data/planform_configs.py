@@ -2,9 +2,16 @@ import json
 from pathlib import Path
 
 from wyvern.analysis.parameters import PlanformParameters
+from wyvern.data._cache import lazy_attributes
 
-with open(Path(__file__).parent / "sources/planform_configurations.json", "r") as f:
-    raw_configs = json.load(f)
-    planforms = [PlanformParameters.from_dict(config) for config in raw_configs]
 
-PLANFORM_CONFIGS = {p.name: p for p in planforms}
+def _planform_configs() -> dict[str, PlanformParameters]:
+    with open(Path(__file__).parent / "sources/planform_configurations.json") as f:
+        raw_configs = json.load(f)
+        planforms = [PlanformParameters.from_dict(config) for config in raw_configs]
+
+    return {p.name: p for p in planforms}
+
+
+# parsed on first access, not on import
+__getattr__ = lazy_attributes(globals(), {"PLANFORM_CONFIGS": _planform_configs})
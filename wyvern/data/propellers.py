@@ -2,6 +2,8 @@ from pathlib import Path
 
 import numpy as np
 
+from wyvern.data._cache import cached_load, lazy_attributes
+
 
 class PropellerCurve:
     def __init__(self, name: str, data: np.ndarray):
@@ -21,27 +23,21 @@ class PropellerCurve:
         return self.T * self.v
 
 
-# all models assume 20 mAh discharge
-PROP_8X8 = PropellerCurve(
-    "8x8",
-    np.loadtxt(
-        Path(__file__).parent / "sources/prop_8x8_d20.csv",
-        delimiter=",",
-    ),
-)
-
-PROP_9X6 = PropellerCurve(
-    "9x6",
-    np.loadtxt(
-        Path(__file__).parent / "sources/prop_9x6_d20.csv",
-        delimiter=",",
-    ),
-)
-
-PROP_10X5 = PropellerCurve(
-    "10x5",
-    np.loadtxt(
-        Path(__file__).parent / "sources/prop_10x5_d20.csv",
+def _curve(name: str) -> PropellerCurve:
+    data = cached_load(
+        Path(__file__).parent / f"sources/prop_{name}_d20.csv",
+        np.loadtxt,
         delimiter=",",
-    ),
+    )
+    return PropellerCurve(name, data)
+
+
+# all models assume 20 mAh discharge; parsed on first access, not on import
+__getattr__ = lazy_attributes(
+    globals(),
+    {
+        "PROP_8X8": lambda: _curve("8x8"),
+        "PROP_9X6": lambda: _curve("9x6"),
+        "PROP_10X5": lambda: _curve("10x5"),
+    },
 )
@@ -1,3 +1,7 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .batch import PlanformBatch
 from .planform import (
     centerbody_points,
     control_surface_points,
@@ -7,9 +11,33 @@ from .planform import (
     span_stations_to_avl,
     wing_points,
 )
-from .viz import planform_viz, planform_viz_interactive, planform_viz_simple
+
+if TYPE_CHECKING:
+    from .loft import loft_planform
+    from .optimize import optimize_planform
+    from .viz import planform_viz, planform_viz_interactive, planform_viz_simple
+
+# attribute -> submodule defining it, imported on first use; plotting pulls
+# in matplotlib and the loft and optimizer pull in most of scipy
+_LAZY = {
+    "loft_planform": "loft",
+    "optimize_planform": "optimize",
+    "planform_viz": "viz",
+    "planform_viz_interactive": "viz",
+    "planform_viz_simple": "viz",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_LAZY[name]}", __name__), name)
+
 
 __all__ = [
+    "PlanformBatch",
+    "loft_planform",
+    "optimize_planform",
     "control_surface_points",
     "full_planform_points",
     "planform_span_stations",
@@ -0,0 +1,257 @@
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, NamedTuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from wyvern.analysis.parameters import PlanformParameters
+from wyvern.utils.geom_utils import polygon_properties
+
+if TYPE_CHECKING:
+    from wyvern.analysis.parameter_table import ParameterTable
+
+# geometric fields of PlanformParameters, in order
+PLANFORM_FIELDS = tuple(f.name for f in fields(PlanformParameters) if f.name != "name")
+
+STATION_NAMES = (
+    "center",
+    "midbody",
+    "wing_root",
+    "ctrl_surface_start",
+    "ctrl_surface_end",
+    "wing_tip",
+)
+
+CENTER, MIDBODY, WING_ROOT, CTRL_START, CTRL_END, WING_TIP = range(6)
+
+
+class SpanStations(NamedTuple):
+    """
+    Span stations of many planforms, each shape (n_planforms, 6), in the
+    order of `STATION_NAMES`. Same as the columns of `planform_span_stations`.
+    """
+
+    Y: npt.NDArray[np.floating]
+    XLE: npt.NDArray[np.floating]
+    chord: npt.NDArray[np.floating]
+    XTE: npt.NDArray[np.floating]
+    hinge_line: npt.NDArray[np.floating]
+
+
+def _trapezoid_mac(c_0, c_1):
+    return 2 / 3 * (c_0 + c_1 - c_0 * c_1 / (c_0 + c_1))
+
+
+@dataclass
+class PlanformBatch:
+    """
+    Many planforms as parallel arrays, one per field of `PlanformParameters`.
+
+    Every geometric field is broadcast to shape (n_planforms,) so that
+    sweeps can vary any subset of them; everything is computed for all
+    planforms at once. Lengths in mm, angles in degrees.
+    """
+
+    name: npt.NDArray[np.str_]
+
+    centerbody_halfspan: npt.NDArray[np.floating]
+    centerbody_chord: npt.NDArray[np.floating]
+
+    midbody_y: npt.NDArray[np.floating]
+    midbody_xle: npt.NDArray[np.floating]
+    midbody_chord: npt.NDArray[np.floating]
+
+    wing_root_le: npt.NDArray[np.floating]
+    wing_root_chord: npt.NDArray[np.floating]
+    wing_halfspan: npt.NDArray[np.floating]
+    wing_taper_ratio: npt.NDArray[np.floating]
+    wing_root_le_sweep_angle: npt.NDArray[np.floating]
+
+    ctrl_surface_start_y: npt.NDArray[np.floating]
+    ctrl_surface_end_y: npt.NDArray[np.floating]
+    ctrl_surface_x_over_c: npt.NDArray[np.floating]
+
+    def __post_init__(self):
+        arrays = np.broadcast_arrays(
+            *(np.asarray(getattr(self, f), dtype=float) for f in PLANFORM_FIELDS)
+        )
+        arrays = [np.atleast_1d(a).copy() for a in arrays]
+        for f, a in zip(PLANFORM_FIELDS, arrays):
+            setattr(self, f, a)
+
+        n = len(arrays[0])
+        name = np.atleast_1d(np.asarray(self.name, dtype=str))
+        self.name = np.broadcast_to(name, (n,)) if len(name) == 1 else name
+
+    def __len__(self) -> int:
+        return len(self.centerbody_halfspan)
+
+    @classmethod
+    def from_configs(cls, configs: Sequence[PlanformParameters]) -> "PlanformBatch":
+        return cls(
+            name=[c.name for c in configs],
+            **{f: [getattr(c, f) for c in configs] for f in PLANFORM_FIELDS},
+        )
+
+    @classmethod
+    def from_table(cls, table: "ParameterTable[PlanformParameters]") -> "PlanformBatch":
+        """
+        Batch reading the columns of a `ParameterTable` of planforms.
+        """
+        return cls(
+            name=table.column("name"),
+            **{f: table.column(f) for f in PLANFORM_FIELDS},
+        )
+
+    def config(self, i: int) -> PlanformParameters:
+        """
+        A single planform of the batch.
+        """
+        return PlanformParameters(
+            name=str(self.name[i]),
+            **{f: float(getattr(self, f)[i]) for f in PLANFORM_FIELDS},
+        )
+
+    def span_stations(self) -> SpanStations:
+        """
+        Span stations of every planform; see `planform_span_stations`.
+        """
+        wing_tip_y = self.wing_halfspan + self.centerbody_halfspan
+        x_le_wingtip = (
+            np.tan(np.deg2rad(self.wing_root_le_sweep_angle)) * self.wing_halfspan
+            + self.wing_root_le
+        )
+        chord_tip = self.wing_root_chord * self.wing_taper_ratio
+
+        # lerp along the wing to the control surface stations
+        def along_wing(y, root, tip):
+            t = (y - self.centerbody_halfspan[:, None]) / self.wing_halfspan[:, None]
+            return root + np.clip(t, 0, 1) * (tip - root)
+
+        cs_y = np.stack([self.ctrl_surface_start_y, self.ctrl_surface_end_y], -1)
+        x_le_cs = along_wing(cs_y, self.wing_root_le[:, None], x_le_wingtip[:, None])
+        chord_cs = along_wing(cs_y, self.wing_root_chord[:, None], chord_tip[:, None])
+        hinge_cs = x_le_cs + chord_cs * (1 - self.ctrl_surface_x_over_c[:, None])
+
+        zeros = np.zeros(len(self))
+        nans = np.full(len(self), np.nan)
+
+        y = np.stack(
+            [
+                zeros,
+                self.midbody_y,
+                self.centerbody_halfspan,
+                cs_y[:, 0],
+                cs_y[:, 1],
+                wing_tip_y,
+            ],
+            axis=-1,
+        )
+        xle = np.stack(
+            [
+                zeros,
+                self.midbody_xle,
+                self.wing_root_le,
+                x_le_cs[:, 0],
+                x_le_cs[:, 1],
+                x_le_wingtip,
+            ],
+            axis=-1,
+        )
+        chord = np.stack(
+            [
+                self.centerbody_chord,
+                self.midbody_chord,
+                self.wing_root_chord,
+                chord_cs[:, 0],
+                chord_cs[:, 1],
+                chord_tip,
+            ],
+            axis=-1,
+        )
+        hinge_line = np.stack(
+            [nans, nans, nans, hinge_cs[:, 0], hinge_cs[:, 1], nans], axis=-1
+        )
+
+        return SpanStations(y, xle, chord, xle + chord, hinge_line)
+
+    def span_stations_frame(self, i: int) -> pd.DataFrame:
+        """
+        Span stations of one planform, as from `planform_span_stations`.
+        """
+        stations = self.span_stations()
+        return pd.DataFrame(
+            {k: v[i] for k, v in stations._asdict().items()},
+            index=list(STATION_NAMES),
+        )
+
+    def stats(self) -> dict[str, npt.NDArray[np.floating]]:
+        """
+        Planform properties of every planform, the columns of
+        `planform_stats` as arrays of shape (n_planforms,).
+        """
+        st = self.span_stations()
+
+        def segment(start, stop):
+            # single-sided (y, x) polygon between two stations
+            le = np.stack([st.Y[:, start : stop + 1], st.XLE[:, start : stop + 1]], -1)
+            te = np.stack([st.Y[:, start : stop + 1], st.XTE[:, start : stop + 1]], -1)
+            return np.concatenate([le, te[:, ::-1]], axis=1)
+
+        def full():
+            le = np.stack([st.Y, st.XLE], -1)
+            te = np.stack([st.Y, st.XTE], -1)[:, ::-1]
+            mirror = np.array([-1.0, 1.0])
+            return np.concatenate(
+                [le, te, te[:, ::-1] * mirror, le[:, ::-1] * mirror], axis=1
+            )
+
+        def area_centroid(points):
+            # points are (y, x), so the chordwise centroid is the second one
+            props = polygon_properties(points)
+            return np.abs(props.area), props.cy
+
+        full_area, full_centroid = area_centroid(full())
+        wing_area, wing_centroid = area_centroid(segment(WING_ROOT, WING_TIP))
+        cb_area, cb_centroid = area_centroid(segment(CENTER, WING_ROOT))
+        cb_1_area = area_centroid(segment(CENTER, MIDBODY))[0]
+        cb_2_area = area_centroid(segment(MIDBODY, WING_ROOT))[0]
+
+        overall_span = st.Y.max(axis=-1) * 2
+        wing_span = st.Y[:, WING_TIP] - st.Y[:, WING_ROOT]
+        cb_span = st.Y[:, WING_ROOT] - st.Y[:, CENTER]
+
+        # MACs of the three trapezoids, area weighted
+        c = st.chord
+        mac_1 = _trapezoid_mac(c[:, CENTER], c[:, MIDBODY])
+        mac_2 = _trapezoid_mac(c[:, MIDBODY], c[:, WING_ROOT])
+        wing_mac = _trapezoid_mac(c[:, WING_ROOT], c[:, WING_TIP])
+        cb_mac = (mac_1 * cb_1_area + mac_2 * cb_2_area) / (cb_1_area + cb_2_area)
+        overall_mac = (mac_1 * cb_1_area + mac_2 * cb_2_area + wing_mac * wing_area) / (
+            cb_1_area + cb_2_area + wing_area
+        )
+
+        return {
+            "overall_area": full_area / 1e6,
+            "overall_span": overall_span,
+            "overall_mean_aerodynamic_chord": overall_mac,
+            "overall_aspect_ratio": overall_span**2 / full_area,
+            "overall_centroid": full_centroid,
+            "wing_span": wing_span,
+            "wing_half_area": wing_area / 1e6,
+            "wing_mean_aerodynamic_chord": wing_mac,
+            "wing_aspect_ratio": wing_span**2 / wing_area * 2,
+            "wing_centroid": wing_centroid,
+            "centerbody_span": cb_span,
+            "centerbody_half_area": cb_area / 1e6,
+            "centerbody_mean_aerodynamic_chord": cb_mac,
+            "centerbody_aspect_ratio": cb_span**2 / cb_area * 2,
+            "centerbody_centroid": cb_centroid,
+        }
+
+    def stats_frame(self) -> pd.DataFrame:
+        """
+        `stats` as a DataFrame indexed by name, like `planform_stats`.
+        """
+        return pd.DataFrame(self.stats(), index=self.name)
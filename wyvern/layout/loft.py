@@ -0,0 +1,222 @@
+"""
+Lofted outer mould line of the blended wing body.
+
+The surface is a structured mesh: one ring of points per spanwise station,
+each ring the twisted section (upper surface trailing edge to leading edge,
+then lower surface back to the trailing edge), with neighbouring rings
+joined by triangles and the tips closed by caps. Vertices are in m
+(x aft, y to starboard, z up), over the full span.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from wyvern.data.airfoils import BOEING_VERTOL, NACA0018
+from wyvern.utils.airfoil_utils import blend_sections
+from wyvern.utils.geom_utils import refine_stations
+
+# binary STL facet: normal, three vertices and an unused attribute count
+STL_FACET = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
+
+@dataclass
+class LoftMesh:
+    """
+    vertices: shape (n_stations * n_ring, 3), ring after ring
+    faces: vertex indices of each triangle, shape (n_faces, 3), normals
+        (right-hand rule) pointing out of the body
+    n_stations, n_ring: spanwise stations and points per ring
+    """
+
+    vertices: npt.NDArray[np.floating]
+    faces: npt.NDArray[np.integer]
+    n_stations: int
+    n_ring: int
+
+    @property
+    def grid(self) -> npt.NDArray[np.floating]:
+        """
+        Vertices as the structured grid, shape (n_stations, n_ring, 3).
+        """
+        return self.vertices.reshape(self.n_stations, self.n_ring, 3)
+
+    def _triangles(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        v = self.vertices
+        return v[self.faces[:, 0]], v[self.faces[:, 1]], v[self.faces[:, 2]]
+
+    def normals(self) -> npt.NDArray[np.floating]:
+        """
+        Outward area vectors of the faces (twice the area times the unit
+        normal), shape (n_faces, 3).
+        """
+        v0, v1, v2 = self._triangles()
+        return np.cross(v1 - v0, v2 - v0)
+
+    @property
+    def wetted_area(self) -> float:
+        """
+        Surface area of the mesh (m^2), tip caps included.
+        """
+        return float(np.linalg.norm(self.normals(), axis=1).sum() / 2)
+
+    @property
+    def volume(self) -> float:
+        """
+        Enclosed volume (m^3), by the divergence theorem over the faces.
+        """
+        v0, v1, v2 = self._triangles()
+        return float(np.einsum("ij,ij->", v0, np.cross(v1, v2)) / 6)
+
+
+def _ring_faces(n_stations: int, n_ring: int) -> npt.NDArray[np.integer]:
+    """
+    Two triangles per quad between consecutive rings, rings closed around
+    the trailing edge.
+    """
+    j, i = np.meshgrid(np.arange(n_stations - 1), np.arange(n_ring), indexing="ij")
+    a = j * n_ring + i
+    b = j * n_ring + (i + 1) % n_ring
+    c = b + n_ring
+    d = a + n_ring
+    faces = np.stack(
+        [np.stack([a, c, b], axis=-1), np.stack([a, d, c], axis=-1)], axis=2
+    )
+    return faces.reshape(-1, 3)
+
+
+def _cap_faces(n_points: int, offset: int, outward_y: bool) -> np.ndarray:
+    """
+    Strips between the upper and lower surfaces of a ring at matching x/c,
+    which triangulates any section with the upper surface above the lower.
+    """
+    i = np.arange(n_points - 1)
+    top_i, top_next = n_points - 1 - i, n_points - 2 - i
+    bot_i, bot_next = n_points - 1 + i, n_points + i
+    first = np.stack([top_i, top_next, bot_next], axis=-1)
+    # top and bottom share the leading edge point, so skip the degenerate one
+    second = np.stack([top_i, bot_next, bot_i], axis=-1)[1:]
+    faces = np.concatenate([first, second]) + offset
+    return faces if outward_y else faces[:, ::-1]
+
+
+def loft_planform(
+    df: pd.DataFrame,
+    section_y: npt.ArrayLike = None,
+    sections: list[npt.NDArray[np.floating]] = None,
+    twist: npt.ArrayLike = 0.0,
+    twist_xc: float = 0.5,
+    n_span: int = 60,
+    num_points: int = 61,
+) -> LoftMesh:
+    """
+    Loft the airfoil sections over the planform.
+
+    df: span stations (mm), from `planform_span_stations`
+    section_y, sections: half-span positions (mm) and unit-chord coordinates
+        of the sections, blended between as in `blend_sections`; by default
+        NACA0018 over the centerbody and BOEING_VERTOL from the wing root
+        outboard, as in `Structure`
+    twist: twist (degrees) at each row of `df`, interpolated along the span;
+        sections are rotated rigidly about `twist_xc` of the chord
+    n_span: approximate number of spanwise intervals per side; every span
+        station gets a ring
+    num_points: points per surface of each section
+    """
+    y_st = df.Y.to_numpy(dtype=float)
+    if sections is None:
+        section_y = [0.0, df.Y["wing_root"], df.Y["wing_root"]]
+        sections = [NACA0018, NACA0018, BOEING_VERTOL]
+
+    y_half = refine_stations(y_st, n_span)
+    y = np.concatenate([-y_half[:0:-1], y_half])
+    y_abs = np.abs(y)
+
+    # stations are sorted by y, with the control surface stations on the wing
+    # edges, so duplicates interpolate consistently
+    order = np.argsort(y_st, kind="stable")
+    xle = np.interp(y_abs, y_st[order], df.XLE.to_numpy(dtype=float)[order]) * 1e-3
+    chord = np.interp(y_abs, y_st[order], df.chord.to_numpy(dtype=float)[order]) * 1e-3
+    twist = np.broadcast_to(np.asarray(twist, dtype=float), y_st.shape)
+    twist = np.interp(y_abs, y_st[order], twist[order])
+
+    x, y_top, y_bot = blend_sections(y_abs, section_y, sections, num_points)
+
+    # upper surface from the trailing edge forward, then the lower surface aft
+    c = chord[:, None]
+    x_rel = np.concatenate([x[::-1], x[1:]])[None, :] * c - twist_xc * c
+    z = np.concatenate([y_top[:, ::-1], y_bot[:, 1:]], axis=1) * c
+
+    # rigid rotation about twist_xc, so twisted sections keep their shape
+    cos_t = np.cos(np.deg2rad(twist))[:, None]
+    sin_t = np.sin(np.deg2rad(twist))[:, None]
+    ring_x = x_rel * cos_t - z * sin_t + twist_xc * c
+    ring_z = x_rel * sin_t + z * cos_t
+    n_stations, n_ring = ring_x.shape
+
+    vertices = np.empty((n_stations, n_ring, 3))
+    vertices[..., 0] = ring_x + xle[:, None]
+    vertices[..., 1] = y[:, None] * 1e-3
+    vertices[..., 2] = ring_z
+
+    faces = np.concatenate(
+        [
+            _ring_faces(n_stations, n_ring),
+            _cap_faces(num_points, 0, outward_y=False),
+            _cap_faces(num_points, (n_stations - 1) * n_ring, outward_y=True),
+        ]
+    )
+
+    return LoftMesh(
+        np.ascontiguousarray(vertices.reshape(-1, 3)),
+        np.ascontiguousarray(faces, dtype=np.int64),
+        n_stations,
+        n_ring,
+    )
+
+
+def write_stl(
+    mesh: LoftMesh,
+    path: str | Path,
+    chunk_size: int = 65536,
+    header: bytes = b"wyvern loft",
+) -> None:
+    """
+    Write the mesh as binary STL, `chunk_size` facets at a time.
+    """
+    n_faces = len(mesh.faces)
+    with open(path, "wb") as f:
+        f.write(header[:80].ljust(80, b"\0"))
+        f.write(np.uint32(n_faces).tobytes())
+
+        facets = np.zeros(min(chunk_size, n_faces), dtype=STL_FACET)
+        for start in range(0, n_faces, chunk_size):
+            faces = mesh.faces[start : start + chunk_size]
+            chunk = facets[: len(faces)]
+            tri = mesh.vertices[faces]
+            normal = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+            length = np.linalg.norm(normal, axis=1, keepdims=True)
+            chunk["normal"] = np.divide(
+                normal, length, out=np.zeros_like(normal), where=length > 0
+            )
+            chunk["vertices"] = tri
+            f.write(chunk.tobytes())
+
+
+def write_obj(mesh: LoftMesh, path: str | Path, chunk_size: int = 65536) -> None:
+    """
+    Write the mesh as Wavefront OBJ, `chunk_size` lines at a time.
+    """
+    with open(path, "w") as f:
+        for start in range(0, len(mesh.vertices), chunk_size):
+            np.savetxt(
+                f, mesh.vertices[start : start + chunk_size], fmt="v %.9g %.9g %.9g"
+            )
+        for start in range(0, len(mesh.faces), chunk_size):
+            # OBJ indices are one based
+            np.savetxt(f, mesh.faces[start : start + chunk_size] + 1, fmt="f %d %d %d")
@@ -0,0 +1,319 @@
+"""
+Gradient-based planform tuning.
+
+The planform is three trapezoids per side (centerbody, midbody and wing;
+the control surface stations lie on the wing edges), so areas, first
+moments and MACs are polynomials in the station coordinates and their
+gradients with respect to every `PlanformParameters` field are exact.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Sequence
+
+import numpy as np
+import numpy.typing as npt
+from scipy.optimize import minimize
+
+from wyvern.analysis.parameters import PlanformParameters
+from wyvern.layout.batch import PLANFORM_FIELDS
+
+N_FIELDS = len(PLANFORM_FIELDS)
+_IDX = {f: i for i, f in enumerate(PLANFORM_FIELDS)}
+
+# bounds used for free fields unless given; lengths in mm, angles in degrees
+DEFAULT_BOUNDS = {
+    "wing_taper_ratio": (0.05, 1.0),
+    "wing_root_le_sweep_angle": (-45.0, 75.0),
+    "ctrl_surface_x_over_c": (0.05, 0.5),
+}
+
+PROPERTIES = (
+    "overall_area",
+    "overall_span",
+    "overall_aspect_ratio",
+    "overall_centroid",
+    "overall_mean_aerodynamic_chord",
+    "wing_aspect_ratio",
+    "ctrl_surface_span",
+)
+
+
+def _e(field: str) -> npt.NDArray[np.floating]:
+    e = np.zeros(N_FIELDS)
+    e[_IDX[field]] = 1.0
+    return e
+
+
+def _stations(
+    x: npt.NDArray[np.floating],
+) -> tuple[npt.NDArray, ...]:
+    """
+    y, xle and chord of the center, midbody, wing root and wing tip stations,
+    each shape (4,), and their gradients, each shape (4, n_fields).
+    """
+    p = dict(zip(PLANFORM_FIELDS, x))
+    sweep = np.deg2rad(p["wing_root_le_sweep_angle"])
+
+    y = np.array(
+        [
+            0.0,
+            p["midbody_y"],
+            p["centerbody_halfspan"],
+            p["centerbody_halfspan"] + p["wing_halfspan"],
+        ]
+    )
+    xle = np.array(
+        [
+            0.0,
+            p["midbody_xle"],
+            p["wing_root_le"],
+            p["wing_root_le"] + np.tan(sweep) * p["wing_halfspan"],
+        ]
+    )
+    chord = np.array(
+        [
+            p["centerbody_chord"],
+            p["midbody_chord"],
+            p["wing_root_chord"],
+            p["wing_root_chord"] * p["wing_taper_ratio"],
+        ]
+    )
+
+    zero = np.zeros(N_FIELDS)
+    dy = np.stack(
+        [
+            zero,
+            _e("midbody_y"),
+            _e("centerbody_halfspan"),
+            _e("centerbody_halfspan") + _e("wing_halfspan"),
+        ]
+    )
+    dxle = np.stack(
+        [
+            zero,
+            _e("midbody_xle"),
+            _e("wing_root_le"),
+            _e("wing_root_le")
+            + np.tan(sweep) * _e("wing_halfspan")
+            + p["wing_halfspan"]
+            / np.cos(sweep) ** 2
+            * np.deg2rad(1)
+            * _e("wing_root_le_sweep_angle"),
+        ]
+    )
+    dchord = np.stack(
+        [
+            _e("centerbody_chord"),
+            _e("midbody_chord"),
+            _e("wing_root_chord"),
+            p["wing_taper_ratio"] * _e("wing_root_chord")
+            + p["wing_root_chord"] * _e("wing_taper_ratio"),
+        ]
+    )
+
+    return y, xle, chord, dy, dxle, dchord
+
+
+def planform_properties(
+    x: npt.NDArray[np.floating],
+) -> dict[str, tuple[float, npt.NDArray[np.floating]]]:
+    """
+    Properties of a planform and their gradients.
+
+    x: values of the `PLANFORM_FIELDS`, in order
+    Returns {name: (value, gradient)} for each of `PROPERTIES`, named and
+    in the units of the `planform_stats` columns; ctrl_surface_span in mm.
+    """
+    y, a, c, dy, da, dc = _stations(np.asarray(x, dtype=float))
+
+    # segments between consecutive stations, per side
+    y0, y1, a0, a1, c0, c1 = y[:-1], y[1:], a[:-1], a[1:], c[:-1], c[1:]
+    dy0, dy1, da0, da1, dc0, dc1 = dy[:-1], dy[1:], da[:-1], da[1:], dc[:-1], dc[1:]
+    span_y = y1 - y0
+    d_span_y = dy1 - dy0
+
+    # areas
+    area = span_y * (c0 + c1) / 2
+    d_area = d_span_y * ((c0 + c1) / 2)[:, None] + (span_y / 2)[:, None] * (dc0 + dc1)
+
+    # chordwise first moments, int (xte^2 - xle^2) / 2 dy
+    t0, t1 = a0 + c0, a1 + c1
+    dt0, dt1 = da0 + dc0, da1 + dc1
+    s = (t0**2 + t0 * t1 + t1**2) - (a0**2 + a0 * a1 + a1**2)
+    ds = ((2 * t0 + t1)[:, None] * dt0 + (t0 + 2 * t1)[:, None] * dt1) - (
+        (2 * a0 + a1)[:, None] * da0 + (a0 + 2 * a1)[:, None] * da1
+    )
+    moment = span_y * s / 6
+    d_moment = d_span_y * (s / 6)[:, None] + (span_y / 6)[:, None] * ds
+
+    # MACs of the trapezoids
+    mac = 2 / 3 * (c0 + c1 - c0 * c1 / (c0 + c1))
+    dmac_dc0 = 2 / 3 * (1 - c1**2 / (c0 + c1) ** 2)
+    dmac_dc1 = 2 / 3 * (1 - c0**2 / (c0 + c1) ** 2)
+    d_mac = dmac_dc0[:, None] * dc0 + dmac_dc1[:, None] * dc1
+
+    half_area, d_half_area = area.sum(), d_area.sum(axis=0)
+    span, d_span = 2 * y[-1], 2 * dy[-1]
+    full_area, d_full_area = 2 * half_area, 2 * d_half_area
+
+    centroid = moment.sum() / half_area
+    d_centroid = (d_moment.sum(axis=0) - centroid * d_half_area) / half_area
+
+    overall_mac = np.sum(mac * area) / half_area
+    d_overall_mac = (
+        np.sum(d_mac * area[:, None] + mac[:, None] * d_area, axis=0)
+        - overall_mac * d_half_area
+    ) / half_area
+
+    ar = span**2 / full_area
+    d_ar = (2 * span * d_span - ar * d_full_area) / full_area
+
+    wing_span, d_wing_span = span_y[-1], d_span_y[-1]
+    wing_ar = 2 * wing_span**2 / area[-1]
+    d_wing_ar = (4 * wing_span * d_wing_span - wing_ar * d_area[-1]) / area[-1]
+
+    return {
+        "overall_area": (full_area / 1e6, d_full_area / 1e6),
+        "overall_span": (span, d_span),
+        "overall_aspect_ratio": (ar, d_ar),
+        "overall_centroid": (centroid, d_centroid),
+        "overall_mean_aerodynamic_chord": (overall_mac, d_overall_mac),
+        "wing_aspect_ratio": (wing_ar, d_wing_ar),
+        "ctrl_surface_span": (
+            x[_IDX["ctrl_surface_end_y"]] - x[_IDX["ctrl_surface_start_y"]],
+            _e("ctrl_surface_end_y") - _e("ctrl_surface_start_y"),
+        ),
+    }
+
+
+@dataclass
+class PlanformOptimizationResult:
+    """
+    planform: optimized planform
+    properties: values of `PROPERTIES` for the optimized planform
+    success, message, iterations: from the optimizer
+    """
+
+    planform: PlanformParameters
+    properties: dict[str, float]
+    success: bool
+    message: str
+    iterations: int
+
+
+def optimize_planform(
+    initial: PlanformParameters,
+    targets: dict[str, float],
+    constraints: dict[str, tuple[float | None, float | None]] = None,
+    free: Sequence[str] = None,
+    bounds: dict[str, tuple[float | None, float | None]] = None,
+    weights: dict[str, float] = None,
+) -> PlanformOptimizationResult:
+    """
+    Tune a planform to hit property targets, within constraints.
+
+    Minimizes the weighted sum of squared relative target errors with SLSQP
+    and exact gradients. The stations are kept in order along the span.
+
+    targets: {property: target value}, for any of `PROPERTIES`
+    constraints: {property: (lower, upper)}, either may be None
+    free: fields that may change, all by default
+    bounds: {field: (lower, upper)} for free fields; defaults to
+        `DEFAULT_BOUNDS`, or non-negative for lengths
+    """
+    constraints = constraints or {}
+    bounds = {**DEFAULT_BOUNDS, **(bounds or {})}
+    weights = weights or {}
+    free = list(PLANFORM_FIELDS if free is None else free)
+    for name in list(targets) + list(constraints):
+        if name not in PROPERTIES:
+            raise ValueError(f"Unknown planform property {name}.")
+
+    x0 = np.array([getattr(initial, f) for f in PLANFORM_FIELDS], dtype=float)
+    free_idx = np.array([_IDX[f] for f in free])
+    # optimize over scaled variables, of order 1
+    scale = np.maximum(np.abs(x0[free_idx]), 1.0)
+
+    def full_x(z):
+        x = x0.copy()
+        x[free_idx] = z * scale
+        return x
+
+    def objective(z):
+        props = planform_properties(full_x(z))
+        f, grad = 0.0, np.zeros(N_FIELDS)
+        for name, target in targets.items():
+            value, d_value = props[name]
+            w = weights.get(name, 1.0) / max(abs(target), 1e-12) ** 2
+            f += w * (value - target) ** 2
+            grad += 2 * w * (value - target) * d_value
+        return f, grad[free_idx] * scale
+
+    scipy_constraints = []
+    for name, (lower, upper) in constraints.items():
+        for bound, sign in [(lower, 1.0), (upper, -1.0)]:
+            if bound is None:
+                continue
+            scipy_constraints.append(
+                {
+                    "type": "ineq",
+                    "fun": lambda z, n=name, b=bound, s=sign: (
+                        s * (planform_properties(full_x(z))[n][0] - b)
+                    ),
+                    "jac": lambda z, n=name, s=sign: (
+                        s * planform_properties(full_x(z))[n][1][free_idx] * scale
+                    ),
+                }
+            )
+
+    # stations in order: midbody, wing root, control surface, wing tip
+    order = [
+        ("midbody_y", "centerbody_halfspan"),
+        ("centerbody_halfspan", "ctrl_surface_start_y"),
+        ("ctrl_surface_start_y", "ctrl_surface_end_y"),
+    ]
+    for inner, outer in order:
+        row = _e(outer) - _e(inner)
+        scipy_constraints.append(
+            {
+                "type": "ineq",
+                "fun": lambda z, r=row: r @ full_x(z),
+                "jac": lambda z, r=row: r[free_idx] * scale,
+            }
+        )
+    tip = _e("centerbody_halfspan") + _e("wing_halfspan") - _e("ctrl_surface_end_y")
+    scipy_constraints.append(
+        {
+            "type": "ineq",
+            "fun": lambda z: tip @ full_x(z),
+            "jac": lambda z: tip[free_idx] * scale,
+        }
+    )
+
+    z_bounds = []
+    for f, s in zip(free, scale):
+        lower, upper = bounds.get(f, (0.0, None))
+        z_bounds.append(
+            (
+                None if lower is None else lower / s,
+                None if upper is None else upper / s,
+            )
+        )
+
+    result = minimize(
+        objective,
+        x0[free_idx] / scale,
+        jac=True,
+        bounds=z_bounds,
+        constraints=scipy_constraints,
+        method="SLSQP",
+        options={"ftol": 1e-12, "maxiter": 200},
+    )
+
+    x = full_x(result.x)
+    planform = replace(initial, **{f: float(x[_IDX[f]]) for f in free})
+    properties = {k: float(v) for k, (v, _) in planform_properties(x).items()}
+
+    return PlanformOptimizationResult(
+        planform, properties, bool(result.success), result.message, result.nit
+    )
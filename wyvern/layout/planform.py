@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 
 from wyvern.analysis.parameters import PlanformParameters
-from wyvern.utils.geom_utils import area_of_points, centroid_of_polyshape
+from wyvern.utils.geom_utils import area_of_points, polygon_properties_ragged
 
 
 def planform_span_stations(conf: PlanformParameters) -> pd.DataFrame:
@@ -319,31 +319,37 @@ def planform_stats(configuration: PlanformParameters) -> pd.DataFrame:
     """
     df = planform_span_stations(configuration)
 
+    full_pts = full_planform_points(df)
+    wing_pts = wing_points(df)
+    cb_pts = centerbody_points(df)
+
+    # all three polygons in one pass
+    polygons = [full_pts, wing_pts, cb_pts]
+    offsets = np.cumsum([0] + [len(p) for p in polygons])
+    props = polygon_properties_ragged(np.concatenate(polygons), offsets)
+    full_area, wing_half_area, cb_half_area = np.abs(props.area)
+
     # full aircraft
     # aspect ratio
     overall_span = df.Y.max() * 2
-    overall_ar = overall_span**2 / area_of_points(full_planform_points(df))
-
-    full_pts = full_planform_points(df)
-    overall_centroid = centroid_of_polyshape(full_pts)
+    overall_ar = overall_span**2 / full_area
+    overall_centroid = props.cy[0]
 
     # just wings
-    wing_pts = wing_points(df)
     wing_span = wing_pts[:, 0].max() - wing_pts[:, 0].min()
-    wing_ar = wing_span**2 / area_of_points(wing_pts) * 2
+    wing_ar = wing_span**2 / wing_half_area * 2
     # multiply by 2 because two wing halves
-    wing_centroid = centroid_of_polyshape(wing_pts)
+    wing_centroid = props.cy[1]
 
     # just centerbody
-    cb_pts = centerbody_points(df)
     cb_span = cb_pts[:, 0].max() - cb_pts[:, 0].min()
-    cb_ar = cb_span**2 / area_of_points(cb_pts) * 2
-    cb_centroid = centroid_of_polyshape(cb_pts)
+    cb_ar = cb_span**2 / cb_half_area * 2
+    cb_centroid = props.cy[2]
 
     # areas
-    area = area_of_points(full_pts) / 1e6
-    cb_area = area_of_points(cb_pts) / 1e6
-    wing_area = area_of_points(wing_pts) / 1e6
+    area = full_area / 1e6
+    cb_area = cb_half_area / 1e6
+    wing_area = wing_half_area / 1e6
 
     # MACs
     overall_mac, cb_mac, wing_mac = mean_aerodynamic_chords(df)
@@ -354,17 +360,17 @@ def planform_stats(configuration: PlanformParameters) -> pd.DataFrame:
             "overall_span": overall_span,
             "overall_mean_aerodynamic_chord": overall_mac,
             "overall_aspect_ratio": overall_ar,
-            "overall_centroid": overall_centroid[1],
+            "overall_centroid": overall_centroid,
             "wing_span": wing_span,
             "wing_half_area": wing_area,
             "wing_mean_aerodynamic_chord": wing_mac,
             "wing_aspect_ratio": wing_ar,
-            "wing_centroid": wing_centroid[1],
+            "wing_centroid": wing_centroid,
             "centerbody_span": cb_span,
             "centerbody_half_area": cb_area,
             "centerbody_mean_aerodynamic_chord": cb_mac,
             "centerbody_aspect_ratio": cb_ar,
-            "centerbody_centroid": cb_centroid[1],
+            "centerbody_centroid": cb_centroid,
         },
         index=[configuration.name],
     )
@@ -1,7 +1,10 @@
+import numpy as np
 from matplotlib import pyplot as plt
 from matplotlib import rcParams
+from matplotlib.transforms import Bbox
 from matplotlib.widgets import Slider
 
+from wyvern.layout.batch import PlanformBatch, SpanStations
 from wyvern.layout.planform import (
     PlanformParameters,
     centerbody_points,
@@ -109,13 +112,49 @@ def planform_viz_simple(configuration: PlanformParameters):
     plt.ylabel("$x$ (mm)")
 
 
-def planform_viz_interactive(base_config: PlanformParameters):
+def _outline_points(stations: SpanStations) -> tuple[np.ndarray, np.ndarray]:
     """
-    Launches interactive visualization of planform parameters.
+    Full planform outline and both hinge lines of the first planform in
+    `stations`, as (y, x) points; same as `full_planform_points` and
+    `control_surface_points`.
+    """
+    le = np.stack([stations.Y[0], stations.XLE[0]], axis=-1)
+    te = np.stack([stations.Y[0], stations.XTE[0]], axis=-1)[::-1]
+    mirror = np.array([-1.0, 1.0])
+    outline = np.concatenate([le, te, te[::-1] * mirror, le[::-1] * mirror])
+
+    hinge = np.stack([stations.Y[0, 3:5], stations.hinge_line[0, 3:5]], axis=-1)
+    hinges = np.concatenate([hinge, [[np.nan, np.nan]], hinge * mirror])
+    return outline, hinges
+
+
+def _stats_text(stats: dict[str, np.ndarray]) -> str:
+    s = {k: v[0] for k, v in stats.items()}
+    return (
+        f"Overall Area: {s['overall_area']:.4f} m^2\n"
+        f"Overall AR: {s['overall_aspect_ratio']:.4f}\n"
+        f"Overall (Full) Span: {s['overall_span']:.4f} mm\n"
+        f"Overall MAC: {s['overall_mean_aerodynamic_chord']:.4f} mm\n"
+        f"Wing Half Area: {s['wing_half_area']:.4f} m^2\n"
+        f"Wing AR: {s['wing_aspect_ratio']:.4f}\n"
+        f"Centerbody Half Area: {s['centerbody_half_area']:.4f} m^2\n"
+        f"Centerbody AR: {s['centerbody_aspect_ratio']:.4f}\n"
+        f"Overall Centroid (x): {s['overall_centroid']:.4f} mm\n"
+        f"Wing Centroid (x): {s['wing_centroid']:.4f} mm\n"
+        f"Centerbody Centroid (x): {s['centerbody_centroid']:.4f} mm\n"
+        f"Wing Mean Aerodynamic Chord: {s['wing_mean_aerodynamic_chord']:.4f} mm\n"
+        f"Proportion of Wing Area: {2 * s['wing_half_area'] / s['overall_area']:.4f}\n"
+    )
 
-    UI:
-    | Plot | Text Stats |
-    |       Sliders     |
+
+def _build_planform_tuner(base_config: PlanformParameters, interval: int = 30):
+    """
+    Figure, sliders and slider attributes of the interactive planform tuner.
+
+    Slider events are coalesced by a timer firing at most every `interval`
+    ms. Each update sets the data of the existing artists and blits them over
+    a cached background; the figure is only fully redrawn when the planform
+    outgrows the view.
     """
     # styling
     plt.style.use("dark_background")
@@ -130,6 +169,7 @@ def planform_viz_interactive(base_config: PlanformParameters):
     # create tiled layout for ui
     fig, axs = plt.subplot_mosaic([["plot", "stats"]], figsize=(12, 7))
     fig.subplots_adjust(bottom=0.04 * len(attrs) + 0.07)
+    canvas = fig.canvas
 
     axs["plot"].set_title("Planform Visualization")
     axs["plot"].set_xlabel("x (mm)")
@@ -139,11 +179,11 @@ def planform_viz_interactive(base_config: PlanformParameters):
     axs["stats"].set_title("Planform Stats")
     axs["stats"].axis("off")  # hide axes
 
-    # Create elements to update when sliders change
+    # Create elements to update when sliders change; animated artists are
+    # left out of the background and blitted on top of it
     # main viz
-    (planform_plot,) = axs["plot"].plot([], [], "-", color="white")
-    (ctrl_srf_l,) = axs["plot"].plot([], [], "r-")
-    (ctrl_srf_r,) = axs["plot"].plot([], [], "r-")
+    (planform_plot,) = axs["plot"].plot([], [], "-", color="white", animated=True)
+    (ctrl_srf,) = axs["plot"].plot([], [], "r-", animated=True)
 
     # stats
     # text box for stats
@@ -154,69 +194,9 @@ def planform_viz_interactive(base_config: PlanformParameters):
         horizontalalignment="left",
         verticalalignment="center",
         transform=axs["stats"].transAxes,
+        animated=True,
     )
 
-    def _update_plot(_):
-        # update all attrs
-        for attr, slider in zip(attrs, sliders):
-            setattr(base_config, attr, slider.val)
-
-        # sanity check
-        if (
-            base_config.wing_halfspan + base_config.centerbody_halfspan
-            < base_config.ctrl_surface_end_y
-        ):
-            base_config.ctrl_surface_end_y = (
-                base_config.wing_halfspan + base_config.centerbody_halfspan
-            )
-            sliders[attrs.index("ctrl_surface_end_y")].set_val(
-                base_config.ctrl_surface_end_y
-            )
-        elif (
-            base_config.ctrl_surface_end_y
-            > base_config.wing_halfspan + base_config.centerbody_halfspan
-        ):
-            base_config.wing_halfspan = (
-                base_config.ctrl_surface_end_y - base_config.centerbody_halfspan
-            )
-            sliders[attrs.index("wing_halfspan")].set_val(base_config.wing_halfspan)
-
-        # update plot
-        df = planform_span_stations(base_config)
-        pts = full_planform_points(df)
-        ctl_surf_l_pts, ctl_surf_r_pts = control_surface_points(df)
-        planform_plot.set_xdata(pts[:, 0])
-        planform_plot.set_ydata(pts[:, 1])
-        ctrl_srf_l.set_xdata(ctl_surf_l_pts[:, 0])
-        ctrl_srf_l.set_ydata(ctl_surf_l_pts[:, 1])
-        ctrl_srf_r.set_xdata(ctl_surf_r_pts[:, 0])
-        ctrl_srf_r.set_ydata(ctl_surf_r_pts[:, 1])
-
-        # recalculate areas
-        stats = planform_stats(base_config)
-
-        stats_text.set_text(
-            f"Overall Area: {stats.loc[base_config.name, 'overall_area']:.4f} m^2\n"
-            f"Overall AR: {stats.loc[base_config.name, 'overall_aspect_ratio']:.4f}\n"
-            f"Overall (Full) Span: {stats.loc[base_config.name, 'overall_span']:.4f} mm\n"
-            f"Overall MAC: {stats.loc[base_config.name, 'overall_mean_aerodynamic_chord']:.4f} mm\n"
-            f"Wing Half Area: {stats.loc[base_config.name, 'wing_half_area']:.4f} m^2\n"
-            f"Wing AR: {stats.loc[base_config.name, 'wing_aspect_ratio']:.4f}\n"
-            f"Centerbody Half Area: {stats.loc[base_config.name, 'centerbody_half_area']:.4f} m^2\n"
-            f"Centerbody AR: {stats.loc[base_config.name, 'centerbody_aspect_ratio']:.4f}\n"
-            f"Overall Centroid (x): {stats.loc[base_config.name, 'overall_centroid']:.4f} mm\n"
-            f"Wing Centroid (x): {stats.loc[base_config.name, 'wing_centroid']:.4f} mm\n"
-            f"Centerbody Centroid (x): {stats.loc[base_config.name, 'centerbody_centroid']:.4f} mm\n"
-            f"Wing Mean Aerodynamic Chord: {stats.loc[base_config.name, 'wing_mean_aerodynamic_chord']:.4f} mm\n"
-            f"Proportion of Wing Area: {2*stats.loc[base_config.name, 'wing_half_area']/stats.loc[base_config.name, 'overall_area']:.4f}\n"
-        )
-
-        # resize plot to fit
-        axs["plot"].relim()
-        axs["plot"].autoscale_view()
-
-        fig.canvas.draw_idle()
-
     # add axes for sliders
     axs.update(
         {
@@ -225,7 +205,7 @@ def planform_viz_interactive(base_config: PlanformParameters):
         }
     )
 
-    # we will have one slider per attribute
+    # we will have one slider per attribute; drawn by blitting, not draw_idle
     sliders = [
         Slider(
             ax=axs[f"sliders_{attr}"],
@@ -240,10 +220,116 @@ def planform_viz_interactive(base_config: PlanformParameters):
         for attr in attrs
     ]
 
-    for slider in sliders:
-        slider.on_changed(_update_plot)
+    def _right_of(ax, pad=0.0):
+        # region from the axes to the right edge of the figure, which also
+        # holds text overflowing the axes
+        return lambda: Bbox.from_extents(
+            ax.bbox.x0,
+            ax.bbox.y0 - pad * ax.bbox.height,
+            fig.bbox.x1,
+            ax.bbox.y1 + pad * ax.bbox.height,
+        )
+
+    # blit regions, each with its own background and animated artists
+    regions = {
+        "plot": (lambda: axs["plot"].bbox, [planform_plot, ctrl_srf]),
+        "stats": (_right_of(axs["stats"]), [stats_text]),
+    }
+    for attr, slider in zip(attrs, sliders):
+        slider.drawon = False
+        regions[attr] = (
+            _right_of(slider.ax, pad=0.25),
+            [slider.poly, slider.valtext, *slider.ax.lines],
+        )
+    for _, artists in regions.values():
+        for artist in artists:
+            artist.set_animated(True)
+
+    backgrounds = {}
 
-    _update_plot(None)
+    def _blit(*names):
+        if not backgrounds or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        for name in names:
+            bbox, artists = regions[name]
+            canvas.restore_region(backgrounds[name])
+            for artist in artists:
+                artist.axes.draw_artist(artist)
+            canvas.blit(bbox())
+
+    def _on_draw(_):
+        for name, (bbox, artists) in regions.items():
+            backgrounds[name] = canvas.copy_from_bbox(bbox())
+            for artist in artists:
+                artist.axes.draw_artist(artist)
+
+    canvas.mpl_connect("draw_event", _on_draw)
+
+    pending = False
+
+    def _update_plot():
+        nonlocal pending
+        pending = False
+
+        # update all attrs
+        for attr, slider in zip(attrs, sliders):
+            setattr(base_config, attr, slider.val)
+
+        # sanity check
+        tip_y = base_config.wing_halfspan + base_config.centerbody_halfspan
+        if tip_y < base_config.ctrl_surface_end_y:
+            base_config.ctrl_surface_end_y = tip_y
+            sliders[attrs.index("ctrl_surface_end_y")].set_val(tip_y)
+
+        # update plot
+        batch = PlanformBatch.from_configs([base_config])
+        outline, hinges = _outline_points(batch.span_stations())
+        planform_plot.set_data(outline[:, 0], outline[:, 1])
+        ctrl_srf.set_data(hinges[:, 0], hinges[:, 1])
+        stats_text.set_text(_stats_text(batch.stats()))
+
+        # resize plot to fit, which needs a full redraw
+        ax = axs["plot"]
+        x_lim, y_lim = sorted(ax.get_xlim()), sorted(ax.get_ylim())
+        lo, hi = outline.min(axis=0), outline.max(axis=0)
+        if lo[0] < x_lim[0] or hi[0] > x_lim[1] or lo[1] < y_lim[0] or hi[1] > y_lim[1]:
+            ax.relim()
+            ax.autoscale_view()
+            canvas.draw_idle()
+        else:
+            _blit("plot", "stats")
+
+    # coalesce slider events: at most one update per timer interval
+    timer = canvas.new_timer(interval=interval)
+    timer.single_shot = True
+    timer.add_callback(_update_plot)
+
+    def _on_changed(attr):
+        nonlocal pending
+        _blit(attr)  # slider handle and value
+        if not pending:
+            pending = True
+            timer.start()
+
+    for attr, slider in zip(attrs, sliders):
+        slider.on_changed(lambda _, attr=attr: _on_changed(attr))
+
+    _update_plot()
+    canvas.draw_idle()
+
+    return fig, sliders, attrs
+
+
+def planform_viz_interactive(base_config: PlanformParameters):
+    """
+    Launches interactive visualization of planform parameters.
+
+    UI:
+    | Plot | Text Stats |
+    |       Sliders     |
+    """
+    _, sliders, attrs = _build_planform_tuner(base_config)
 
     plt.suptitle("Planform Tuner; Close Plot to Save Config")
     plt.show()
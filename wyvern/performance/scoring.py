@@ -40,6 +40,39 @@ def cargo_units(payload_config: tuple[int]) -> int:
     return cu
 
 
+def course_energy(
+    payload_config: tuple[int],
+    params: PayloadSizingParameters,
+) -> float:
+    """Battery energy to fly the course with a payload configuration.
+
+    Parameters
+    ----------
+    payload_config : tuple[int]
+        Number of each payload carried.
+    params : PayloadSizingParameters
+        Parameters for the analysis; `total_fixed_mass` may be an array.
+
+    Returns
+    -------
+    float
+        Energy in J, propulsive losses included.
+    """
+    mass = total_mass(payload_config, params.as_mass_ratio, params.total_fixed_mass)
+    return (
+        sum(
+            energy_consumption(
+                mass,
+                params.cruise_speed,
+                params.turn_speed,
+                params.aero_model,
+                params.planform_area,
+            )
+        )
+        / params.propulsive_efficiency
+    )
+
+
 def _flight_score_factors(
     payload_config: tuple[int],
     params: PayloadSizingParameters,
@@ -57,23 +90,12 @@ def _flight_score_factors(
     payload_mass_ = payload_mass(payload_config)
     mass = total_mass(payload_config, params.as_mass_ratio, params.total_fixed_mass)
 
-    energy = (
-        sum(
-            energy_consumption(
-                mass,
-                params.cruise_speed,
-                params.turn_speed,
-                params.aero_model,
-                params.planform_area,
-            )
-        )
-        / params.propulsive_efficiency
-    )
+    energy = course_energy(payload_config, params)
 
     efficiency_score = (3200 / energy) ** 2
 
     payload_fraction = payload_mass_ / mass
-    pf_score = min(0.25, payload_fraction)
+    pf_score = np.minimum(0.25, payload_fraction)
 
     # bonuses
     tb_score = 1.25 if params.short_takeoff else 1.0
@@ -103,4 +125,5 @@ def flight_score(
             Flight score.
     """
     factors = _flight_score_factors(payload_config, params)
-    return np.prod(factors)
+    # factors broadcast when params hold arrays, e.g. many fixed masses
+    return np.prod(np.broadcast_arrays(*factors), axis=0)
@@ -1,2 +1,13 @@
 from .aircraft_mass import total_component_mass, payload_mass, total_mass
-from .as_mtow_ratio import aerostructural_mass_ratio
+from .as_mtow_ratio import (
+    aerostructural_mass_ratio,
+    aerostructural_mass_ratio_interval,
+)
+
+__all__ = [
+    "aerostructural_mass_ratio",
+    "aerostructural_mass_ratio_interval",
+    "payload_mass",
+    "total_component_mass",
+    "total_mass",
+]
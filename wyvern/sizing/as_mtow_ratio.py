@@ -1,5 +1,7 @@
 from pandas import DataFrame
 
+from wyvern.sizing.regression import BootstrapInterval, bootstrap
+
 
 def aerostructural_mass_ratio(
     historical_configs: DataFrame, total_fixed_mass: float
@@ -22,3 +24,42 @@ def aerostructural_mass_ratio(
     aerostructural_mass = historical_configs["EW (g)"] - total_fixed_mass
     total_mass = historical_configs["Max Wt (g)"]
     return (aerostructural_mass / total_mass).mean()
+
+
+def aerostructural_mass_ratio_interval(
+    historical_configs: DataFrame,
+    total_fixed_mass: float,
+    confidence: float = 0.95,
+    n_resamples: int = 10000,
+    seed: int = None,
+) -> BootstrapInterval:
+    """Bootstrap confidence interval of `aerostructural_mass_ratio`.
+
+    Parameters
+    ----------
+    historical_configs : DataFrame
+        A DataFrame containing historical aircraft configurations.
+    total_fixed_mass : float
+        The total fixed mass of the aircraft.
+    confidence : float, optional
+        Confidence level of the interval, by default 0.95
+    n_resamples : int, optional
+        Number of bootstrap resamples, by default 10000
+    seed : int, optional
+        Seed of the resampling, by default None
+
+    Returns
+    -------
+    BootstrapInterval
+        The mean ratio as the estimate, and the interval bounds.
+    """
+    ratios = (historical_configs["EW (g)"] - total_fixed_mass) / historical_configs[
+        "Max Wt (g)"
+    ]
+    return bootstrap(
+        lambda r: r.mean(axis=-1),
+        ratios.to_numpy(dtype=float),
+        n_resamples=n_resamples,
+        confidence=confidence,
+        seed=seed,
+    )
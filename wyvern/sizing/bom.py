@@ -0,0 +1,223 @@
+"""
+Bill of materials search over component alternatives.
+
+Each propulsion slot holds a table of alternatives. Every combination is
+an index row into those tables, and compatibility, masses and propulsion
+figures are evaluated for all combinations at once.
+
+Option tables have one row per alternative, indexed by name, with
+`basic_mass` (g) and optionally `mga_pct` as in components.json, plus the
+columns of `SLOT_COLUMNS`:
+
+- motor: min_cells, max_cells, max_current (A), max_power (W),
+  max_prop_diameter (in)
+- propeller: diameter (in), static_thrust (N) at ref_power (W)
+- battery: cells, capacity (mAh), c_rating
+- esc: min_cells, max_cells, max_current (A)
+"""
+
+from dataclasses import dataclass, replace
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from wyvern.analysis.parameters import PayloadSizingParameters
+from wyvern.data.propellers import PropellerCurve
+from wyvern.performance.scoring import course_energy, flight_score
+from wyvern.sizing.aircraft_mass import total_component_mass
+
+SLOTS = ("motor", "propeller", "battery", "esc")
+
+SLOT_COLUMNS = {
+    "motor": (
+        "min_cells",
+        "max_cells",
+        "max_current",
+        "max_power",
+        "max_prop_diameter",
+    ),
+    "propeller": ("diameter", "static_thrust", "ref_power"),
+    "battery": ("cells", "capacity", "c_rating"),
+    "esc": ("min_cells", "max_cells", "max_current"),
+}
+
+# rows of components.json that the slots replace
+SLOT_COMPONENTS = {
+    "motor": "Motor",
+    "propeller": "Propeller",
+    "battery": "Battery",
+    "esc": "ESC",
+}
+
+CELL_VOLTAGE = 3.7  # V, nominal LiPo
+
+
+def propeller_options(
+    curves: list[PropellerCurve],
+    basic_mass: list[float],
+    diameter: list[float],
+    ref_power: float,
+    mga_pct: float = 2.5,
+) -> pd.DataFrame:
+    """
+    Propeller option table from measured thrust curves; the static thrust
+    is the first point of each curve, measured at `ref_power` (W).
+    """
+    return pd.DataFrame(
+        {
+            "basic_mass": basic_mass,
+            "mga_pct": mga_pct,
+            "diameter": diameter,
+            "static_thrust": [curve.T[0] for curve in curves],
+            "ref_power": ref_power,
+        },
+        index=[curve.name for curve in curves],
+    )
+
+
+@dataclass
+class BillOfMaterials:
+    """
+    options: {slot: option table} for each of `SLOTS`
+    fixed: components that are not swapped, as in components.json
+    """
+
+    options: dict[str, pd.DataFrame]
+    fixed: pd.DataFrame
+
+    def __post_init__(self):
+        for slot in SLOTS:
+            missing = set(SLOT_COLUMNS[slot] + ("basic_mass",)) - set(
+                self.options[slot].columns
+            )
+            if missing:
+                raise ValueError(f"{slot} options are missing columns {missing}.")
+
+    @classmethod
+    def from_components(
+        cls, components: pd.DataFrame, options: dict[str, pd.DataFrame]
+    ) -> "BillOfMaterials":
+        """
+        Swap the slots' rows of a components table for the options.
+        """
+        slot_rows = [SLOT_COMPONENTS[slot] for slot in SLOTS]
+        return cls(options, components.drop(index=slot_rows, errors="ignore"))
+
+    def _column(self, slot: str, name: str, idx: npt.NDArray) -> npt.NDArray:
+        return self.options[slot][name].to_numpy(dtype=float)[idx]
+
+    def _mass(self, slot: str, idx: npt.NDArray) -> npt.NDArray:
+        table = self.options[slot]
+        mga = table["mga_pct"] if "mga_pct" in table else 0.0
+        mass = (table["basic_mass"] * (1 + mga / 100)).to_numpy(dtype=float)
+        return mass[idx]
+
+    def combinations(self) -> "BOMCombinations":
+        """
+        Every compatible combination of the options.
+
+        Compatible means the battery's cell count suits the motor and ESC,
+        the ESC and battery can supply the motor's maximum current and the
+        motor can swing the propeller.
+        """
+        sizes = [len(self.options[slot]) for slot in SLOTS]
+        grids = np.meshgrid(*(np.arange(n) for n in sizes), indexing="ij")
+        idx = np.stack([g.ravel() for g in grids], axis=-1)
+        m, p, b, e = idx.T
+
+        col = self._column
+
+        cells = col("battery", "cells", b)
+        motor_current = col("motor", "max_current", m)
+        battery_current = (
+            col("battery", "capacity", b) / 1000 * col("battery", "c_rating", b)
+        )
+        compatible = (
+            (cells >= col("motor", "min_cells", m))
+            & (cells <= col("motor", "max_cells", m))
+            & (cells >= col("esc", "min_cells", e))
+            & (cells <= col("esc", "max_cells", e))
+            & (col("esc", "max_current", e) >= motor_current)
+            & (battery_current >= motor_current)
+            & (col("propeller", "diameter", p) <= col("motor", "max_prop_diameter", m))
+        )
+        idx = idx[compatible]
+        m, p, b, e = idx.T
+
+        voltage = col("battery", "cells", b) * CELL_VOLTAGE
+        power = np.minimum(
+            col("motor", "max_power", m), voltage * col("motor", "max_current", m)
+        )
+        # momentum theory: static thrust scales with power^(2/3)
+        static_thrust = col("propeller", "static_thrust", p) * (
+            power / col("propeller", "ref_power", p)
+        ) ** (2 / 3)
+        energy = voltage * col("battery", "capacity", b) / 1000 * 3600
+
+        component_mass = sum(self._mass(slot, i) for slot, i in zip(SLOTS, idx.T))
+
+        return BOMCombinations(
+            self,
+            idx,
+            total_component_mass(self.fixed) + component_mass,
+            static_thrust,
+            power,
+            energy,
+        )
+
+
+@dataclass
+class BOMCombinations:
+    """
+    indices: option index of each slot, shape (n_combinations, len(SLOTS))
+    total_fixed_mass: fixed components plus the chosen options (g)
+    static_thrust: static thrust (N)
+    power: available electrical power (W)
+    energy: battery energy (J)
+    """
+
+    bom: BillOfMaterials
+    indices: npt.NDArray[np.integer]
+    total_fixed_mass: npt.NDArray[np.floating]
+    static_thrust: npt.NDArray[np.floating]
+    power: npt.NDArray[np.floating]
+    energy: npt.NDArray[np.floating]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Option names and figures of every combination.
+        """
+        names = {
+            slot: self.bom.options[slot].index.to_numpy()[self.indices[:, k]]
+            for k, slot in enumerate(SLOTS)
+        }
+        return pd.DataFrame(
+            {
+                **names,
+                "total_fixed_mass": self.total_fixed_mass,
+                "static_thrust": self.static_thrust,
+                "power": self.power,
+                "energy": self.energy,
+            }
+        )
+
+    def flight_scores(
+        self, payload_config: tuple[int], params: PayloadSizingParameters
+    ) -> pd.DataFrame:
+        """
+        Flight score of every combination carrying `payload_config`, with
+        the combination's fixed mass in place of `params.total_fixed_mass`.
+        Combinations whose battery cannot supply the course energy score 0.
+        """
+        params_ = replace(params, total_fixed_mass=self.total_fixed_mass)
+        score = flight_score(payload_config, params_)
+        energy_required = course_energy(payload_config, params_)
+
+        df = self.to_frame()
+        df["energy_required"] = energy_required
+        df["flight_score"] = np.where(energy_required <= self.energy, score, 0.0)
+        return df
@@ -0,0 +1,175 @@
+"""
+Regressions on historical aircraft and their bootstrap confidence intervals.
+
+Fits work along the last axis and broadcast over any leading axes, so all
+bootstrap resamples are fitted in one array operation.
+"""
+
+from typing import Callable, NamedTuple
+from warnings import warn
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from wyvern.data.historical import HistoricalDataset
+
+
+class LinearFit(NamedTuple):
+    """
+    y = slope * x + intercept
+    """
+
+    slope: npt.NDArray[np.floating]
+    intercept: npt.NDArray[np.floating]
+    r_squared: npt.NDArray[np.floating]
+
+    def __call__(self, x: npt.ArrayLike) -> npt.NDArray[np.floating]:
+        return self.slope * np.asarray(x) + self.intercept
+
+
+class PowerLawFit(NamedTuple):
+    """
+    y = coefficient * x ** exponent, fitted in log space
+    """
+
+    coefficient: npt.NDArray[np.floating]
+    exponent: npt.NDArray[np.floating]
+    r_squared: npt.NDArray[np.floating]
+
+    def __call__(self, x: npt.ArrayLike) -> npt.NDArray[np.floating]:
+        return self.coefficient * np.asarray(x) ** self.exponent
+
+
+class BootstrapInterval(NamedTuple):
+    """
+    estimate: statistic of the original sample
+    lower, upper: percentile confidence interval
+    samples: statistic of every resample, shape (n_resamples, ...)
+    """
+
+    estimate: npt.NDArray[np.floating]
+    lower: npt.NDArray[np.floating]
+    upper: npt.NDArray[np.floating]
+    samples: npt.NDArray[np.floating]
+
+
+def linear_fit(x: npt.ArrayLike, y: npt.ArrayLike) -> LinearFit:
+    """
+    Least-squares line through (x, y) along the last axis. Degenerate
+    samples (all x equal) give NaN.
+    """
+    x, y = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(y, dtype=float))
+    x_mean = x.mean(axis=-1, keepdims=True)
+    y_mean = y.mean(axis=-1, keepdims=True)
+    dx, dy = x - x_mean, y - y_mean
+    sxx = np.sum(dx * dx, axis=-1)
+    sxy = np.sum(dx * dy, axis=-1)
+    syy = np.sum(dy * dy, axis=-1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        r_squared = sxy**2 / (sxx * syy)
+    intercept = y_mean[..., 0] - slope * x_mean[..., 0]
+    return LinearFit(slope, intercept, r_squared)
+
+
+def power_law_fit(x: npt.ArrayLike, y: npt.ArrayLike) -> PowerLawFit:
+    """
+    Power law through positive (x, y) along the last axis, a line in log
+    space.
+    """
+    fit = linear_fit(np.log(x), np.log(y))
+    return PowerLawFit(np.exp(fit.intercept), fit.slope, fit.r_squared)
+
+
+def bootstrap(
+    statistic: Callable[..., npt.NDArray[np.floating]],
+    *data: npt.ArrayLike,
+    n_resamples: int = 10000,
+    confidence: float = 0.95,
+    seed: int | np.random.Generator = None,
+) -> BootstrapInterval:
+    """
+    Percentile bootstrap interval of a statistic of paired samples.
+
+    statistic: vectorized along the last axis, e.g. `np.mean` with `axis=-1`
+        or `lambda x, y: power_law_fit(x, y).exponent`
+    data: samples of equal length n, resampled together (pairs stay paired)
+
+    All resamples are drawn as one (n_resamples, n) index array and the
+    statistic is evaluated once for all of them; resamples where it is NaN
+    (e.g. a degenerate fit) are ignored.
+    """
+    data = [np.asarray(d, dtype=float) for d in data]
+    n = data[0].shape[-1]
+    rng = np.random.default_rng(seed)
+    idx = rng.integers(0, n, size=(n_resamples, n))
+
+    estimate = np.asarray(statistic(*data))
+    samples = np.asarray(statistic(*(d[..., idx] for d in data)))
+
+    alpha = (1 - confidence) / 2
+    lower, upper = np.nanquantile(samples, [alpha, 1 - alpha], axis=0)
+    return BootstrapInterval(estimate, lower, upper, samples)
+
+
+def historical_trends(
+    dataset: HistoricalDataset,
+    total_fixed_mass: float,
+    against: str = "max_weight",
+    n_resamples: int = 10000,
+    confidence: float = 0.95,
+    seed: int | np.random.Generator = None,
+) -> pd.DataFrame:
+    """
+    Power laws of empty weight (g), wetted area ratio and aerostructural
+    mass ratio against maximum weight (g) or span (m), with bootstrap
+    intervals of their coefficients and exponents. Aircraft missing either
+    value, or with a value outside the power law's domain (not positive,
+    e.g. a negative mass ratio), are left out of that fit with a warning;
+    the `n` column gives the number of aircraft fitted.
+
+    against: "max_weight" or "span"
+    total_fixed_mass: fixed mass (g) for the aerostructural mass ratio
+    """
+    x = getattr(dataset, against)
+    responses = {
+        "empty_weight": dataset.empty_weight,
+        "wetted_area_ratio": dataset.wetted_area_ratio,
+        "as_mass_ratio": dataset.as_mass_ratio(total_fixed_mass),
+    }
+    rng = np.random.default_rng(seed)
+
+    rows = {}
+    for name, y in responses.items():
+        # rows missing either value, or outside the power law's domain
+        finite = np.isfinite(x) & np.isfinite(y)
+        valid = finite & (x > 0) & (y > 0)
+        if not valid.all():
+            warn(
+                f"{name} against {against}: left out {(~finite).sum()} aircraft "
+                f"missing values and {(finite & ~valid).sum()} with non-positive "
+                "values."
+            )
+        x_, y_ = x[valid], y[valid]
+        fit = power_law_fit(x_, y_)
+        interval = bootstrap(
+            lambda a, b: np.stack(power_law_fit(a, b)[:2], axis=-1),
+            x_,
+            y_,
+            n_resamples=n_resamples,
+            confidence=confidence,
+            seed=rng,
+        )
+        rows[name] = {
+            "coefficient": fit.coefficient,
+            "exponent": fit.exponent,
+            "r_squared": fit.r_squared,
+            "n": int(valid.sum()),
+            "coefficient_lower": interval.lower[0],
+            "coefficient_upper": interval.upper[0],
+            "exponent_lower": interval.lower[1],
+            "exponent_upper": interval.upper[1],
+        }
+    return pd.DataFrame(rows).T
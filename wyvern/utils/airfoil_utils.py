@@ -1,64 +1,39 @@
+from functools import lru_cache
 from io import StringIO
 
+import numpy as np
+import numpy.typing as npt
+
 
 def naca_4d_to_tikz(naca_4d: str, num_points: int = 100) -> str:
     """
-    Convert a NACA 4-digit airfoil to a .tikz file.
+    Convert a NACA 4- or 5-digit airfoil to a .tikz file.
 
     Args:
-        naca_4d: The NACA 4-digit airfoil.
-        num_points: The number of points to interpolate.
+        naca_4d: The NACA designation, e.g. "0018" or "23012".
+        num_points: The number of points per surface.
 
     Returns:
         The string of the .tikz file.
     """
-    m = int(naca_4d[0]) / 100
-    p = int(naca_4d[1]) / 10
-    t = int(naca_4d[2:]) / 100
-    c = 1
-    x = [c * i / (num_points - 1) for i in range(num_points)]
-
-    # densify points near the leading edge
-    for i in range(num_points):
-        x[i] = x[i] ** 2
-
-    y = [0] * num_points
-
-    for i in range(num_points):
-        if x[i] < p:
-            y[i] = m * x[i] / (p**2) * (2 * p - x[i])
-        else:
-            y[i] = m * (c - x[i]) / ((1 - p) ** 2) * (1 + x[i] - 2 * p)
-
-    y_t = [0] * num_points
-    y_b = [0] * num_points
-    for i in range(num_points):
-        y_t[i] = y[i] + t / 0.2 * c * (
-            0.2969 * x[i] ** 0.5
-            - 0.1260 * x[i]
-            - 0.3516 * x[i] ** 2
-            + 0.2843 * x[i] ** 3
-            - 0.1015 * x[i] ** 4
-        )
-        y_b[i] = y[i] - t / 0.2 * c * (
-            0.2969 * x[i] ** 0.5
-            - 0.1260 * x[i]
-            - 0.3516 * x[i] ** 2
-            + 0.2843 * x[i] ** 3
-            - 0.1015 * x[i] ** 4
-        )
+    return section_to_tikz(naca_airfoil(naca_4d, num_points))
+
+
+def section_to_tikz(section: npt.NDArray[np.floating]) -> str:
+    """
+    Convert section coordinates to a .tikz file.
+
+    Args:
+        section: Unit-chord section coordinates, shape (n, 2).
 
+    Returns:
+        The string of the .tikz file.
+    """
     buf = StringIO()
     buf.write(r"\begin{scope}[y=-1cm, x=1cm]")
     buf.write("\n")
     buf.write(r"\draw[thick] ")
-    for i in range(num_points):
-        if i != 0:
-            buf.write(" -- ")
-        buf.write(f"({x[i]},{y_t[i]})")
-    for i in range(num_points - 1, -1, -1):
-        buf.write(" -- ")
-        buf.write(f"({x[i]},{y_b[i]})")
+    buf.write(" -- ".join(f"({x:.5f},{y:.5f})" for x, y in section))
     buf.write(" -- cycle;")
     buf.write("\n")
     buf.write(r"\end{scope}")
@@ -94,3 +69,231 @@ def dat_to_tikz(dat_string: str) -> str:
     buf.write("\n")
     buf.write(r"\end{scope}")
     return buf.getvalue()
+
+
+def cosine_spacing(num_points: int) -> npt.NDArray[np.floating]:
+    """
+    Cosine-spaced chordwise stations between 0 and 1, clustered at the
+    leading and trailing edges.
+
+    Args:
+        num_points: The number of stations.
+
+    Returns:
+        Array of x/c stations, shape (num_points,).
+    """
+    return 0.5 * (1 - np.cos(np.linspace(0, np.pi, num_points)))
+
+
+def split_surfaces(
+    section: npt.NDArray[np.floating],
+) -> tuple[
+    npt.NDArray[np.floating],
+    npt.NDArray[np.floating],
+    npt.NDArray[np.floating],
+    npt.NDArray[np.floating],
+]:
+    """
+    Split a section in .dat (Selig) ordering into its top and bottom surfaces.
+
+    Both surfaces are returned running from the leading edge to the
+    trailing edge; the leading edge point is shared.
+
+    Args:
+        section: Section coordinates, shape (n, 2), running from the trailing
+            edge over the top surface and back along the bottom surface.
+
+    Returns:
+        x_top, y_top, x_bot, y_bot
+    """
+    x, y = section[:, 0], section[:, 1]
+
+    # find breakpoint for top and bottom of section
+    midpt = np.argmin(x)
+
+    return (
+        np.flip(x[: midpt + 1]),
+        np.flip(y[: midpt + 1]),
+        x[midpt:],
+        y[midpt:],
+    )
+
+
+def resample_airfoil(
+    section: npt.NDArray[np.floating], num_points: int = 101
+) -> tuple[
+    npt.NDArray[np.floating], npt.NDArray[np.floating], npt.NDArray[np.floating]
+]:
+    """
+    Resample a section onto a common cosine-spaced x/c grid.
+
+    Sections with different point counts (e.g. NACA0018 and BOEING_VERTOL)
+    share the same grid afterwards, so they can be stacked and blended.
+
+    Args:
+        section: Unit-chord section coordinates, shape (n, 2), .dat ordering.
+        num_points: The number of points per surface.
+
+    Returns:
+        x, y_top, y_bot; each of shape (num_points,).
+    """
+    x = cosine_spacing(num_points)
+    x_top, y_top, x_bot, y_bot = split_surfaces(section)
+
+    return x, np.interp(x, x_top, y_top), np.interp(x, x_bot, y_bot)
+
+
+def blend_sections(
+    y: npt.NDArray[np.floating],
+    section_y: npt.NDArray[np.floating],
+    sections: list[npt.NDArray[np.floating]],
+    num_points: int = 101,
+) -> tuple[
+    npt.NDArray[np.floating], npt.NDArray[np.floating], npt.NDArray[np.floating]
+]:
+    """
+    Linearly blend sections defined at spanwise positions onto arbitrary
+    spanwise stations.
+
+    Outside of `section_y` the end sections are held constant. Repeating a
+    position in `section_y` gives a step change between the two sections
+    (the outboard one is used at the shared position).
+
+    Args:
+        y: Spanwise stations to evaluate, shape (n_stations,).
+        section_y: Spanwise positions of the sections, ascending.
+        sections: Unit-chord section coordinates at each of `section_y`.
+        num_points: The number of points per surface.
+
+    Returns:
+        x, y_top, y_bot; x has shape (num_points,) and the surfaces have
+        shape (n_stations, num_points).
+    """
+    y = np.atleast_1d(np.asarray(y, dtype=float))
+    section_y = np.asarray(section_y, dtype=float)
+
+    resampled = [resample_airfoil(section, num_points) for section in sections]
+    x = resampled[0][0]
+    tops = np.stack([r[1] for r in resampled])
+    bots = np.stack([r[2] for r in resampled])
+
+    if len(sections) == 1:
+        return (
+            x,
+            np.broadcast_to(tops, (len(y), num_points)).copy(),
+            np.broadcast_to(bots, (len(y), num_points)).copy(),
+        )
+
+    # bracketing section pair and lerp weight for each station
+    idx = np.clip(np.searchsorted(section_y, y, side="right") - 1, 0, len(sections) - 2)
+    width = section_y[idx + 1] - section_y[idx]
+    w = np.divide(y - section_y[idx], width, out=np.ones_like(y), where=width > 0)
+    w = np.clip(w, 0, 1)[:, None]
+
+    y_top = (1 - w) * tops[idx] + w * tops[idx + 1]
+    y_bot = (1 - w) * bots[idx] + w * bots[idx + 1]
+
+    return x, y_top, y_bot
+
+
+# standard NACA 5-digit mean lines by max camber position P: (r, k1), and
+# (r, k1, k2/k1) for the reflexed ones; tabulated for a design cl of 0.3
+_NACA_5D_CAMBER = {
+    1: (0.0580, 361.4),
+    2: (0.1260, 51.64),
+    3: (0.2025, 15.957),
+    4: (0.2900, 6.643),
+    5: (0.3910, 3.230),
+}
+_NACA_5D_REFLEX_CAMBER = {
+    2: (0.1300, 51.99, 0.000764),
+    3: (0.2170, 15.793, 0.00677),
+    4: (0.3180, 6.520, 0.0303),
+    5: (0.4410, 3.191, 0.1355),
+}
+
+
+def _naca_camber(
+    digits: str, x: npt.NDArray[np.floating]
+) -> tuple[npt.NDArray[np.floating], npt.NDArray[np.floating]]:
+    """
+    Mean line and its slope of a NACA 4- or 5-digit designation.
+    """
+    if len(digits) == 4:
+        m = int(digits[0]) / 100
+        p = int(digits[1]) / 10
+        if m == 0:
+            return np.zeros_like(x), np.zeros_like(x)
+        if p == 0:
+            raise ValueError(f"NACA {digits} has camber but no camber position.")
+        fore = x < p
+        yc = np.where(
+            fore,
+            m / p**2 * (2 * p * x - x**2),
+            m / (1 - p) ** 2 * (1 - 2 * p + 2 * p * x - x**2),
+        )
+        dyc = np.where(fore, 2 * m / p**2 * (p - x), 2 * m / (1 - p) ** 2 * (p - x))
+        return yc, dyc
+
+    # design lift coefficient scales the tabulated mean lines
+    scale = 0.15 * int(digits[0]) / 0.3
+    position, reflex = int(digits[1]), int(digits[2])
+    table = _NACA_5D_REFLEX_CAMBER if reflex else _NACA_5D_CAMBER
+    if reflex > 1 or position not in table:
+        raise ValueError(f"No NACA 5-digit mean line for {digits}.")
+
+    if reflex:
+        r, k1, k21 = table[position]
+        fore = x < r
+        tail = k21 * (1 - r) ** 3 + r**3
+        yc = np.where(fore, (x - r) ** 3, k21 * (x - r) ** 3) - tail * x + r**3
+        dyc = np.where(fore, 3 * (x - r) ** 2, 3 * k21 * (x - r) ** 2) - tail
+    else:
+        r, k1 = table[position]
+        fore = x < r
+        yc = np.where(fore, x**3 - 3 * r * x**2 + r**2 * (3 - r) * x, r**3 * (1 - x))
+        dyc = np.where(fore, 3 * x**2 - 6 * r * x + r**2 * (3 - r), -(r**3))
+    return scale * k1 / 6 * yc, scale * k1 / 6 * dyc
+
+
+@lru_cache(maxsize=256)
+def naca_airfoil(
+    designation: str, num_points: int = 101, closed_te: bool = False
+) -> npt.NDArray[np.floating]:
+    """
+    Unit-chord coordinates of a NACA 4- or 5-digit airfoil.
+
+    Results are cached per arguments and returned read-only; copy them
+    before modifying.
+
+    Args:
+        designation: e.g. "0018", "NACA 2412" or "23012".
+        num_points: The number of cosine-spaced points per surface.
+        closed_te: Use the closed trailing edge thickness coefficient.
+
+    Returns:
+        Section coordinates, shape (2 * num_points - 1, 2), in .dat (Selig)
+        ordering; the leading edge point is shared by both surfaces.
+    """
+    digits = designation.upper().removeprefix("NACA").strip()
+    if len(digits) not in (4, 5) or not digits.isdigit():
+        raise ValueError(f"Not a NACA 4- or 5-digit designation: {designation!r}")
+
+    t = int(digits[-2:]) / 100
+    x = cosine_spacing(num_points)
+    a4 = -0.1036 if closed_te else -0.1015
+    y_t = (
+        5
+        * t
+        * (0.2969 * np.sqrt(x) - 0.1260 * x - 0.3516 * x**2 + 0.2843 * x**3 + a4 * x**4)
+    )
+    y_c, dy_c = _naca_camber(digits, x)
+
+    # thickness is laid off normal to the mean line
+    theta = np.arctan(dy_c)
+    top = np.stack([x - y_t * np.sin(theta), y_c + y_t * np.cos(theta)], axis=-1)
+    bot = np.stack([x + y_t * np.sin(theta), y_c - y_t * np.cos(theta)], axis=-1)
+
+    section = np.concatenate([top[::-1], bot[1:]])
+    section.flags.writeable = False
+    return section
@@ -0,0 +1,477 @@
+"""
+Incremental build of report figures and tables.
+
+Each artifact declares what it is computed from: keyword inputs passed to
+its render function, source files or directories it reads, and upstream
+artifacts. The artifact's key is a content hash of all of these, the render
+function's source and the keys of its upstream artifacts. A build only
+reruns artifacts whose key differs from the one recorded in the build
+directory's manifest, or whose outputs are missing, and renders independent
+artifacts in parallel processes.
+
+Render functions run in worker processes, so they (and table compute
+functions) must be module-level functions; scripts registering them should
+build under `if __name__ == "__main__":`.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import runpy
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from graphlib import TopologicalSorter
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+
+# LaTeX-friendly jinja2 delimiters, so braces stay LaTeX's
+TABLE_TEMPLATE = r"""\begin{table}[htbp]
+\centering
+\BLOCK{if caption}
+\caption{\VAR{caption}}
+\BLOCK{endif}
+\BLOCK{if label}
+\label{\VAR{label}}
+\BLOCK{endif}
+\begin{tabular}{\VAR{align}}
+\toprule
+\VAR{header | join(" & ")} \\
+\midrule
+\BLOCK{for row in rows}
+\VAR{row | join(" & ")} \\
+\BLOCK{endfor}
+\bottomrule
+\end{tabular}
+\end{table}
+"""
+
+
+@dataclass
+class Artifact:
+    """
+    name: unique name in the graph
+    outputs: files written, relative to the build directory
+    render: called as `render(*outputs, **inputs)` with absolute output paths
+    inputs: values the outputs are computed from, hashed by content; paths
+        to other artifacts' outputs are tracked through `depends`
+    sources: files or directories read by `render`, hashed by content
+    depends: names of upstream artifacts
+    """
+
+    name: str
+    outputs: tuple[Path, ...]
+    render: Callable[..., None]
+    inputs: dict[str, Any] = field(default_factory=dict)
+    sources: tuple[Path, ...] = ()
+    depends: tuple[str, ...] = ()
+
+
+@dataclass
+class BuildReport:
+    """
+    built: artifacts rendered by the build
+    skipped: artifacts that were up to date
+    failed: {artifact: error}; dependents of a failed artifact fail too
+    """
+
+    built: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+def _chunk(h: "hashlib._Hash", tag: bytes, data: bytes) -> None:
+    h.update(tag + len(data).to_bytes(8, "little") + data)
+
+
+def _update_path(h: "hashlib._Hash", path: Path) -> None:
+    path = Path(path)
+    if path.is_dir():
+        files = sorted(
+            p for p in path.rglob("*") if p.is_file() and "__pycache__" not in p.parts
+        )
+        _chunk(h, b"d", str(len(files)).encode())
+        for file in files:
+            _chunk(h, b"n", file.relative_to(path).as_posix().encode())
+            _update_path(h, file)
+    elif path.is_file():
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        _chunk(h, b"f", digest.digest())
+    else:
+        _chunk(h, b"m", str(path).encode())
+
+
+def _update(h: "hashlib._Hash", value: Any, built: Path = None) -> None:
+    """
+    Feed a content fingerprint of `value` to `h`. Paths inside the `built`
+    directory are outputs of other artifacts, tracked by their keys, and
+    only count by name.
+    """
+    if hasattr(value, "stable_hash"):
+        _chunk(h, b"p", value.stable_hash().encode())
+    elif isinstance(value, np.ndarray):
+        _chunk(h, b"a", f"{value.dtype.str}{value.shape}".encode())
+        _chunk(h, b"b", np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        labels = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+        _chunk(h, b"c", repr(list(labels)).encode())
+        _chunk(h, b"v", pd.util.hash_pandas_object(value).to_numpy().tobytes())
+    elif isinstance(value, Path):
+        if built is not None and value.resolve().is_relative_to(built):
+            _chunk(h, b"o", value.resolve().relative_to(built).as_posix().encode())
+        else:
+            _update_path(h, value)
+    elif isinstance(value, dict):
+        _chunk(h, b"{", str(len(value)).encode())
+        for key in sorted(value, key=repr):
+            _update(h, key, built)
+            _update(h, value[key], built)
+    elif isinstance(value, (list, tuple)):
+        _chunk(h, b"[", str(len(value)).encode())
+        for v in value:
+            _update(h, v, built)
+    elif isinstance(value, partial):
+        _update(h, value.func, built)
+        _update(h, value.args, built)
+        _update(h, value.keywords, built)
+    elif callable(value):
+        # code changes rebuild; builtins and the like fall back to their name
+        try:
+            _chunk(h, b"s", inspect.getsource(value).encode())
+        except (OSError, TypeError):
+            _chunk(h, b"q", f"{value.__module__}.{value.__qualname__}".encode())
+    else:
+        _chunk(h, b"r", repr(value).encode())
+
+
+def latex_table(
+    frame: pd.DataFrame,
+    caption: str = None,
+    label: str = None,
+    float_format: str = "{:.3g}",
+    index: bool = True,
+    template: str = TABLE_TEMPLATE,
+) -> str:
+    """
+    Render a DataFrame as a booktabs LaTeX table.
+
+    Cells and labels are inserted as-is, so they may contain LaTeX (e.g.
+    math); escape special characters beforehand where they are meant
+    literally.
+    """
+    import jinja2
+
+    env = jinja2.Environment(
+        block_start_string=r"\BLOCK{",
+        block_end_string="}",
+        variable_start_string=r"\VAR{",
+        variable_end_string="}",
+        comment_start_string=r"\#{",
+        comment_end_string="}",
+        trim_blocks=True,
+        autoescape=False,
+    )
+
+    def cell(value):
+        if isinstance(value, (float, np.floating)):
+            return float_format.format(value)
+        return str(value)
+
+    header = [cell(c) for c in frame.columns]
+    rows = [[cell(v) for v in row] for row in frame.itertuples(index=False)]
+    if index:
+        header = [cell(frame.index.name or "")] + header
+        rows = [[cell(i)] + row for i, row in zip(frame.index, rows)]
+
+    return env.from_string(template).render(
+        caption=caption,
+        label=label,
+        align="l" + "r" * (len(header) - 1),
+        header=header,
+        rows=rows,
+    )
+
+
+def _render_table(
+    compute: Callable[..., pd.DataFrame],
+    output: Path,
+    *,
+    table_options: dict[str, Any],
+    **inputs: Any,
+) -> None:
+    Path(output).write_text(latex_table(compute(**inputs), **table_options))
+
+
+def _run_script(script: Path, directory: Path, *outputs: Path) -> None:
+    """
+    Run a script with the build directory as working directory, where it
+    saves its outputs.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        runpy.run_path(str(script), run_name="__main__")
+    finally:
+        os.chdir(cwd)
+        plt.close("all")
+
+
+def _execute(artifact: Artifact, directory: Path) -> None:
+    outputs = [directory / output for output in artifact.outputs]
+    for output in outputs:
+        output.parent.mkdir(parents=True, exist_ok=True)
+    artifact.render(*outputs, **artifact.inputs)
+    missing = [str(o) for o in artifact.outputs if not (directory / o).exists()]
+    if missing:
+        raise RuntimeError(f"{artifact.name} did not write {missing}.")
+
+
+class _InlineExecutor:
+    """
+    Executor running each task on submission, for `jobs=1`.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args) -> Future:
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+
+class BuildGraph:
+    """
+    Registry of report artifacts built into `directory`.
+    """
+
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.artifacts: dict[str, Artifact] = {}
+
+    def add(self, artifact: Artifact) -> Artifact:
+        if artifact.name in self.artifacts:
+            raise ValueError(f"Artifact {artifact.name!r} is already registered.")
+        artifact.outputs = tuple(Path(o) for o in artifact.outputs)
+        artifact.sources = tuple(Path(s) for s in artifact.sources)
+        artifact.depends = tuple(artifact.depends)
+        self.artifacts[artifact.name] = artifact
+        return artifact
+
+    def figure(
+        self,
+        *outputs: str | Path,
+        sources: tuple = (),
+        depends: tuple = (),
+        **inputs: Any,
+    ) -> Callable:
+        """
+        Decorator registering `render(*outputs, **inputs)` under its name.
+        """
+
+        def register(render: Callable[..., None]) -> Callable[..., None]:
+            self.add(
+                Artifact(render.__name__, outputs, render, inputs, sources, depends)
+            )
+            return render
+
+        return register
+
+    def table(
+        self,
+        output: str | Path,
+        caption: str = None,
+        label: str = None,
+        float_format: str = "{:.3g}",
+        index: bool = True,
+        sources: tuple = (),
+        depends: tuple = (),
+        **inputs: Any,
+    ) -> Callable:
+        """
+        Decorator registering `compute(**inputs) -> DataFrame` under its name,
+        rendered to `output` as a LaTeX table (see `latex_table`).
+        """
+        table_options = {
+            "caption": caption,
+            "label": label,
+            "float_format": float_format,
+            "index": index,
+        }
+
+        def register(compute: Callable[..., pd.DataFrame]) -> Callable:
+            render = partial(_render_table, compute, table_options=table_options)
+            self.add(
+                Artifact(compute.__name__, (output,), render, inputs, sources, depends)
+            )
+            return compute
+
+        return register
+
+    def script(
+        self,
+        path: str | Path,
+        *outputs: str | Path,
+        sources: tuple = (),
+        depends: tuple = (),
+    ) -> Artifact:
+        """
+        Register a plotting script saving `outputs` to its working
+        directory. The script itself is a source.
+        """
+        path = Path(path).resolve()
+        render = partial(_run_script, path, self.directory.resolve())
+        return self.add(
+            Artifact(path.stem, outputs, render, {}, (path, *sources), depends)
+        )
+
+    def keys(self) -> dict[str, str]:
+        """
+        Content key of every artifact.
+        """
+        keys = {}
+        built = self.directory.resolve()
+        graph = {name: a.depends for name, a in self.artifacts.items()}
+        for name in TopologicalSorter(graph).static_order():
+            if name not in self.artifacts:
+                raise ValueError(f"Unknown upstream artifact {name!r}.")
+            artifact = self.artifacts[name]
+            h = hashlib.blake2b(digest_size=16)
+            _update(h, name)
+            _update(h, [str(o) for o in artifact.outputs])
+            _update(h, artifact.render, built)
+            _update(h, artifact.inputs, built)
+            _update(h, list(artifact.sources), built)
+            _update(h, [keys[d] for d in artifact.depends])
+            keys[name] = h.hexdigest()
+        return keys
+
+    def manifest(self) -> dict[str, dict]:
+        """
+        Artifacts recorded by the last build, {name: {"key", "outputs", "built"}}.
+        """
+        try:
+            return json.loads((self.directory / MANIFEST).read_text())["artifacts"]
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _write_manifest(self, entries: dict[str, dict]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / MANIFEST
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"artifacts": entries}, indent=2, sort_keys=True))
+        os.replace(tmp, path)
+
+    def stale(self, keys: dict[str, str] = None) -> list[str]:
+        """
+        Artifacts whose key changed since the last build or whose outputs
+        are missing.
+        """
+        keys = self.keys() if keys is None else keys
+        manifest = self.manifest()
+        return [
+            name
+            for name, artifact in self.artifacts.items()
+            if manifest.get(name, {}).get("key") != keys[name]
+            or not all((self.directory / o).exists() for o in artifact.outputs)
+        ]
+
+    def build(self, jobs: int = None, force: bool = False) -> BuildReport:
+        """
+        Render the stale artifacts (all of them if `force`), upstream first,
+        in up to `jobs` processes (default: one per CPU; 1 renders in this
+        process). The manifest is updated as each artifact finishes.
+        """
+        keys = self.keys()
+        stale = set(self.artifacts if force else self.stale(keys))
+        # drop artifacts no longer registered
+        manifest = {n: e for n, e in self.manifest().items() if n in self.artifacts}
+        report = BuildReport()
+        directory = self.directory.resolve()
+
+        sorter = TopologicalSorter({n: a.depends for n, a in self.artifacts.items()})
+        sorter.prepare()
+        executor = (
+            _InlineExecutor() if jobs == 1 else ProcessPoolExecutor(max_workers=jobs)
+        )
+        with executor:
+            running: dict[Future, str] = {}
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    artifact = self.artifacts[name]
+                    failed_upstream = [
+                        d for d in artifact.depends if d in report.failed
+                    ]
+                    if failed_upstream:
+                        report.failed[name] = f"upstream {failed_upstream} failed"
+                        sorter.done(name)
+                    elif name not in stale:
+                        report.skipped.append(name)
+                        sorter.done(name)
+                    else:
+                        running[executor.submit(_execute, artifact, directory)] = name
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        report.failed[name] = f"{type(error).__name__}: {error}"
+                    else:
+                        report.built.append(name)
+                        manifest[name] = {
+                            "key": keys[name],
+                            "outputs": [str(o) for o in self.artifacts[name].outputs],
+                            "built": datetime.now(timezone.utc).isoformat(),
+                        }
+                        self._write_manifest(manifest)
+                    sorter.done(name)
+        return report
+
+
+def main(graph: BuildGraph, argv: list[str] = None) -> BuildReport:
+    """
+    Command line entry for build scripts: `[-j JOBS] [--force] [--dry-run]`.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description=f"Build {graph.directory}.")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--force", action="store_true")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.dry_run:
+        for name in graph.stale():
+            print(name)
+        return BuildReport()
+
+    report = graph.build(jobs=args.jobs, force=args.force)
+    print(f"built {len(report.built)}, up to date {len(report.skipped)}")
+    for name, error in report.failed.items():
+        print(f"FAILED {name}: {error}", file=sys.stderr)
+    return report
@@ -1,3 +1,11 @@
 RHO = 1.225
 G = 9.80665
 MU = 1.7894e-5  # kg/m/s
+
+# balsa
+BALSA_E = 2.55e9  # Pa
+BALSA_G = 140e6  # Pa; longitudinal shear modulus
+BALSA_DENSITY = 160  # kg/m^3
+BALSA_RUPTURE_STRENGTH = 19e6  # Pa
+BALSA_SHEAR_STRENGTH = 1.10e6  # Pa
+BALSA_CRUSHING_STRENGTH = 1e6  # Pa
@@ -1,42 +1,126 @@
+from typing import NamedTuple
+
 import numpy as np
 import numpy.typing as npt
 
 
-def centroid_of_polyshape(points: npt.NDArray[np.floating]):
+class PolygonProperties(NamedTuple):
     """
-    Returns the centroid of a set of points defining a polygonal shape.
-    array shape: (n, 2)
+    Section properties of polygons, each of the batch shape.
+
+    area: signed area, positive for counter-clockwise vertices
+    cx, cy: centroid
+    Ixx, Iyy, Ixy: second moments of area about the centroid,
+        i.e. int y^2 dA, int x^2 dA and int xy dA; independent of the
+        vertex order
     """
 
-    # https://stackoverflow.com/a/2792459/3628998
-    # https://stackoverflow.com/questions/2792443/finding-the-centroid-of-a-polygon
+    area: npt.NDArray[np.floating]
+    cx: npt.NDArray[np.floating]
+    cy: npt.NDArray[np.floating]
+    Ixx: npt.NDArray[np.floating]
+    Iyy: npt.NDArray[np.floating]
+    Ixy: npt.NDArray[np.floating]
 
-    x, y = points.T
-    area = 0.5 * np.sum(x * np.roll(y, 1) - y * np.roll(x, 1))
-    cx = (1 / (6 * area)) * np.sum(
-        (x + np.roll(x, 1)) * (x * np.roll(y, 1) - y * np.roll(x, 1))
+
+def _edge_terms(x0, y0, x1, y1) -> npt.NDArray[np.floating]:
+    """
+    Green's theorem terms of each edge (x0, y0) -> (x1, y1), stacked on the
+    last axis: 2A, 6A cx, 6A cy, 12 Ixx, 12 Iyy, 24 Ixy (about the origin).
+    """
+    cross = x0 * y1 - x1 * y0
+    return np.stack(
+        [
+            cross,
+            (x0 + x1) * cross,
+            (y0 + y1) * cross,
+            (y0**2 + y0 * y1 + y1**2) * cross,
+            (x0**2 + x0 * x1 + x1**2) * cross,
+            (x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0) * cross,
+        ],
+        axis=-1,
     )
-    cy = (1 / (6 * area)) * np.sum(
-        (y + np.roll(y, 1)) * (x * np.roll(y, 1) - y * np.roll(x, 1))
+
+
+def _properties_from_sums(sums, origin) -> PolygonProperties:
+    area = sums[..., 0] / 2
+    cx = sums[..., 1] / (6 * area)
+    cy = sums[..., 2] / (6 * area)
+
+    # parallel axis theorem, to the centroid; sign of the orientation removed
+    sign = np.sign(area)
+    Ixx = sign * (sums[..., 3] / 12 - area * cy**2)
+    Iyy = sign * (sums[..., 4] / 12 - area * cx**2)
+    Ixy = sign * (sums[..., 5] / 24 - area * cx * cy)
+
+    return PolygonProperties(
+        area, cx + origin[..., 0], cy + origin[..., 1], Ixx, Iyy, Ixy
     )
 
-    return cx, cy
 
+def polygon_properties(points: npt.NDArray[np.floating]) -> PolygonProperties:
+    """
+    Area, centroid and second moments of area of polygons, in one pass.
 
-def area_of_points(points: npt.NDArray[np.floating]):
+    points: vertices, shape (..., n, 2); the polygons close themselves.
+    Every output has the batch shape (...).
     """
-    Returns the area of a set of points defining a polygonal shape.
-    array shape: (n, 2)
+    points = np.asarray(points, dtype=float)
+    # relative to the first vertex, for accuracy far from the origin
+    origin = points[..., 0, :]
+    x = points[..., 0] - origin[..., None, 0]
+    y = points[..., 1] - origin[..., None, 1]
+    x1 = np.roll(x, -1, axis=-1)
+    y1 = np.roll(y, -1, axis=-1)
+
+    sums = _edge_terms(x, y, x1, y1).sum(axis=-2)
+    return _properties_from_sums(sums, origin)
+
+
+def polygon_properties_ragged(
+    points: npt.NDArray[np.floating], offsets: npt.NDArray[np.integer]
+) -> PolygonProperties:
+    """
+    `polygon_properties` of polygons with different vertex counts.
 
-    Polygon can be concave, so use a triangulation method.
+    points: all vertices, shape (m, 2)
+    offsets: start of each polygon in `points` and the end of the last one,
+        shape (n_polygons + 1,); every polygon needs at least one vertex
     """
+    points = np.asarray(points, dtype=float)
+    offsets = np.asarray(offsets)
+    starts, counts = offsets[:-1], np.diff(offsets)
 
-    # https://stackoverflow.com/a/30408825/3628998
-    # https://stackoverflow.com/questions/30405648/computing-area-of-irregular-polygon-in-python
+    origin = points[starts]
+    rel = points - np.repeat(origin, counts, axis=0)
 
-    x, y = points.T
+    # next vertex, wrapping around within each polygon
+    nxt = np.arange(1, len(points) + 1)
+    nxt[offsets[1:] - 1] = starts
 
-    return 0.5 * np.abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))
+    terms = _edge_terms(rel[:, 0], rel[:, 1], rel[nxt, 0], rel[nxt, 1])
+    sums = np.add.reduceat(terms, starts, axis=0)
+    return _properties_from_sums(sums, origin)
+
+
+def centroid_of_polyshape(points: npt.NDArray[np.floating]):
+    """
+    Returns the centroid of a set of points defining a polygonal shape.
+    array shape: (n, 2)
+    """
+    props = polygon_properties(points)
+
+    return float(props.cx), float(props.cy)
+
+
+def area_of_points(points: npt.NDArray[np.floating]):
+    """
+    Returns the area of a set of points defining a polygonal shape.
+    array shape: (n, 2)
+
+    Polygon can be concave; the shoelace formula holds for any simple polygon.
+    """
+    return float(np.abs(polygon_properties(points).area))
 
 
 def sweep_angle_along_chord(
@@ -79,6 +163,23 @@ def sweep_angle_along_chord(
     )
 
 
+def refine_stations(y_stations: npt.NDArray, n: int) -> npt.NDArray:
+    """
+    About `n` intervals between the extreme stations, with every station on
+    an interval edge; each segment is split into a number of intervals
+    proportional to its length.
+    """
+    y_stations = np.unique(y_stations)
+    lengths = np.diff(y_stations)
+    counts = np.maximum(1, np.round(n * lengths / lengths.sum()).astype(int))
+
+    edges = [
+        np.linspace(y0, y1, k + 1)[:-1]
+        for y0, y1, k in zip(y_stations[:-1], y_stations[1:], counts)
+    ]
+    return np.concatenate(edges + [y_stations[-1:]])
+
+
 def mirror_verts(
     verts: npt.NDArray, axis: int = 0, negate: bool = True, skip_first: bool = True
 ) -> npt.NDArray: